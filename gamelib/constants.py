@@ -13,3 +13,28 @@ class SSConstants(GameConstants):
     title = _('Suspended Sentence')
     icon = 'suspended_sentence24x24.png'
     short_name = 'suspended-sentence'
+
+    # Only redraw and update the parts of the screen that change between
+    # frames when nothing but animations are happening.
+    dirty_rects = True
+
+    # Wait for input, rather than drawing frames, when nothing on the
+    # screen can change without it.
+    wait_when_idle = True
+
+    # Keep the decoded pixels of images on disk, so they don't have to be
+    # decoded again the next time the game is run.
+    pixel_cache = True
+
+    # Memory (in bytes) for the images of the scenes the player can go to
+    # next, which are loaded in the background.
+    prefetch_budget = 32 * 1024 * 1024
+
+    # Memory (in bytes) for the images and pre-drawn screens of the scenes
+    # the player has left. Those of the scenes left longest ago are freed
+    # beyond this, and loaded again when the player goes back.
+    surface_budget = 16 * 1024 * 1024
+
+    # The number of processes to decode the images in when the game starts
+    # (None for one per CPU).
+    decode_processes = None
@@ -20,6 +20,9 @@ class EndScreen(Screen):
         widget.add_callback('clicked', callback)
         self.container.add(widget)
 
+    def is_idle(self):
+        return True
+
     def draw_background(self):
         self.surface.blit(self._background, self.surface.get_rect())
 
@@ -1,10 +1,25 @@
+import os
+import sys
+
+import pygame
+from pygame.locals import FULLSCREEN, SWSURFACE
+
 from . import scenes
 
 from .constants import SSConstants
 from .menu import SSMenuScreen
 from .endscreen import EndScreen
-from .ss_state import SSState
+from .ss_engine import SSEngine
+from .ss_gamescreen import SSGameScreen
+from .ss_manifest import find_images, load_manifest
+from .ss_pixel_cache import PixelCache
+from .ss_prefetch import Prefetcher
+from .ss_resources import SSResources
+from .ss_sound import SSSound
+from .ss_surfaces import SurfaceBudget
+from .ss_state import SSState, build_dispatch_tables
 
+from pyntnclick.i18n import _
 from pyntnclick.main import GameDescription
 
 
@@ -18,12 +33,111 @@ class SuspendedSentence(GameDescription):
             }
     START_SCREEN = 'menu'
 
+    def __init__(self):
+        super(SuspendedSentence, self).__init__()
+        self.resource = SSResources(self._resource_module,
+                                    self.resource.lang_dialect)
+        self.sound = SSSound(self.resource)
+        self.prefetcher = Prefetcher(self, self.constants.prefetch_budget)
+        self._manifest = None
+        self.surface_budget = SurfaceBudget(self.constants.surface_budget)
+        self._screens['game'] = SSGameScreen
+
+    def initial_state(self, game_state=None):
+        state = super(SuspendedSentence, self).initial_state(game_state)
+        # The scene modules have been loaded by now
+        for modname in self._scene_list:
+            build_dispatch_tables(
+                sys.modules['%s.%s' % (self.SCENE_MODULE, modname)])
+        return state
+
+    def get_manifest(self):
+        """The manifest of the assets each scene uses"""
+        if self._manifest is None:
+            self._manifest = load_manifest(self)
+        return self._manifest
+
     def game_state_class(self):
         return SSState
 
     def game_constants(self):
         return SSConstants()
 
+    def option_parser(self):
+        parser = super(SuspendedSentence, self).option_parser()
+        parser.add_option(
+            "--fullscreen", action="store_true", default=False,
+            dest="fullscreen", help="run in full screen mode")
+        return parser
+
+    def display_flags(self, fullscreen):
+        if not fullscreen:
+            return SWSURFACE
+        # Let SDL scale the screen to the size of the display when it
+        # presents it, rather than scaling the frame ourselves. Mouse
+        # positions are scaled back to the size of the screen.
+        # Without it (pygame 1.x), the display switches to our resolution.
+        return FULLSCREEN | getattr(pygame, 'SCALED', SWSURFACE)
+
+    def get_default_cache_location(self):
+        """Return the location of the caches we can rebuild."""
+        app = self.constants.short_name
+        if sys.platform.startswith("win"):
+            if "LOCALAPPDATA" in os.environ:
+                return os.path.join(os.environ["LOCALAPPDATA"], app, "cache")
+            return os.path.join(os.path.expanduser("~"), "." + app, "cache")
+        elif 'XDG_CACHE_HOME' in os.environ:
+            return os.path.join(os.environ["XDG_CACHE_HOME"], app)
+        return os.path.join(os.path.expanduser("~"), ".cache", app)
+
+    def main(self):
+        parser = self.option_parser()
+        opts, args = parser.parse_args(sys.argv)
+        if self.constants.debug and (opts.list_scenes or opts.rect_drawer):
+            # The debugging tools are run by pyntnclick's own engine
+            return super(SuspendedSentence, self).main()
+        if not self.constants.debug:
+            for option in self.debug_options:
+                if option in sys.argv:
+                    self.warn_debug(option)
+        pygame.display.init()
+        pygame.font.init()
+        if opts.sound:
+            self.sound.enable_sound(self.constants)
+        else:
+            self.sound.disable_sound()
+        if self.constants.debug:
+            if opts.scene is not None:
+                # debug the specified scene
+                self._initial_scene = opts.scene
+            self._debug_rects = opts.rects
+        pygame.display.set_mode(
+            self.constants.screen, self.display_flags(opts.fullscreen))
+        if self.constants.pixel_cache:
+            # Needs to know the display's pixel format
+            self.resource.set_pixel_cache(PixelCache(os.path.join(
+                self.get_default_cache_location(), 'pixels')))
+        self.resource.preload_images(find_images(self, self.get_manifest()),
+                                     self.constants.decode_processes)
+        if self.constants.icon:
+            pygame.display.set_icon(self.resource.get_image(
+                self.constants.icon, basedir='icons'))
+        if self.constants.title:
+            title = _(self.constants.title)
+            if sys.version_info.major == 2:
+                title = title.encode('utf-8')
+            pygame.display.set_caption(title)
+
+        self.engine = SSEngine(self)
+        for name, cls in self._screens.items():
+            screen = cls(self)
+            self.engine.add_screen(name, screen)
+        self.engine.set_screen(self.START_SCREEN)
+        try:
+            self.engine.run()
+        except KeyboardInterrupt:
+            pass
+
 
 def main():
     ss = SuspendedSentence()
@@ -8,6 +8,9 @@ from pyntnclick.menuscreen import MenuScreen
 class SSMenuScreen(MenuScreen):
     BACKGROUND_IMAGE = 'splash/splash.png'
 
+    def is_idle(self):
+        return True
+
     def make_new_game_button(self):
         return self.make_image_button((16, 523), 'splash/play.png')
 
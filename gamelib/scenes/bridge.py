@@ -8,16 +8,19 @@ from pyntnclick.i18n import _
 from pyntnclick.utils import (render_text, lookup_debug_color,
                               make_reversible_list)
 from pyntnclick.cursor import CursorSprite
-from pyntnclick.state import Scene, Item, Thing, Result
+from pyntnclick.state import Result
 from pyntnclick.scenewidgets import (
-    InteractNoImage, InteractRectUnion, InteractImage, InteractAnimated,
-    GenericDescThing, TakeableThing, InteractText)
+    InteractNoImage, InteractRectUnion, InteractText)
 
+from gamelib.ss_state import SSItem, SSScene, SSThing
+from gamelib.ss_scenewidgets import (
+    SSGenericDescThing, SSInteractAnimated, SSInteractImage, SSTakeableThing)
 from gamelib.scenes.game_constants import PLAYER_ID
-from gamelib.scenes.game_widgets import Door, BaseCamera, make_jim_dialog
+from gamelib.scenes.game_widgets import (
+    Door, BaseCamera, make_jim_dialog, update_cameras)
 
 
-class Bridge(Scene):
+class Bridge(SSScene):
 
     FOLDER = "bridge"
     BACKGROUND = 'bridge.png'
@@ -55,18 +58,18 @@ class Bridge(Scene):
         self.add_thing(RightLights())
         self.add_thing(JimPanel())
         self.add_thing(StarField())
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             'bridge.wires', 1,
             _("The brightly coloured wires contrast with the drab walls."),
             ((46, 4, 711, 143),)))
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             'bridge.note', 2,
             _("\"Dammit JIM, I'm a doctor, not an engineer!\""),
             (
                 (491, 494, 194, 105),
                 (422, 533, 71, 66),
             )))
-        self.doctor = GenericDescThing(
+        self.doctor = SSGenericDescThing(
             'bridge.skel', 3,
             _("A skeleton hangs improbably from the wires."),
             (
@@ -98,7 +101,7 @@ class ToMap(Door):
     INITIAL = "door"
 
 
-class BridgeComputer(Thing):
+class BridgeComputer(SSThing):
     """The bridge computer. Gives status updates"""
 
     NAME = "bridge.comp"
@@ -122,7 +125,7 @@ class BridgeComputer(Thing):
         return _("The main bridge computer screen.")
 
 
-class MassageChairBase(Thing):
+class MassageChairBase(SSThing):
     "The captain's massage chair, contains superconductor"
 
     NAME = 'bridge.massagechair_base'
@@ -147,7 +150,7 @@ class MassageChairBase(Thing):
         return _("The chair won't work any more, it has no power.")
 
 
-class MassageChair(Thing):
+class MassageChair(SSThing):
     "The captain's massage chair, contains superconductor"
 
     NAME = 'bridge.massagechair'
@@ -174,7 +177,7 @@ class MassageChair(Thing):
         return False
 
 
-class Stethoscope(Item):
+class Stethoscope(SSItem):
     "Used for cracking safes. Found on the doctor on the chair"
 
     NAME = 'stethoscope'
@@ -182,13 +185,13 @@ class Stethoscope(Item):
     CURSOR = CursorSprite('stethoscope.png')
 
 
-class StethoscopeThing(TakeableThing):
+class StethoscopeThing(SSTakeableThing):
     "Stethoscope on the doctor"
 
     NAME = 'bridge.stethoscope'
 
     INTERACTS = {
-        'stethoscope': InteractImage(650, 178, 'hanging_stethoscope.png'),
+        'stethoscope': SSInteractImage(650, 178, 'hanging_stethoscope.png'),
     }
 
     INITIAL = 'stethoscope'
@@ -201,11 +204,12 @@ class StethoscopeThing(TakeableThing):
         self.take()
         # Fill in the doctor's rect
         self.scene.doctor.rect.append(self.rect)
+        self.scene.thing_changed(self.scene.doctor)
         return Result(_("You pick up the stethoscope and verify that the"
                         " doctor's heart has stopped. Probably a while ago."))
 
 
-class TapedSuperconductor(Item):
+class TapedSuperconductor(SSItem):
     "Used for connecting high-powered parts of the ship up"
 
     NAME = 'taped_superconductor'
@@ -213,7 +217,7 @@ class TapedSuperconductor(Item):
     CURSOR = CursorSprite('superconductor_taped_cursor.png')
 
 
-class Superconductor(Item):
+class Superconductor(SSItem):
     "Used for connecting high-powered parts of the ship up"
 
     NAME = 'superconductor'
@@ -227,13 +231,13 @@ class Superconductor(Item):
                         " successfully avoid disaster."))
 
 
-class SuperconductorThing(TakeableThing):
+class SuperconductorThing(SSTakeableThing):
     "Superconductor from the massage chair."
 
     NAME = 'bridge.superconductor'
 
     INTERACTS = {
-        'superconductor': InteractImage(158, 138, 'superconductor.png'),
+        'superconductor': SSInteractImage(158, 138, 'superconductor.png'),
     }
 
     INITIAL = 'superconductor'
@@ -251,17 +255,17 @@ class SuperconductorThing(TakeableThing):
                     % PLAYER_ID, self.game))
 
 
-class StarField(Thing):
+class StarField(SSThing):
 
     NAME = 'bridge.stars'
 
     INTERACTS = {
-        'stars': InteractAnimated(190, 145,
-                                  make_reversible_list(
-                                      ['stars_%d.png' % (i + 1) for i
-                                       in range(3)]
-                                  ),
-                                  30),
+        'stars': SSInteractAnimated(190, 145,
+                                    make_reversible_list(
+                                        ['stars_%d.png' % (i + 1) for i
+                                         in range(3)]
+                                    ),
+                                    30),
     }
 
     INITIAL = 'stars'
@@ -270,7 +274,7 @@ class StarField(Thing):
         return False
 
 
-class BlinkingLights(Thing):
+class BlinkingLights(SSThing):
 
     def setup(self):
         self.description = None
@@ -296,11 +300,11 @@ class LeftLights(BlinkingLights):
     NAME = 'bridge.lights.1'
 
     INTERACTS = {
-        "lights": InteractAnimated(176, 337,
-                                   ["bridge_lights_1_1.png",
-                                    "bridge_lights_1_2.png",
-                                    "bridge_lights_1_3.png",
-                                    "bridge_lights_1_2.png"], 5),
+        "lights": SSInteractAnimated(176, 337,
+                                     ["bridge_lights_1_1.png",
+                                      "bridge_lights_1_2.png",
+                                      "bridge_lights_1_3.png",
+                                      "bridge_lights_1_2.png"], 5),
     }
 
     INITIAL = 'lights'
@@ -311,25 +315,25 @@ class RightLights(BlinkingLights):
     NAME = 'bridge.lights.2'
 
     INTERACTS = {
-        "lights": InteractAnimated(559, 332,
-                                   ["bridge_lights_2_1.png",
-                                    "bridge_lights_2_2.png",
-                                    "bridge_lights_2_3.png",
-                                    "bridge_lights_2_2.png"], 5),
+        "lights": SSInteractAnimated(559, 332,
+                                     ["bridge_lights_2_1.png",
+                                      "bridge_lights_2_2.png",
+                                      "bridge_lights_2_3.png",
+                                      "bridge_lights_2_2.png"], 5),
     }
 
     INITIAL = 'lights'
 
 
-class JimPanel(Thing):
+class JimPanel(SSThing):
     "The panel to JIM's internals'"
 
     NAME = "jim_panel"
 
     INTERACTS = {
             'closed': InteractNoImage(506, 430, 137, 47),
-            'open': InteractImage(500, 427, 'jim_panel_open.png'),
-            'broken': InteractImage(488, 412, 'jim_panel_destroyed.png'),
+            'open': SSInteractImage(500, 427, 'jim_panel_open.png'),
+            'broken': SSInteractImage(488, 412, 'jim_panel_destroyed.png'),
             }
 
     INITIAL = 'closed'
@@ -352,6 +356,7 @@ class JimPanel(Thing):
         elif self.scene.get_data('ai panel') == 'open':
             self.scene.set_data('ai panel', 'broken')
             self.state.break_ai()
+            update_cameras(self.game)
             self.set_interact()
             return Result(_("You unplug various important-looking wires."))
 
@@ -366,6 +371,7 @@ class JimPanel(Thing):
         elif self.scene.get_data('ai panel') == 'open':
             self.scene.set_data('ai panel', 'broken')
             self.state.break_ai()
+            update_cameras(self.game)
             self.set_interact()
             return Result(_("You smash various delicate components with"
                             " the machete."))
@@ -378,7 +384,7 @@ class JimPanel(Thing):
                                       " technician.") % PLAYER_ID, self.game))
 
 
-class ChairDetail(Scene):
+class ChairDetail(SSScene):
 
     FOLDER = 'bridge'
     BACKGROUND = 'chair_detail.png'
@@ -391,7 +397,7 @@ class ChairDetail(Scene):
 # classes related the computer detail
 
 
-class LogTab(Thing):
+class LogTab(SSThing):
     """Tab for log screen"""
 
     NAME = 'bridge_comp.screen'
@@ -413,7 +419,7 @@ class LogTab(Thing):
         return Result(soundfile='beep550.ogg')
 
 
-class AlertTab(Thing):
+class AlertTab(SSThing):
     """Tab for alert screen"""
 
     NAME = 'bridge_comp.alert_tab'
@@ -436,7 +442,7 @@ class AlertTab(Thing):
         return Result(soundfile='beep550.ogg')
 
 
-class NavTab(Thing):
+class NavTab(SSThing):
     """Tab for the Navigation screen"""
 
     NAME = 'bridge_comp.nav_tab'
@@ -458,7 +464,7 @@ class NavTab(Thing):
         return Result(soundfile='beep550.ogg')
 
 
-class DestNavPageLine(Thing):
+class DestNavPageLine(SSThing):
     """The destination navigation lines."""
 
     INITIAL = 'line'
@@ -497,7 +503,7 @@ class DestNavPageLine(Thing):
                           soundfile="beep550.ogg", end_game=True)
 
 
-class CompUpButton(Thing):
+class CompUpButton(SSThing):
     """Up button on log screen"""
 
     NAME = 'bridge_comp.up_button'
@@ -520,7 +526,7 @@ class CompUpButton(Thing):
         return Result(soundfile='beep550.ogg')
 
 
-class CompDownButton(Thing):
+class CompDownButton(SSThing):
     """Down button on log screen"""
 
     NAME = 'bridge_comp.down_button'
@@ -550,15 +556,15 @@ class MonitorCamera(BaseCamera):
     NAME = "bridge.camera"
 
     INTERACTS = {
-        'online': InteractImage(33, 192, 'camera_small.png'),
-        'dead': InteractImage(33, 192, 'camera_small_gray.png'),
-        'looping': InteractAnimated(33, 192, ('camera_small.png',
-                                              'camera_small_gray.png'),
-                                    15),
+        'online': SSInteractImage(33, 192, 'camera_small.png'),
+        'dead': SSInteractImage(33, 192, 'camera_small_gray.png'),
+        'looping': SSInteractAnimated(33, 192, ('camera_small.png',
+                                                'camera_small_gray.png'),
+                                      15),
     }
 
 
-class BridgeCompDetail(Scene):
+class BridgeCompDetail(SSScene):
 
     FOLDER = 'bridge'
     NAME = 'bridge_comp_detail'
@@ -612,14 +618,19 @@ class BridgeCompDetail(Scene):
         #  self.add_thing(CompUpButton())
         #  self.add_thing(CompDownButton())
         self._scene_playlist = None
-        self._alert = self.get_image(self.FOLDER, self.ALERT_BASE)
+        # Maps tab -> (state the screen was composed for, screen)
+        self._screens = {}
+        # The images the screens are composed from, loaded when they're
+        # needed
+        self._alert = None
+        self._nav_background = None
+        self._logs = None
         self._alert_messages = {}
         self._nav_messages = {}
         for key, text in self.ALERTS.items():
             self._alert_messages[key] = render_text(
                 text, 'DejaVuSans-Bold.ttf', 18, 'orange', (0, 0, 0, 0),
                 self.resource, (600, 25), False)
-        self._nav_background = self.get_image(self.FOLDER, self.NAVIGATION)
         #  See note above about funny navigation logs
         #  for key, name in self.NAVIGATION.items():
         #      self._nav_messages[key] = self.get_image(self.FOLDER, name)
@@ -640,15 +651,6 @@ class BridgeCompDetail(Scene):
         self._nav_lines.append(DestNavPageLine(
             5, (12, 239, 610, 25), True,
             _("5. Opioid Space Port, Gelatinosa Prime (1963 days)")))
-        self._log_background = self.get_image(self.FOLDER, self.LOG_BACKGROUND)
-        self._logs = []
-        for text in self.LOGS:
-            log_page = self._log_background.copy()
-            log_page.blit(render_text(
-                text, 'DejaVuSans-Bold.ttf', 18,
-                'lightgreen', (0, 0, 0, 0), self.resource, (600, 25), False),
-                self.ALERT_OFFSET)
-            self._logs.append(log_page)
 
     def enter(self):
         self._scene_playlist = self.sound.get_current_playlist()
@@ -659,26 +661,74 @@ class BridgeCompDetail(Scene):
         self.sound.change_playlist(self._scene_playlist)
 
     def set_background(self):
-        if self.get_data('tab') == 'alert':
-            self._clear_navigation()
-            self._background = self._alert.copy()
-            self._draw_alerts()
-        elif self.get_data('tab') == 'log':
+        tab = self.get_data('tab')
+        if tab == 'nav' and self._nav_key() is None:
+            for thing in self._nav_lines:
+                if thing.name not in self.things:
+                    self.add_thing(thing)
+        else:
             self._clear_navigation()
-            self._background = self._logs[self.get_data('log page')].copy()
-        elif self.get_data('tab') == 'nav':
-            self._background = self._get_nav_page()
+        # Only compose the screen again if the state it shows has changed
+        key = (self.get_data('log page'),
+               self.game.scenes['bridge'].get_data('ai status'),
+               self.game.scenes['engine'].get_data('engine online'),
+               self.game.scenes['mess'].get_data('life support status'))
+        if self._screens.get(tab, (None, None))[0] != key:
+            self._screens[tab] = (key, self._compose_screen(tab))
+        self._background = self._screens[tab][1]
+
+    def _load_images(self):
+        if self._logs is not None:
+            return
+        self._alert = self.get_image(self.FOLDER, self.ALERT_BASE)
+        self._nav_background = self.get_image(self.FOLDER, self.NAVIGATION)
+        log_background = self.get_image(self.FOLDER, self.LOG_BACKGROUND)
+        self._logs = []
+        for text in self.LOGS:
+            log_page = self.resource.drawable_copy(log_background)
+            log_page.blit(render_text(
+                text, 'DejaVuSans-Bold.ttf', 18,
+                'lightgreen', (0, 0, 0, 0), self.resource, (600, 25), False),
+                self.ALERT_OFFSET)
+            self._logs.append(log_page)
+
+    def get_surfaces(self):
+        surfaces = super(BridgeCompDetail, self).get_surfaces()
+        if self._logs is not None:
+            surfaces.extend([self._alert, self._nav_background] + self._logs)
+        surfaces.extend(screen for key, screen in self._screens.values())
+        return surfaces
+
+    def release_surfaces(self):
+        super(BridgeCompDetail, self).release_surfaces()
+        self._screens = {}
+        if self._logs is not None:
+            self._alert = None
+            self._nav_background = None
+            self._logs = None
+            for name in (self.ALERT_BASE, self.NAVIGATION,
+                         self.LOG_BACKGROUND):
+                self.resource.forget_image(self.FOLDER, name)
+
+    def _compose_screen(self, tab):
+        self._load_images()
+        if tab == 'alert':
+            return self._draw_alerts()
+        elif tab == 'log':
+            return self._logs[self.get_data('log page')]
+        elif tab == 'nav':
+            return self._get_nav_page()
 
     def _clear_navigation(self):
         "Remove navigation things if necessary"
         for thing in self._nav_lines:
             if thing.name in self.things:
                 # Much fiddling to do the right thing when we reinsert it
-                del self.things[thing.name]
+                self.remove_thing(thing)
                 thing.scene = None
 
     def _draw_nav_text(self, key):
-        surface = self._nav_background.copy()
+        surface = self.resource.drawable_copy(self._nav_background)
         xpos, ypos = self.ALERT_OFFSET
         for line in self.NAV_MESSAGES[key]:
             text = render_text(
@@ -688,52 +738,58 @@ class BridgeCompDetail(Scene):
             ypos = ypos + text.get_height() + self.ALERT_SPACING
         return surface
 
-    def _get_nav_page(self):
+    def _nav_key(self):
+        """The message to show on the navigation tab, or None if we can
+           navigate"""
         if not self.game.scenes['engine'].get_data('engine online'):
-            return self._draw_nav_text('engine offline')
+            return 'engine offline'
         elif (not self.game.scenes['mess'].get_data('life support status')
               == 'fixed'):
-            return self._draw_nav_text('life support')
-        else:
-            for thing in self._nav_lines:
-                if thing.name not in self.things:
-                    self.add_thing(thing)
-            return self._nav_background.copy()
+            return 'life support'
+        return None
+
+    def _get_nav_page(self):
+        key = self._nav_key()
+        if key is not None:
+            return self._draw_nav_text(key)
+        return self._nav_background
 
     def _draw_alerts(self):
+        surface = self.resource.drawable_copy(self._alert)
         xpos, ypos = self.ALERT_OFFSET
-        self._background.blit(
+        surface.blit(
             self._alert_messages['hull breach'], (xpos, ypos))
         ypos += (
             self._alert_messages['hull breach'].get_size()[1]
             + self.ALERT_SPACING)
         if self.game.scenes['bridge'].get_data('ai status') == 'looping':
-            self._background.blit(
+            surface.blit(
                 self._alert_messages['ai looping'], (xpos, ypos))
             ypos += (self._alert_messages['ai looping'].get_size()[1]
                      + self.ALERT_SPACING)
         if self.game.scenes['bridge'].get_data('ai status') == 'dead':
-            self._background.blit(
+            surface.blit(
                 self._alert_messages['ai offline'], (xpos, ypos))
             ypos += (self._alert_messages['ai offline'].get_size()[1]
                      + self.ALERT_SPACING)
         if not self.game.scenes['engine'].get_data('engine online'):
-            self._background.blit(
+            surface.blit(
                 self._alert_messages['engine offline'], (xpos, ypos))
             ypos += (self._alert_messages['engine offline'].get_size()[1]
                      + self.ALERT_SPACING)
         if (self.game.scenes['mess'].get_data('life support status')
                 == 'broken'):
-            self._background.blit(
+            surface.blit(
                 self._alert_messages['life support'], (xpos, ypos))
             ypos += (self._alert_messages['life support'].get_size()[1]
                      + self.ALERT_SPACING)
         if (self.game.scenes['mess'].get_data('life support status')
                 == 'replaced'):
-            self._background.blit(
+            surface.blit(
                 self._alert_messages['life support partial'], (xpos, ypos))
             ypos += (self._alert_messages['life support partial'].get_size()[1]
                      + self.ALERT_SPACING)
+        return surface
 
 
 SCENES = [Bridge]
@@ -2,17 +2,18 @@
 
 from pyntnclick.i18n import _
 from pyntnclick.cursor import CursorSprite
-from pyntnclick.state import Scene, Item, Thing, Result
-from pyntnclick.scenewidgets import (
-    InteractNoImage, InteractImage, InteractAnimated, GenericDescThing,
-    TakeableThing)
+from pyntnclick.state import Result
+from pyntnclick.scenewidgets import InteractNoImage
 
+from gamelib.ss_state import SSItem, SSScene, SSThing
+from gamelib.ss_scenewidgets import (
+    SSGenericDescThing, SSInteractAnimated, SSInteractImage, SSTakeableThing)
 from gamelib.scenes.game_constants import PLAYER_ID
 from gamelib.scenes.game_widgets import (
     Door, BaseCamera, make_jim_dialog, make_sentence_dialog)
 
 
-class CrewQuarters(Scene):
+class CrewQuarters(SSScene):
 
     FOLDER = "crew_quarters"
     BACKGROUND = "crew_quarters.png"
@@ -29,11 +30,11 @@ class CrewQuarters(Scene):
         self.add_item_factory(FishbowlHelmet)
         self.add_thing(PosterThing())
         self.add_thing(MonitorCamera())
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             'crew.plant', 1,
             _("The plant is doing surprisingly well for centuries of neglect"),
             ((624, 215, 61, 108),)))
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             'crew.cat', 2,
             _("A picture of a cat labelled 'Clementine'"),
             ((722, 382, 66, 72),)))
@@ -50,15 +51,15 @@ class ToMap(Door):
     INITIAL = "door"
 
 
-class Safe(Thing):
+class Safe(SSThing):
     "A safe, for keeping things safe."
 
     NAME = 'crew.safe'
 
     INTERACTS = {
         'safe': InteractNoImage(447, 238, 72, 73),
-        'full_safe': InteractImage(445, 227, 'open_safe_full.png'),
-        'empty_safe': InteractImage(445, 227, 'open_safe_empty.png'),
+        'full_safe': SSInteractImage(445, 227, 'open_safe_full.png'),
+        'empty_safe': SSInteractImage(445, 227, 'open_safe_empty.png'),
     }
 
     INITIAL = 'safe'
@@ -112,14 +113,14 @@ class Safe(Thing):
                  " reasonably secure.")
 
 
-class FishbowlThing(Thing):
+class FishbowlThing(SSThing):
     "A safe, for keeping things safe."
 
     NAME = 'crew.fishbowl'
 
     INTERACTS = {
-        'fishbowl': InteractImage(356, 495, 'fishbowl_on_table.png'),
-        'fish_no_bowl': InteractImage(372, 517, 'fish_minus_bowl.png'),
+        'fishbowl': SSInteractImage(356, 495, 'fishbowl_on_table.png'),
+        'fish_no_bowl': SSInteractImage(372, 517, 'fish_minus_bowl.png'),
     }
 
     INITIAL = 'fishbowl'
@@ -151,7 +152,7 @@ class FishbowlThing(Thing):
                      " table")
 
 
-class Fishbowl(Item):
+class Fishbowl(SSItem):
     "A bowl. Sans fish."
 
     INVENTORY_IMAGE = 'fishbowl.png'
@@ -165,7 +166,7 @@ class Fishbowl(Item):
                         " needed."))
 
 
-class FishbowlHelmet(Item):
+class FishbowlHelmet(SSItem):
     "A bowl with duct-tape"
 
     INVENTORY_IMAGE = "fishbowl_helmet.png"
@@ -173,7 +174,7 @@ class FishbowlHelmet(Item):
     NAME = "helmet"
 
 
-class DuctTape(Item):
+class DuctTape(SSItem):
     "A bowl. Sans fish."
 
     NAME = 'duct_tape'
@@ -187,21 +188,21 @@ class MonitorCamera(BaseCamera):
     NAME = 'crew.camera'
 
     INTERACTS = {
-        'online': InteractImage(85, 97, 'camera_medium.png'),
-        'dead': InteractImage(85, 97, 'camera_medium_gray.png'),
-        'looping': InteractAnimated(85, 97, ('camera_medium.png',
-                                             'camera_medium_gray.png'),
-                                    15),
+        'online': SSInteractImage(85, 97, 'camera_medium.png'),
+        'dead': SSInteractImage(85, 97, 'camera_medium_gray.png'),
+        'looping': SSInteractAnimated(85, 97, ('camera_medium.png',
+                                               'camera_medium_gray.png'),
+                                      15),
     }
 
 
-class PosterThing(TakeableThing):
+class PosterThing(SSTakeableThing):
     "A innocent poster on the wall"
 
     NAME = 'crew.poster'
 
     INTERACTS = {
-        'poster': InteractImage(29, 166, 'triangle_poster.png'),
+        'poster': SSInteractImage(29, 166, 'triangle_poster.png'),
     }
 
     INITIAL = 'poster'
@@ -215,7 +216,7 @@ class PosterThing(TakeableThing):
         return _("A paradoxical poster hangs below the security camera.")
 
 
-class EscherPoster(Item):
+class EscherPoster(SSItem):
     "A confusing poster to disable JIM"
 
     INVENTORY_IMAGE = "triangle_poster.png"
@@ -5,16 +5,17 @@ import random
 from pyntnclick.i18n import _
 from pyntnclick.utils import render_text
 from pyntnclick.cursor import CursorSprite
-from pyntnclick.state import Scene, Item, CloneableItem, Thing, Result
-from pyntnclick.scenewidgets import (
-    InteractNoImage, InteractRectUnion, InteractImage, InteractAnimated,
-    GenericDescThing, TakeableThing)
+from pyntnclick.state import Result
+from pyntnclick.scenewidgets import InteractNoImage, InteractRectUnion
 
+from gamelib.ss_state import SSCloneableItem, SSItem, SSScene, SSThing
+from gamelib.ss_scenewidgets import (
+    SSGenericDescThing, SSInteractAnimated, SSInteractImage, SSTakeableThing)
 from gamelib.scenes.game_constants import PLAYER_ID
 from gamelib.scenes.game_widgets import Door, make_jim_dialog
 
 
-class Cryo(Scene):
+class Cryo(SSScene):
 
     FOLDER = "cryo"
     BACKGROUND = "cryo_room.png"
@@ -49,7 +50,7 @@ class Cryo(Scene):
 
         # Flavour items
         # pipes
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             'cryo.pipes', 1,
             _("These pipes carry cooling fluid to the cryo units."),
             (
@@ -160,7 +161,7 @@ class Cryo(Scene):
         self.sound.change_playlist(None)
 
 
-class CryoPipeBase(Thing):
+class CryoPipeBase(SSThing):
     "Base class for cryo pipes that need to be stolen."
 
     INITIAL = "fixed"
@@ -205,7 +206,7 @@ class CryoPipeBase(Thing):
         return _("There used to be a pipe carrying cooling fluid here.")
 
 
-class UncuttableCryoPipes(Thing):
+class UncuttableCryoPipes(SSThing):
     "Base class for cryo pipes that can't be cut down."
 
     NAME = "cryo.pipes.2"
@@ -233,7 +234,7 @@ class UncuttableCryoPipes(Thing):
         return _("These pipes carry cooling fluid to the working cryo units.")
 
 
-class TubeFragment(CloneableItem):
+class TubeFragment(SSCloneableItem):
     "Obtained after cutting down a cryo room pipe."
 
     NAME = "tube_fragment"
@@ -248,7 +249,7 @@ class CryoPipeLeft(CryoPipeBase):
 
     NAME = "cryo.pipe.left"
     INTERACTS = {
-        "fixed": InteractImage(117, 226, "intact_cryo_pipe_left.png"),
+        "fixed": SSInteractImage(117, 226, "intact_cryo_pipe_left.png"),
         "chopped": InteractNoImage(125, 192, 27, 258),
         }
 
@@ -258,7 +259,7 @@ class CryoPipeRightTop(CryoPipeBase):
 
     NAME = "cryo.pipe.right.top"
     INTERACTS = {
-        "fixed": InteractImage(645, 212, "intact_cryo_pipe_right_top.png"),
+        "fixed": SSInteractImage(645, 212, "intact_cryo_pipe_right_top.png"),
         "chopped": InteractNoImage(643, 199, 31, 111),
         }
 
@@ -268,12 +269,13 @@ class CryoPipeRightBottom(CryoPipeBase):
 
     NAME = "cryo.pipe.right.bottom"
     INTERACTS = {
-        "fixed": InteractImage(644, 333, "intact_cryo_pipe_right_bottom.png"),
+        "fixed": SSInteractImage(
+            644, 333, "intact_cryo_pipe_right_bottom.png"),
         "chopped": InteractNoImage(644, 333, 31, 107),
         }
 
 
-class TitaniumLeg(Item):
+class TitaniumLeg(SSItem):
     "Titanium leg, found on a piratical corpse."
 
     NAME = 'titanium_leg'
@@ -281,7 +283,7 @@ class TitaniumLeg(Item):
     CURSOR = CursorSprite('titanium_femur_cursor.png', 13, 5)
 
 
-class CryoUnitAlpha(Thing):
+class CryoUnitAlpha(SSThing):
     "Cryo unit containing titanium leg."
 
     NAME = "cryo.unit.1"
@@ -316,7 +318,7 @@ class CryoUnitAlpha(Thing):
         return _("A broken cryo chamber. The corpse inside is missing a leg.")
 
 
-class GenericCryoUnit(GenericDescThing):
+class GenericCryoUnit(SSGenericDescThing):
     "Generic Cryo unit"
 
     def __init__(self, number, description, detailed_description, areas):
@@ -350,8 +352,8 @@ class CryoRoomDoor(Door):
 
     INTERACTS = {
         "shut": InteractNoImage(290, 260, 99, 152),
-        "ajar": InteractImage(290, 260, "door_ajar.png"),
-        "open": InteractImage(290, 260, "door_open.png"),
+        "ajar": SSInteractImage(290, 260, "door_ajar.png"),
+        "open": SSInteractImage(290, 260, "door_open.png"),
         }
 
     INITIAL = "shut"
@@ -409,16 +411,16 @@ class CryoRoomDoor(Door):
         return _('A rusty door. It is currently closed.')
 
 
-class CryoComputer(Thing):
+class CryoComputer(SSThing):
     "Computer in the cryo room."
 
     NAME = "cryo.computer"
 
     INTERACTS = {
-        "info": InteractAnimated(
+        "info": SSInteractAnimated(
             416, 290, ["comp_info.png", "comp_info2.png"], 10),
-        "warn": InteractImage(416, 290, "comp_warn.png"),
-        "error": InteractImage(416, 290, "comp_error.png"),
+        "warn": SSInteractImage(416, 290, "comp_warn.png"),
+        "error": SSInteractImage(416, 290, "comp_error.png"),
         }
 
     INITIAL = "info"
@@ -433,13 +435,13 @@ class CryoComputer(Thing):
         return _("A computer terminal, with some text on it.")
 
 
-class TitaniumLegThing(TakeableThing):
+class TitaniumLegThing(SSTakeableThing):
     "Triangle in the cryo room."
 
     NAME = "cryo.titanium_leg"
 
     INTERACTS = {
-        "leg": InteractImage(180, 132, "leg.png"),
+        "leg": SSInteractImage(180, 132, "leg.png"),
         }
 
     INITIAL = "leg"
@@ -456,7 +458,7 @@ class TitaniumLegThing(TakeableThing):
         return _("This femur looks synthetic.")
 
 
-class PlaqueThing(Thing):
+class PlaqueThing(SSThing):
     "Plaque on the detailed cryo chamber"
 
     NAME = "cryo.plaque"
@@ -475,13 +477,13 @@ class PlaqueThing(Thing):
         return _("'Prisoner 98CC-764E646391EE. War crimes. 45 years.")
 
 
-class FullBottle(Item):
+class FullBottle(SSItem):
     NAME = 'full_detergent_bottle'
     INVENTORY_IMAGE = 'bottle_full.png'
     CURSOR = CursorSprite('bottle_full_cursor.png', 27, 7)
 
 
-class CryoPools(Thing):
+class CryoPools(SSThing):
     "Handy for cooling engines"
 
     NAME = 'cryo.pool'
@@ -507,15 +509,20 @@ class CryoPools(Thing):
         return Result(_("You scoop up some coolant and fill the bottle."))
 
 
-class CryoCompDetail(Scene):
+class CryoCompDetail(SSScene):
 
     FOLDER = "cryo"
     BACKGROUND = "comp_info_detail.png"
     NAME = "cryo_comp_detail"
 
     def setup(self):
-        background = self.get_image(
-            self.FOLDER, self.BACKGROUND)
+        # Drawn when they're needed
+        self._background_fixed = None
+        self._background_offline = None
+
+    def _draw_backgrounds(self):
+        background = self.resource.drawable_copy(
+            self.get_image(self.FOLDER, self.BACKGROUND))
         # Add the common text strings
         bg = (0, 0, 0, 0)
         fg = 'lightgreen'
@@ -538,8 +545,8 @@ class CryoCompDetail(Scene):
             _("Expected Time of Arrival:"),
             font, size, fg, bg, self.resource, (340, 30), False), (15, 240))
 
-        self._background_fixed = background.copy()
         self._background_offline = background.copy()
+        self._background_fixed = background
 
         self._background_fixed.blit(render_text(
             _("397 days"),
@@ -550,13 +557,28 @@ class CryoCompDetail(Scene):
             font, size, fg, bg, self.resource, (340, 30), False), (275, 240))
 
     def draw_background(self, surface):
+        if self._background_fixed is None:
+            self._draw_backgrounds()
         if self.game.scenes['engine'].get_data('engine online'):
             surface.blit(self._background_fixed, self.OFFSET, None)
         else:
             surface.blit(self._background_offline, self.OFFSET, None)
 
+    def get_surfaces(self):
+        surfaces = super(CryoCompDetail, self).get_surfaces()
+        if self._background_fixed is not None:
+            surfaces.extend([self._background_fixed,
+                             self._background_offline])
+        return surfaces
+
+    def release_surfaces(self):
+        super(CryoCompDetail, self).release_surfaces()
+        self._background_fixed = None
+        self._background_offline = None
+        self.resource.forget_image(self.FOLDER, self.BACKGROUND)
+
 
-class CryoUnitWithCorpse(Scene):
+class CryoUnitWithCorpse(SSScene):
 
     FOLDER = "cryo"
     BACKGROUND = "cryo_unit_detail.png"
@@ -1,18 +1,23 @@
 """Engine room where things need to be repaired."""
 
+from pygame import Rect
+from pygame.locals import BLEND_RGBA_MAX, SRCALPHA
+from pygame.surface import Surface
+
 from pyntnclick.i18n import _
 from pyntnclick.cursor import CursorSprite
 from pyntnclick.utils import render_text, make_reversible_list
-from pyntnclick.state import Scene, Item, Thing, Result
-from pyntnclick.scenewidgets import (
-    InteractNoImage, InteractRectUnion, InteractImage, InteractAnimated,
-    GenericDescThing, TakeableThing)
+from pyntnclick.state import Result
+from pyntnclick.scenewidgets import InteractNoImage, InteractRectUnion
 
+from gamelib.ss_state import SSItem, SSScene, SSThing
+from gamelib.ss_scenewidgets import (
+    SSGenericDescThing, SSInteractAnimated, SSInteractImage, SSTakeableThing)
 from gamelib.scenes.game_constants import PLAYER_ID
 from gamelib.scenes.game_widgets import Door, make_jim_dialog
 
 
-class Engine(Scene):
+class Engine(SSScene):
 
     FOLDER = "engine"
     BACKGROUND = "engine_room.png"
@@ -38,7 +43,7 @@ class Engine(Scene):
         self.add_thing(CrackedPipe())
         self.add_thing(ComputerConsole())
         self.add_thing(ToMap())
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             'engine.body', 1,
             _("Dead. Those cans must have been past their sell-by date."),
             (
@@ -46,7 +51,7 @@ class Engine(Scene):
                 (549, 479, 60, 55),
             )
         ))
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             'engine.superconductors', 4,
             _("Superconductors. The engines must be power hogs."),
             (
@@ -55,7 +60,7 @@ class Engine(Scene):
                 (381, 224, 25, 22),
             )
         ))
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             'engine.floor_hole', 5,
             _("A gaping hole in the floor of the room. "
               "It is clearly irreparable."),
@@ -66,7 +71,7 @@ class Engine(Scene):
                 (239, 547, 123, 39),
             )
         ))
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             'engine.empty_cans', 7,
             _("Empty chocolate-covered bacon cans? Poor guy, he must have"
               " found them irresistible."),
@@ -75,14 +80,14 @@ class Engine(Scene):
             )
         ))
         if not self.get_data('engine online'):
-            self.add_thing(GenericDescThing(
+            self.add_thing(SSGenericDescThing(
                 'engine.engines', 8,
                 _("The engines. They don't look like they are working."),
                 (
                     (342, 261, 109, 81),
                 )
             ))
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             'engine.laser_cutter', 9,
             _("A burned-out laser cutter. It may be responsible for the"
               " hole in the floor."),
@@ -90,7 +95,7 @@ class Engine(Scene):
                 (120, 466, 115, 67),
             )
         ))
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             'engine.fuel_lines', 10,
             _("The main fuel line for the engines."),
             (
@@ -111,7 +116,7 @@ class Engine(Scene):
                 (435, 225, 18, 15),
             )
         ))
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             'engine.spare_fuel_line', 11,
             _("The spare fuel line. If something went wrong with the main"
               " one, you would hook that one up."),
@@ -119,14 +124,14 @@ class Engine(Scene):
                 (512, 49, 68, 44),
             )
         ))
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             'engine.danger_area', 12,
             _("The sign says DANGER. You would be wise to listen to it."),
             (
                 (293, 343, 211, 46),
             )
         ))
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             'engine.exit_sign', 13,
             _("It's one of those glow-in-the-dark signs needed to satisfy the "
               "health and safety inspectors."),
@@ -154,11 +159,11 @@ class Engine(Scene):
                       " a vacuum it would be eerily quiet."))
 
 
-class Engines(Thing):
+class Engines(SSThing):
     NAME = 'engine.engines'
 
     INTERACTS = {
-        'on': InteractImage(334, 253, 'engine_on.png'),
+        'on': SSInteractImage(334, 253, 'engine_on.png'),
     }
 
     INITIAL = 'on'
@@ -170,17 +175,17 @@ class Engines(Thing):
         return _("All systems are go! Or at least the engines are.")
 
 
-class CanOpener(Item):
+class CanOpener(SSItem):
     NAME = 'canopener'
     INVENTORY_IMAGE = 'can_opener.png'
     CURSOR = CursorSprite('can_opener_cursor.png')
 
 
-class CanOpenerThing(TakeableThing):
+class CanOpenerThing(SSTakeableThing):
     NAME = 'engine.canopener'
 
     INTERACTS = {
-        'canopener': InteractImage(565, 456, 'can_opener.png'),
+        'canopener': SSInteractImage(565, 456, 'can_opener.png'),
     }
 
     INITIAL = 'canopener'
@@ -195,13 +200,13 @@ class CanOpenerThing(TakeableThing):
                         "the vacuum has kept it in perfect condition."))
 
 
-class SuperconductorSocket(Thing):
+class SuperconductorSocket(SSThing):
     NAME = 'engine.superconductor'
 
     INTERACTS = {
-        'broken': InteractImage(553, 260, 'superconductor_broken.png'),
-        'removed': InteractImage(553, 260, 'superconductor_socket.png'),
-        'fixed': InteractImage(553, 260, 'superconductor_fixed.png'),
+        'broken': SSInteractImage(553, 260, 'superconductor_broken.png'),
+        'removed': SSInteractImage(553, 260, 'superconductor_socket.png'),
+        'fixed': SSInteractImage(553, 260, 'superconductor_fixed.png'),
     }
 
     INITIAL = 'broken'
@@ -267,12 +272,12 @@ class SuperconductorSocket(Thing):
                             " first."))
 
 
-class CryoContainers(Thing):
+class CryoContainers(SSThing):
     NAME = 'engine.cryo_containers'
 
     INTERACTS = {
-        'empty': InteractImage(118, 211, 'cryo_empty.png'),
-        'full': InteractImage(118, 211, 'cryo_full.png'),
+        'empty': SSInteractImage(118, 211, 'cryo_empty.png'),
+        'full': SSInteractImage(118, 211, 'cryo_full.png'),
         }
 
     INITIAL = 'empty'
@@ -295,7 +300,7 @@ class CryoContainers(Thing):
         return False
 
 
-class CryoContainerReceptacle(Thing):
+class CryoContainerReceptacle(SSThing):
     NAME = 'engine.cryo_container_receptacle'
 
     INTERACTS = {
@@ -330,7 +335,7 @@ class CryoContainerReceptacle(Thing):
         return results
 
 
-class CoolingPipes(Thing):
+class CoolingPipes(SSThing):
     NAME = 'engine.coolingpipes'
 
     INTERACTS = {
@@ -380,7 +385,7 @@ class CoolingPipes(Thing):
         return False
 
 
-class PowerLines(Thing):
+class PowerLines(SSThing):
     NAME = 'engine.powerlines'
 
     INTERACTS = {
@@ -406,11 +411,11 @@ class PowerLines(Thing):
         return False
 
 
-class ArrowsTopLeft(Thing):
+class ArrowsTopLeft(SSThing):
     NAME = 'engine.arrows_top_left'
 
     INTERACTS = {
-        'arrows': InteractAnimated(25, 324, (
+        'arrows': SSInteractAnimated(25, 324, (
             'arrow_top_left_1.png', 'arrow_top_left_2.png',
             'arrow_top_left_3.png', 'arrow_top_left_4.png',
             ), 15,
@@ -423,11 +428,11 @@ class ArrowsTopLeft(Thing):
         return False
 
 
-class ArrowsBottomLeft(Thing):
+class ArrowsBottomLeft(SSThing):
     NAME = 'engine.arrows_bottom_left'
 
     INTERACTS = {
-        'arrows': InteractAnimated(32, 425, (
+        'arrows': SSInteractAnimated(32, 425, (
             'arrow_bottom_left_1.png', 'arrow_bottom_left_2.png',
             'arrow_bottom_left_3.png', 'arrow_bottom_left_4.png',
             ), 16,
@@ -440,11 +445,11 @@ class ArrowsBottomLeft(Thing):
         return False
 
 
-class ArrowsRight(Thing):
+class ArrowsRight(SSThing):
     NAME = 'engine.arrows_right'
 
     INTERACTS = {
-        'arrows': InteractAnimated(708, 172, (
+        'arrows': SSInteractAnimated(708, 172, (
             'arrow_right_1.png', 'arrow_right_2.png',
             'arrow_right_3.png', 'arrow_right_4.png',
             ), 17,
@@ -457,11 +462,11 @@ class ArrowsRight(Thing):
         return False
 
 
-class DangerSign(Thing):
+class DangerSign(SSThing):
     NAME = 'engine.danger_sign'
 
     INTERACTS = {
-        'sign': InteractAnimated(299, 341, (
+        'sign': SSInteractAnimated(299, 341, (
             'danger_dim.png', 'danger_bright.png',
             ), 10,
         ),
@@ -473,11 +478,11 @@ class DangerSign(Thing):
         return False
 
 
-class Stars(Thing):
+class Stars(SSThing):
     NAME = 'engine.stars'
 
     INTERACTS = {
-        'stars': InteractAnimated(
+        'stars': SSInteractAnimated(
             287, 455,
             make_reversible_list(['stars_%d.png' % (i + 1) for i in range(5)]),
             30,
@@ -494,12 +499,12 @@ class Stars(Thing):
                  " that's why there's a vacuum in here.")
 
 
-class CrackedPipe(Thing):
+class CrackedPipe(SSThing):
     NAME = "engine.cracked_pipe"
 
     INTERACTS = {
-        'cracked': InteractImage(13, 402, 'cracked_pipe.png'),
-        'taped': InteractImage(13, 402, 'duct_taped_pipe.png'),
+        'cracked': SSInteractImage(13, 402, 'cracked_pipe.png'),
+        'taped': SSInteractImage(13, 402, 'duct_taped_pipe.png'),
     }
 
     INITIAL = 'cracked'
@@ -531,7 +536,7 @@ class CrackedPipe(Thing):
                             "creak, sealing it."))
 
 
-class ComputerConsole(Thing):
+class ComputerConsole(SSThing):
     NAME = "engine.computer_console"
 
     INTERACTS = {
@@ -550,7 +555,7 @@ class ComputerConsole(Thing):
         return _("A computer console. It's alarmingly close to the engine.")
 
 
-class EngineCompDetail(Scene):
+class EngineCompDetail(SSScene):
 
     FOLDER = "engine"
     BACKGROUND = "engine_comp_detail.png"
@@ -575,27 +580,63 @@ class EngineCompDetail(Scene):
             self._alert_messages[key] = render_text(
                 msg, 'DejaVuSans-Bold.ttf',
                 30, 'darkred', (0, 0, 0, 0), self.resource, (480, 33), False)
+        # The alerts that were last drawn, and the overlay they're drawn on
+        self._alerts = None
+        self._alert_overlay = None
 
-    def _draw_alerts(self, surface):
-        xpos, ypos = self.ALERT_OFFSET
+    def _get_alerts(self):
         engine = self.game.scenes['engine']
-        surface.blit(self._alert_header, (15, 55))
+        alerts = []
         if not engine.things['engine.cracked_pipe'].get_data('fixed'):
-            image = self._alert_messages['cryo leaking']
-            surface.blit(image, (xpos, ypos))
-            ypos += image.get_size()[1] + self.ALERT_SPACING
+            alerts.append('cryo leaking')
         if not engine.things['engine.cryo_containers'].get_data('filled'):
-            image = self._alert_messages['cryo empty']
-            surface.blit(image, (xpos, ypos))
-            ypos += image.get_size()[1] + self.ALERT_SPACING
+            alerts.append('cryo empty')
         if not engine.things['engine.superconductor'].get_data('working'):
-            image = self._alert_messages['super malfunction']
-            surface.blit(image, (xpos, ypos))
-            ypos += image.get_size()[1] + self.ALERT_SPACING
+            alerts.append('super malfunction')
+        return alerts
+
+    def _draw_alert_overlay(self, alerts):
+        """Draw the header and the alerts onto a single overlay.
 
-    def draw_things(self, surface):
-        self._draw_alerts(surface)
-        super(EngineCompDetail, self).draw_things(surface)
+           Returns the overlay and its position."""
+        images = [(self._alert_header, (15, 55))]
+        xpos, ypos = self.ALERT_OFFSET
+        for key in alerts:
+            image = self._alert_messages[key]
+            images.append((image, (xpos, ypos)))
+            ypos += image.get_size()[1] + self.ALERT_SPACING
+        rects = [Rect(pos, image.get_size()) for image, pos in images]
+        rect = rects[0].unionall(rects[1:])
+        overlay = Surface(rect.size, SRCALPHA, 32)
+        overlay.fill((0, 0, 0, 0))
+        for image, pos in images:
+            # The images don't overlap, so this copies them onto the
+            # overlay unchanged, alpha and all.
+            overlay.blit(image, (pos[0] - rect.x, pos[1] - rect.y),
+                         None, BLEND_RGBA_MAX)
+        return overlay, rect.topleft
+
+    def draw_background(self, surface):
+        super(EngineCompDetail, self).draw_background(surface)
+        # The alerts can't change while we're being shown, so they're drawn
+        # with the background.
+        alerts = self._get_alerts()
+        if alerts != self._alerts:
+            self._alerts = alerts
+            self._alert_overlay = self._draw_alert_overlay(alerts)
+        surface.blit(*self._alert_overlay)
+
+    def get_surfaces(self):
+        surfaces = super(EngineCompDetail, self).get_surfaces()
+        if self._alert_overlay is not None:
+            surfaces.append(self._alert_overlay[0])
+        return surfaces
+
+    def release_surfaces(self):
+        super(EngineCompDetail, self).release_surfaces()
+        # Drawn again with the background
+        self._alert_overlay = None
+        self._alerts = None
 
 
 class ToMap(Door):
@@ -2,12 +2,13 @@
 
 
 from pyntnclick.i18n import _
-from pyntnclick.state import Thing, Result
+from pyntnclick.state import Result
 
 from gamelib.custom_widgets import JimLabel
+from gamelib.ss_state import SSThing
 
 
-class Door(Thing):
+class Door(SSThing):
     """A door somewhere"""
 
     DEST = "map"
@@ -15,11 +16,14 @@ class Door(Thing):
 
     def __init__(self):
         self.NAME = self.SCENE + '.door'
-        Thing.__init__(self)
+        SSThing.__init__(self)
 
     def is_interactive(self, tool=None):
         return True
 
+    def get_destination(self):
+        return self.DEST
+
     def interact_without(self):
         """Go to map."""
         self.game.change_scene("map")
@@ -45,7 +49,15 @@ def make_sentence_dialog(prisoner, game):
                 "id": prisoner, 'sen': game.data.get_total_sentence()}, game)
 
 
-class BaseCamera(Thing):
+def update_cameras(game):
+    """Show JIM's new state on all the cameras, after changing it"""
+    for scene in game.scenes.values():
+        for thing in scene.things.values():
+            if isinstance(thing, BaseCamera):
+                thing.set_interact()
+
+
+class BaseCamera(SSThing):
     "Base class for the camera puzzles"
 
     INITIAL = 'online'
@@ -74,6 +86,7 @@ class BaseCamera(Thing):
                                             " Entering emergency shutdown."),
                                           self.game)
             self.game.data.loop_ai()
+            update_cameras(self.game)
             return ai_response
 
     def select_interact(self):
@@ -81,10 +94,3 @@ class BaseCamera(Thing):
             # We aren't completely set up yet
             return self.INITIAL
         return self.state.get_jim_state()
-
-    def animate(self):
-        ai_status = self.state.get_jim_state()
-        if ai_status != self.get_data('status'):
-            self.set_data('status', ai_status)
-            self.set_interact()
-        super(BaseCamera, self).animate()
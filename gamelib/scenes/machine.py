@@ -1,17 +1,18 @@
 """Machine room where tools and machines are found."""
 
 from pyntnclick.i18n import _
-from pyntnclick.state import Scene, Item, Thing, Result
+from pyntnclick.state import Result
 from pyntnclick.cursor import CursorSprite
 from pyntnclick.utils import make_reversible_list
-from pyntnclick.scenewidgets import (
-    InteractNoImage, InteractImage, InteractAnimated, GenericDescThing,
-    TakeableThing)
+from pyntnclick.scenewidgets import InteractNoImage
 
+from gamelib.ss_state import SSItem, SSScene, SSThing
+from gamelib.ss_scenewidgets import (
+    SSGenericDescThing, SSInteractAnimated, SSInteractImage, SSTakeableThing)
 from gamelib.scenes.game_widgets import Door
 
 
-class Machine(Scene):
+class Machine(SSScene):
 
     FOLDER = "machine"
     BACKGROUND = "machine_room.png"
@@ -28,7 +29,7 @@ class Machine(Scene):
         self.add_item_factory(CryoPipesTwo)
         self.add_item_factory(CryoPipesThree)
         self.add_item_factory(Manual)
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             'machine.wires', 2,
             _("Wires run to all the machines in the room"),
             (
@@ -49,19 +50,19 @@ class Machine(Scene):
                 (648, 85, 22, 26),
                 (674, 54, 23, 36),
                 )))
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             'machine.diagram', 3,
             _("A wiring diagram of some sort"),
             ((694, 140, 94, 185),)))
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             'machine.powerpoint', 4,
             _("The cables to this power point have been cut"),
             ((155, 22, 92, 74),)))
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             "machine.powerpoint", 5,
             _("All the machines run off this powerpoint"),
             ((593, 19, 74, 57),)))
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             "machine.drill_press", 6,
             _("An impressive looking laser drill press"),
             (
@@ -75,7 +76,7 @@ class Machine(Scene):
                 (532, 331, 14, 11),
                 (605, 304, 26, 8),
             )))
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             "machine.drill_press_block", 7,
             _("The block for the laser drill press"),
             ((461, 446, 38, 27),)))
@@ -92,15 +93,15 @@ class ToMap(Door):
     INITIAL = "door"
 
 
-class LaserWelderSlot(Thing):
+class LaserWelderSlot(SSThing):
 
     NAME = "machine.welder.slot"
 
     INTERACTS = {
-        "empty": InteractImage(241, 310, "welder_empty.png"),
-        "can": InteractImage(241, 310, "welder_can.png"),
-        "tube": InteractImage(241, 310, "welder_pipe.png"),
-        "can_and_tube": InteractImage(241, 310, "welder_can_pipe.png"),
+        "empty": SSInteractImage(241, 310, "welder_empty.png"),
+        "can": SSInteractImage(241, 310, "welder_can.png"),
+        "tube": SSInteractImage(241, 310, "welder_pipe.png"),
+        "can_and_tube": SSInteractImage(241, 310, "welder_can_pipe.png"),
     }
 
     INITIAL = "empty"
@@ -162,7 +163,7 @@ class LaserWelderSlot(Thing):
         return msg
 
 
-class LaserWelderButton(Thing):
+class LaserWelderButton(SSThing):
 
     NAME = "machine.welder.button"
 
@@ -211,17 +212,17 @@ class LaserWelderButton(Thing):
                               soundfile='laser.ogg')
 
 
-class LaserWelderPowerLights(Thing):
+class LaserWelderPowerLights(SSThing):
 
     NAME = "machine.welder.lights"
 
     INTERACTS = {
-        "lights": InteractAnimated(199, 273,
-                                   make_reversible_list(
-                                       ["power_lights_%d.png" % i
-                                        for i in range(8)]
-                                   ),
-                                   10),
+        "lights": SSInteractAnimated(199, 273,
+                                     make_reversible_list(
+                                         ["power_lights_%d.png" % i
+                                          for i in range(8)]
+                                     ),
+                                     10),
     }
 
     INITIAL = 'lights'
@@ -230,7 +231,7 @@ class LaserWelderPowerLights(Thing):
         return _("The power lights pulse expectantly.")
 
 
-class CryoPipesOne(Item):
+class CryoPipesOne(SSItem):
     "A single cryo pipe (made from a tube fragment and can)."
 
     NAME = 'cryo_pipes_one'
@@ -239,7 +240,7 @@ class CryoPipesOne(Item):
     TOOL_NAME = "cryo_pipes_one"
 
 
-class CryoPipesTwo(Item):
+class CryoPipesTwo(SSItem):
     "Two cryo pipes (each made from a tube fragment and can)."
 
     NAME = 'cryo_pipes_two'
@@ -248,7 +249,7 @@ class CryoPipesTwo(Item):
     TOOL_NAME = "cryo_pipes_two"
 
 
-class CryoPipesThree(Item):
+class CryoPipesThree(SSItem):
     "Three cryo pipes (each made from a tube fragment and can)."
 
     NAME = 'cryo_pipes_three'
@@ -257,7 +258,7 @@ class CryoPipesThree(Item):
     TOOL_NAME = "cryo_pipes_three"
 
 
-class Grinder(Thing):
+class Grinder(SSThing):
 
     NAME = "machine.grinder"
 
@@ -283,7 +284,7 @@ class Grinder(Thing):
                  " machine.")
 
 
-class TitaniumMachete(Item):
+class TitaniumMachete(SSItem):
     "Titanium machete, formerly a leg."
 
     NAME = 'machete'
@@ -291,12 +292,12 @@ class TitaniumMachete(Item):
     CURSOR = CursorSprite('machete_cursor.png', 23, 1)
 
 
-class ManualThing(TakeableThing):
+class ManualThing(SSTakeableThing):
 
     NAME = "machine.manual"
 
     INTERACTS = {
-        "manual": InteractImage(432, 493, "manual_on_floor.png"),
+        "manual": SSInteractImage(432, 493, "manual_on_floor.png"),
     }
 
     INITIAL = "manual"
@@ -309,7 +310,7 @@ class ManualThing(TakeableThing):
                         " gaping hole in his rib cage."))
 
 
-class Manual(Item):
+class Manual(SSItem):
     "A ship instruction manual."
 
     NAME = 'manual'
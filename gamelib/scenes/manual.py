@@ -1,13 +1,15 @@
 """The inside of the maintenance manual."""
 
-from pyntnclick.state import Scene, Thing
-from pyntnclick.scenewidgets import InteractNoImage, InteractImage
+from pyntnclick.scenewidgets import InteractNoImage
+
+from gamelib.ss_state import SSScene, SSThing
+from gamelib.ss_scenewidgets import SSInteractImage
 
 
 # classes related the computer detail
 
 
-class PageBase(Thing):
+class PageBase(SSThing):
     "Displays manual pages"
 
     def get_page_thing(self):
@@ -36,7 +38,7 @@ class PagePrior(PageBase):
     NAME = 'manual.page_prior'
 
     INTERACTS = {
-            'on': InteractImage(36, 351, 'arrow_left.png'),
+            'on': SSInteractImage(36, 351, 'arrow_left.png'),
             'off': InteractNoImage(31, 351, 34, 23),
             }
     INITIAL = 'off'
@@ -55,7 +57,7 @@ class PageNext(PageBase):
     NAME = 'manual.page_next'
 
     INTERACTS = {
-            'on': InteractImage(185, 351, 'arrow_right.png'),
+            'on': SSInteractImage(185, 351, 'arrow_right.png'),
             'off': InteractNoImage(185, 351, 34, 23),
             }
     INITIAL = 'on'
@@ -68,16 +70,16 @@ class PageNext(PageBase):
         self.set_page(self.get_page() + 1)
 
 
-class ManualPage(Thing):
+class ManualPage(SSThing):
     """Page in the manual"""
 
     NAME = 'manual.page'
 
     INTERACTS = {
-            0: InteractImage(0, 0, 'manual_p1.png'),
-            1: InteractImage(0, 0, 'manual_p2.png'),
-            2: InteractImage(0, 0, 'manual_p3.png'),
-            3: InteractImage(0, 0, 'manual_p4.png'),
+            0: SSInteractImage(0, 0, 'manual_p1.png'),
+            1: SSInteractImage(0, 0, 'manual_p2.png'),
+            2: SSInteractImage(0, 0, 'manual_p3.png'),
+            3: SSInteractImage(0, 0, 'manual_p4.png'),
             }
     INITIAL = 0
 
@@ -102,7 +104,7 @@ class ManualPage(Thing):
             self.scene.things['manual.page_next'].set_display('off')
 
 
-class ManualDetail(Scene):
+class ManualDetail(SSScene):
 
     FOLDER = 'manual'
     NAME = 'manual_detail'
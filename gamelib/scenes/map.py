@@ -8,15 +8,16 @@
    """
 
 from pyntnclick.i18n import _
-from pyntnclick.state import Scene, Thing, Result
+from pyntnclick.state import Result
 from pyntnclick.scenewidgets import (
     InteractRectUnion, InteractUnion, InteractText, InteractNoImage)
 
+from gamelib.ss_state import SSScene, SSThing
 from gamelib.scenes.game_constants import PLAYER_ID
 from gamelib.scenes.game_widgets import make_jim_dialog, make_sentence_dialog
 
 
-class Map(Scene):
+class Map(SSScene):
 
     FOLDER = "map"
     BACKGROUND = 'map.png'
@@ -54,15 +55,21 @@ class Map(Scene):
                     self.game), make_sentence_dialog(PLAYER_ID, self.game)
 
 
-class DoorThing(Thing):
+class DoorThing(SSThing):
 
     # name of destination
     DEST = None
 
+    def get_destination(self):
+        if self.DEST in self.game.scenes:
+            return self.DEST
+        return None
+
     def interact(self, _item):
         """Go to destination."""
-        if self.DEST in self.game.scenes:
-            self.game.change_scene(self.DEST)
+        dest = self.get_destination()
+        if dest is not None:
+            self.game.change_scene(dest)
 
 
 class ToCryo(DoorThing):
@@ -136,6 +143,11 @@ class ToEngine(DoorThing):
 
     INITIAL = 'door'
 
+    def get_destination(self):
+        if not self.game.is_in_inventory('helmet:'):
+            return None
+        return super(ToEngine, self).get_destination()
+
     def interact(self, item):
         if not self.game.is_in_inventory('helmet:'):
             return Result(
@@ -182,7 +194,7 @@ class ToCrew(DoorThing):
     INITIAL = 'door'
 
 
-class InaccessibleArea(Thing):
+class InaccessibleArea(SSThing):
     NAME = 'map.inaccessible'
 
     INTERACTS = {
@@ -203,7 +215,7 @@ class InaccessibleArea(Thing):
                         "meteors."))
 
 
-class HydroponicsArea(Thing):
+class HydroponicsArea(SSThing):
     NAME = 'map.hydroponics'
 
     INTERACTS = {
@@ -1,19 +1,20 @@
 """Mess where crew eat. Fun stuff."""
 
-from random import randint
+from random import random
 
 from pyntnclick.i18n import _
-from pyntnclick.state import Scene, Item, CloneableItem, Thing, Result
+from pyntnclick.state import Result
 from pyntnclick.cursor import CursorSprite
-from pyntnclick.scenewidgets import (
-    InteractNoImage, InteractImage, InteractImageRect, InteractAnimated,
-    GenericDescThing)
+from pyntnclick.scenewidgets import InteractNoImage, InteractImageRect
 
+from gamelib.ss_state import SSCloneableItem, SSItem, SSScene, SSThing
+from gamelib.ss_scenewidgets import (
+    SSGenericDescThing, SSInteractAnimated, SSInteractImage)
 from gamelib.scenes.game_constants import PLAYER_ID
 from gamelib.scenes.game_widgets import Door
 
 
-class Mess(Scene):
+class Mess(SSScene):
 
     FOLDER = "mess"
     BACKGROUND = "mess_hall.png"
@@ -34,14 +35,14 @@ class Mess(Scene):
         self.add_item_factory(DentedCan)
         # Flavour items
         # extra cans on shelf
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             'mess.cans', 1,
             _("A large collection of rusted, useless cans."),
             (
                 (154, 335, 89, 106),
                 (152, 435, 63, 66),
                 )))
-        self.add_thing(GenericDescThing(
+        self.add_thing(SSGenericDescThing(
             'mess.broccoli', 2,
             _("An impressively overgrown broccoli."),
             (
@@ -50,7 +51,7 @@ class Mess(Scene):
                 )))
 
 
-class BaseCan(CloneableItem):
+class BaseCan(SSCloneableItem):
     """Base class for the cans"""
 
     MAX_COUNT = 3
@@ -116,14 +117,14 @@ class DentedCan(BaseCan):
                       soundfile="can_hit.ogg")
 
 
-class CansOnShelf(Thing):
+class CansOnShelf(SSThing):
 
     NAME = "mess.cans"
 
     INTERACTS = {
-        '3cans': InteractImage(165, 209, 'shelf_3_cans.png'),
-        '2cans': InteractImage(165, 209, 'shelf_2_cans.png'),
-        '1cans': InteractImage(165, 209, 'shelf_1_can.png'),
+        '3cans': SSInteractImage(165, 209, 'shelf_3_cans.png'),
+        '2cans': SSInteractImage(165, 209, 'shelf_2_cans.png'),
+        '1cans': SSInteractImage(165, 209, 'shelf_1_can.png'),
         '0cans': InteractNoImage(165, 209, 50, 50),
     }
 
@@ -161,15 +162,15 @@ class CansOnShelf(Thing):
         return _("The contents of these cans look synthetic.")
 
 
-class Tubes(Thing):
+class Tubes(SSThing):
 
     NAME = "mess.tubes"
 
     INTERACTS = {
-        "blocked": InteractImage(250, 130, "blocking_broccoli.png"),
-        "broken": InteractImage(250, 183, "broken_tubes.png"),
-        "replaced": InteractImage(250, 183, "replaced_tubes.png"),
-        "fixed": InteractImage(252, 183, "fixed_tubes.png"),
+        "blocked": SSInteractImage(250, 130, "blocking_broccoli.png"),
+        "broken": SSInteractImage(250, 183, "broken_tubes.png"),
+        "replaced": SSInteractImage(250, 183, "replaced_tubes.png"),
+        "fixed": SSInteractImage(252, 183, "fixed_tubes.png"),
         }
 
     INITIAL = "blocked"
@@ -252,11 +253,11 @@ class Tubes(Thing):
                           % PLAYER_ID)
 
 
-class Boomslang(Thing):
+class Boomslang(SSThing):
     NAME = 'mess.boomslang'
 
     INTERACTS = {
-        'snake': InteractAnimated(455, 241, (
+        'snake': SSInteractAnimated(455, 241, (
             'boomslang_no_tongue.png', 'boomslang_with_tongue.png',
             'boomslang_no_tongue.png', 'boomslang_with_tongue.png',
             'boomslang_no_tongue.png',
@@ -271,28 +272,38 @@ class Boomslang(Thing):
         }
 
     HISS = 'boomslang.ogg'
+    # Average number of seconds between appearances
+    HISS_INTERVAL = 30
 
     def is_interactive(self, tool=None):
         return False
 
-    def animate(self):
+    def is_idle(self):
+        # The snake can appear at any time
+        return False
+
+    def uses_timeline(self):
+        return True
+
+    def advance(self, time):
         hiss = self.game.gd.sound.get_sound(self.HISS)
         if self.get_data('anim_pos') > -1:
-            self.current_interact.animate()
+            self.current_interact.advance(time)
             if self.get_data('anim_pos') > self.current_interact._anim_pos:
                 self._set_interact('no_snake')
                 self.set_data('anim_pos', -1)
             else:
                 self.set_data('anim_pos', self.current_interact._anim_pos)
             return True
-        if randint(0, 30 * self.game.gd.constants.frame_rate) == 0:
+        if random() * self.HISS_INTERVAL < self.scene.timeline.step:
             self._set_interact('snake')
+            self.current_interact.restart()
             self.set_data('anim_pos', 0)
             hiss.play()
         return False
 
 
-class DetergentThing(Thing):
+class DetergentThing(SSThing):
 
     NAME = "mess.detergent"
 
@@ -327,7 +338,7 @@ class DetergentThing(Thing):
                  "They used to hold dishwasher soap.")
 
 
-class DetergentBottle(Item):
+class DetergentBottle(SSItem):
     NAME = 'detergent_bottle'
     INVENTORY_IMAGE = 'bottle_empty.png'
     CURSOR = CursorSprite('bottle_empty_cursor.png', 27, 7)
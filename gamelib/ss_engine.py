@@ -0,0 +1,72 @@
+"""Game engine and top-level game loop for Suspended Sentence."""
+
+import pygame
+import pygame.event
+import pygame.display
+import pygame.time
+from pygame.locals import MOUSEMOTION, QUIT
+
+from pyntnclick.engine import (
+    Engine, ScreenChangeEvent, ScreenEvent, MUSIC_ENDED)
+
+
+def coalesce_motion(events):
+    """Drop all but the last mouse motion event.
+
+       Only the latest mouse position matters, and clicks carry their own
+       position, so there's no point handling every motion in a frame."""
+    motions = [ev for ev in events if ev.type == MOUSEMOTION]
+    if len(motions) < 2:
+        return events
+    return [ev for ev in events
+            if ev.type != MOUSEMOTION or ev is motions[-1]]
+
+
+class SSEngine(Engine):
+
+    def run(self):
+        """Game loop.
+
+           Screens may return a list of rects from draw, in which case only
+           those parts of the display are updated.
+
+           Mouse motion is coalesced to at most one event a frame.
+
+           If the screen is idle after a frame without any events, we wait
+           for the next event before drawing another frame."""
+
+        get_events = pygame.event.get
+        wait_event = pygame.event.wait
+        flip = pygame.display.flip
+        update = pygame.display.update
+        clock = pygame.time.Clock()
+        idle = False
+        while True:
+            if idle:
+                events = [wait_event()] + get_events()
+            else:
+                events = get_events()
+            for ev in coalesce_motion(events):
+                if ev.type == QUIT:
+                    return
+                elif ev.type == MUSIC_ENDED:
+                    self._gd.sound.music_ended()
+                elif ScreenChangeEvent.matches(ev):
+                    self.set_screen(ev.screen_name)
+                elif ScreenEvent.matches(ev):
+                    self.screens[ev.screen_name].process_event(ev.event_name,
+                                                               ev.data)
+                else:
+                    self._screen.dispatch(ev)
+            # Ping the screen / scene
+            self._screen.animate()
+            surface = pygame.display.get_surface()
+            rects = self._screen.draw(surface)
+            if rects is None:
+                flip()
+            elif rects:
+                update(rects)
+            idle = (self._gd.constants.wait_when_idle and not events
+                    and self._screen.is_idle())
+            self._fps = 1000.0 / clock.tick(
+                    self._gd.constants.frame_rate)
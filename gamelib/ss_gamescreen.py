@@ -0,0 +1,249 @@
+"""Game screen for Suspended Sentence, with dirty rect rendering."""
+
+import pygame.draw
+from pygame import Surface
+from pygame.locals import MOUSEMOTION, SRCALPHA
+
+from pyntnclick.gamescreen import GameScreen, SceneWidget, ToolBar
+from pyntnclick.widgets.base import Container, ModalStackContainer
+
+
+class SSModalStackContainer(ModalStackContainer):
+    """Modal stack that draws the widgets under the top one into a cached
+       backdrop, dimmed by the obscure colour.
+
+       Only the top widget can change while it's covering the others, so
+       the backdrop only needs to be rebuilt when the stack changes, or
+       when invalidate_backdrop is called. Each frame only copies the
+       backdrop and draws the top widget over it.
+
+       The bottom widget (the scene) covers the whole stack, so nothing
+       under it is dimmed."""
+
+    def __init__(self, pos, gd, size, obscure_color=None):
+        super(SSModalStackContainer, self).__init__(
+            pos, gd, size, obscure_color)
+        self._obscure = None
+        self._backdrop = None
+        # The widgets the backdrop was drawn from
+        self._backdrop_children = None
+
+    def invalidate_backdrop(self):
+        self._backdrop = None
+
+    def _build_backdrop(self, surface):
+        if self._obscure is None:
+            self._obscure = Surface(self.rect.size, SRCALPHA)
+            self._obscure.fill(self.obscure_color)
+        self._backdrop = Surface(surface.get_size(), 0, surface)
+        self._backdrop_children = self.children[:-1]
+        for child in self._backdrop_children:
+            self._backdrop.blit(self._obscure, self.rect)
+            child.draw(self._backdrop)
+        # Dimmed once more under the top widget
+        self._backdrop.blit(self._obscure, self.rect)
+
+    def draw(self, surface):
+        if self.visible:
+            self.do_prepare()
+            if len(self.children) > 1:
+                if (self._backdrop is None
+                        or self._backdrop_children != self.children[:-1]
+                        or self._backdrop.get_size() != surface.get_size()):
+                    self._build_backdrop(surface)
+                surface.blit(self._backdrop, self.rect, self.rect)
+            else:
+                self._backdrop = None
+            if self.top:
+                self.top.draw(surface)
+
+
+class SSSceneWidget(SceneWidget):
+
+    def draw(self, surface):
+        scene_surface = surface.subsurface(self.rect)
+        # Subsurfaces don't inherit the clip area of their parent
+        scene_surface.set_clip(
+            surface.get_clip().move(-self.rect.left, -self.rect.top))
+        self.scene.draw(scene_surface)
+        if self.is_detail:
+            border = self.rect.inflate(self.DETAIL_BORDER, self.DETAIL_BORDER)
+            pygame.draw.rect(
+                surface, self.DETAIL_BORDER_COLOR, border, self.DETAIL_BORDER)
+        if self.parent.is_top(self):
+            self.scene.draw_description(surface)
+        super(SceneWidget, self).draw(surface)
+
+    def pop_dirty_rects(self):
+        """Collect the scene's dirty rects in screen coordinates"""
+        rects = []
+        for rect in self.scene.pop_dirty_rects():
+            rect = rect.move(self.rect.topleft).clip(self.rect)
+            if rect.width and rect.height:
+                rects.append(rect)
+        return rects
+
+
+class SSGameScreen(GameScreen):
+    """Game screen that only redraws the areas changed by animation and
+       by moving the mouse.
+
+       Moving the mouse over a scene only moves the cursor and changes the
+       description when it moves onto another thing. Any other input, scene
+       changes and messages cause a full redraw, since they can change
+       things all over the screen."""
+
+    def setup(self):
+        super(SSGameScreen, self).setup()
+        self._full_redraw = True
+        # Areas to redraw that aren't in any scene's dirty rects
+        self._dirty_rects = []
+
+    def on_enter(self):
+        super(SSGameScreen, self).on_enter()
+        self._full_redraw = True
+        self.scene_modal.invalidate_backdrop()
+
+    def dispatch(self, ev):
+        top = self.scene_modal.top
+        if (ev.type != MOUSEMOTION or top is None
+                or not self.screen_modal.is_top(self.inner_container)):
+            super(SSGameScreen, self).dispatch(ev)
+            self._full_redraw = True
+            # Moving the mouse only affects the top scene
+            if ev.type != MOUSEMOTION:
+                self.scene_modal.invalidate_backdrop()
+            return
+        thing = top.scene.current_thing
+        old_rect = self._get_description_rect(top)
+        super(SSGameScreen, self).dispatch(ev)
+        if self.scene_modal.top is not top:
+            self._full_redraw = True
+        elif top.scene.current_thing is not thing:
+            new_rect = self._get_description_rect(top)
+            self._dirty_rects.extend(
+                rect for rect in (old_rect, new_rect) if rect is not None)
+
+    def _get_description_rect(self, scene_widget):
+        """The area of the screen the top scene's description covers"""
+        return scene_widget.scene.get_description_rect(
+            self.surface.get_rect())
+
+    def process_event(self, event_name, data):
+        super(SSGameScreen, self).process_event(event_name, data)
+        self._full_redraw = True
+        self.scene_modal.invalidate_backdrop()
+        if self.scene_modal.top:
+            self.scene_modal.top.scene.invalidate_description()
+
+    def reset_game(self, game_state=None):
+        self._clear_all()
+        self.gd.surface_budget.clear()
+        self.game = self.create_initial_state(game_state)
+
+        self.screen_modal = self.container.add(
+            ModalStackContainer(self.container.pos, self.gd,
+                                self.container.size))
+        self.inner_container = self.screen_modal.add(
+            Container(self.container.pos, self.gd, self.container.size))
+
+        toolbar_height = self.gd.constants.button_size
+
+        self.scene_modal = self.inner_container.add(
+            SSModalStackContainer(
+                (0, 0), self.gd,
+                (self.surface_size[0], self.surface_size[1] - toolbar_height)))
+        self.toolbar = self.inner_container.add(
+            ToolBar(
+                (0, self.surface_size[1] - toolbar_height), self.gd,
+                (self.surface_size[0], toolbar_height), self))
+        self.inventory = self.toolbar.inventory
+
+        self.gd.running = True
+
+    def _add_scene(self, scene, detail=False):
+        pos = self.scene_modal.rect.topleft
+        size = self.scene_modal.rect.size
+        if detail:
+            size = scene.get_detail_size()
+            pos = ((self.scene_modal.rect.width - size[0]) // 2,
+                   (self.scene_modal.rect.height - size[1]) // 2)
+
+        # Things may have changed while we were elsewhere
+        scene.invalidate_static_layer()
+        scene.invalidate_description()
+        scene.timeline.pause()
+        self.scene_modal.add(SSSceneWidget(pos, self.gd, size, scene, self,
+                                           detail))
+        self.handle_result(scene.enter())
+        self.gd.surface_budget.scene_shown(
+            scene, [widget.scene for widget in self.scene_modal.children])
+        self.gd.prefetcher.prefetch_from(scene)
+
+    def close_detail(self, detail=None):
+        super(SSGameScreen, self).close_detail(detail)
+        # The scene under the detail view was frozen while it was open
+        # and may have changed it
+        if self.scene_modal.top:
+            self.scene_modal.top.scene.timeline.pause()
+            self.scene_modal.top.scene.invalidate_description()
+
+    def animate(self):
+        """Animate the top scene widget.
+
+           The scenes under it are frozen in the scene modal's backdrop."""
+        if self.scene_modal.top:
+            self.scene_modal.top.animate()
+
+    def is_idle(self):
+        """Can the screen only change in response to input?"""
+        top = self.scene_modal.top
+        return top is None or top.scene.is_idle()
+
+    def _pop_dirty_rects(self):
+        """Merge the dirty rects of all the scenes on screen, and the
+           screen's own"""
+        rects = []
+        screen_rects, self._dirty_rects = self._dirty_rects, []
+        for scene_widget in self.scene_modal.children:
+            scene_rects = scene_widget.pop_dirty_rects()
+            if scene_rects and not self.scene_modal.is_top(scene_widget):
+                self.scene_modal.invalidate_backdrop()
+            if self.scene_modal.is_top(scene_widget):
+                scene_rects.extend(screen_rects)
+            for rect in scene_rects:
+                index = rect.collidelist(rects)
+                while index != -1:
+                    rect.union_ip(rects.pop(index))
+                    index = rect.collidelist(rects)
+                rects.append(rect)
+        return rects
+
+    def draw(self, surface):
+        """Draw the screen.
+
+           Returns the list of rects that need to be updated on the display,
+           or None if the whole display needs updating."""
+        if self._full_redraw or not self.gd.constants.dirty_rects:
+            self._full_redraw = False
+            self._pop_dirty_rects()
+            super(SSGameScreen, self).draw(surface)
+            return None
+        rects = self._pop_dirty_rects()
+        for rect in rects:
+            self.surface.set_clip(rect)
+            self.draw_background()
+            self.container.draw(self.surface)
+            surface.blit(self.surface, rect, rect)
+        self.surface.set_clip(None)
+        return rects + self._draw_cursor(surface)
+
+    def _draw_cursor(self, surface):
+        """Redraw the cursor without drawing over itself."""
+        old_rect = self._loaded_cursor.rect.copy()
+        # Restore what was under the cursor before drawing it again
+        surface.blit(self.surface, old_rect, old_rect)
+        self.set_cursor(self.game.tool)
+        self._loaded_cursor.set_highlight(self.cursor_highlight())
+        self._cursor_group.update()
+        return self._cursor_group.draw(surface) + [old_rect]
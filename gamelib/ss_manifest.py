@@ -0,0 +1,222 @@
+"""The assets used by each scene, found from the scene definitions.
+
+   The manifest is built from the classes in the scene modules, and their
+   source, without setting any of them up:
+
+   * Scenes have their BACKGROUND and MUSIC.
+   * Things are in the scenes (or things) whose code adds them, and have
+     the images of their INTERACTS. Things that aren't added anywhere we
+     can see are put in the first scene of their module.
+   * Sound files named in a class (Result(soundfile=...) and the like)
+     belong to the scenes the class is in.
+   * Items have their INVENTORY_IMAGE and CursorSprite, which are needed
+     wherever the player is, so they have their own entry.
+
+   Names are relative to the data folder, '/' separated, without any
+   localisation (the resource loader still picks the localised version).
+
+   gamelib.tools.manifest writes the manifest to MANIFEST_NAME in the data
+   folder when building the game. Without that file, it's built when it's
+   needed."""
+
+import ast
+import inspect
+import json
+import textwrap
+from importlib import import_module
+
+from pyntnclick.resources import ResourceNotFound
+from pyntnclick.scenewidgets import (
+    InteractAnimated, InteractImage, InteractUnion)
+from pyntnclick.state import Item, Thing
+
+MANIFEST_NAME = 'manifest.json'
+
+
+def scene_modules(gd):
+    return [import_module('%s.%s' % (gd.SCENE_MODULE, name))
+            for name in gd.SCENE_LIST]
+
+
+def module_classes(module, base):
+    """The subclasses of base in a module, including imported ones"""
+    return [obj for obj in vars(module).values()
+            if inspect.isclass(obj) and issubclass(obj, base)]
+
+
+def interact_images(interact):
+    """The names of the images an interact draws"""
+    if isinstance(interact, InteractUnion):
+        names = []
+        for sub_interact in interact._interact_list:
+            names.extend(interact_images(sub_interact))
+        return names
+    if isinstance(interact, InteractAnimated):
+        return list(interact._names)
+    if isinstance(interact, InteractImage):
+        return [interact._image_name]
+    return []
+
+
+def _string_value(node):
+    value = getattr(node, 'value', getattr(node, 's', None))
+    if isinstance(value, str):
+        return value
+    return None
+
+
+def read_class_code(cls):
+    """Find the classes added as things and the sound files named in the
+       code of a class.
+
+       Returns a list of class names and a list of sound file names."""
+    try:
+        source = textwrap.dedent(inspect.getsource(cls))
+    except (IOError, OSError, TypeError):
+        return [], []
+    added = []
+    sounds = []
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Call):
+            func = node.func
+            if (isinstance(func, ast.Attribute)
+                    and func.attr == 'add_thing' and node.args
+                    and isinstance(node.args[0], ast.Call)
+                    and isinstance(node.args[0].func, ast.Name)):
+                added.append(node.args[0].func.id)
+        value = _string_value(node)
+        if value is not None and value.endswith('.ogg'):
+            sounds.append(value)
+    return added, sounds
+
+
+def scene_name(scene_cls):
+    return scene_cls.NAME if scene_cls.NAME is not None else scene_cls.FOLDER
+
+
+def _image_name(folder, name):
+    return 'images/%s/%s' % (folder, name)
+
+
+def build_manifest(gd):
+    """Build the manifest of the assets of each scene.
+
+       Returns a dict with a 'scenes' entry, mapping each scene (and
+       detail view) name to its 'background', 'images', 'music' and
+       'sounds', and an 'items' entry with the 'images' and 'sounds' of
+       the items."""
+    scenes = {}
+    items = {'images': set(), 'sounds': set()}
+    for module in scene_modules(gd):
+        scene_classes = (list(getattr(module, 'SCENES', []))
+                         + list(getattr(module, 'DETAIL_VIEWS', [])))
+        # Maps class -> the scene classes it's in
+        placed = {}
+        code = {}
+
+        def place(cls, scene_cls):
+            if scene_cls in placed.setdefault(cls, set()):
+                return
+            placed[cls].add(scene_cls)
+            if cls not in code:
+                code[cls] = read_class_code(cls)
+            for name in code[cls][0]:
+                added = getattr(module, name, None)
+                if inspect.isclass(added) and issubclass(added, Thing):
+                    place(added, scene_cls)
+
+        for scene_cls in scene_classes:
+            place(scene_cls, scene_cls)
+        for thing_cls in module_classes(module, Thing):
+            if thing_cls.__module__ == module.__name__ and (
+                    thing_cls not in placed) and scene_classes:
+                place(thing_cls, scene_classes[0])
+
+        for scene_cls in scene_classes:
+            scenes[scene_name(scene_cls)] = {
+                'background': (
+                    _image_name(scene_cls.FOLDER, scene_cls.BACKGROUND)
+                    if scene_cls.BACKGROUND else None),
+                'images': set(),
+                'music': ['sounds/%s' % name
+                          for name in getattr(scene_cls, 'MUSIC', [])],
+                'sounds': set(),
+            }
+        for cls, in_scenes in placed.items():
+            for scene_cls in in_scenes:
+                entry = scenes[scene_name(scene_cls)]
+                entry['sounds'].update(
+                    'sounds/%s' % name for name in code[cls][1]
+                    if 'sounds/%s' % name not in entry['music'])
+                if issubclass(cls, Thing):
+                    folder = cls.FOLDER or scene_cls.FOLDER
+                    for interact in cls.INTERACTS.values():
+                        entry['images'].update(
+                            _image_name(folder, name)
+                            for name in interact_images(interact))
+
+        for item_cls in module_classes(module, Item):
+            if item_cls.INVENTORY_IMAGE:
+                items['images'].add(
+                    _image_name('items', item_cls.INVENTORY_IMAGE))
+            if item_cls.CURSOR is not None:
+                items['images'].add(
+                    _image_name('items', item_cls.CURSOR.filename))
+            items['sounds'].update(
+                'sounds/%s' % name for name in read_class_code(item_cls)[1])
+
+    for entry in list(scenes.values()) + [items]:
+        for key in ('images', 'sounds'):
+            entry[key] = sorted(entry[key])
+    return {'scenes': scenes, 'items': items}
+
+
+def write_manifest(manifest, path):
+    with open(path, 'w') as manifest_file:
+        json.dump(manifest, manifest_file, indent=1, sort_keys=True)
+
+
+def load_manifest(gd):
+    """Load the manifest written when the game was built, or build it if
+       there isn't one."""
+    resource = gd.resource
+    try:
+        path = resource.get_resource_path(MANIFEST_NAME)
+    except ResourceNotFound:
+        return build_manifest(gd)
+    return json.loads(bytes(resource.read_resource(path)).decode('utf-8'))
+
+
+def manifest_names(manifest, kind):
+    """All the names of a kind of asset ('images', 'music' or 'sounds')"""
+    names = set()
+    for entry in list(manifest['scenes'].values()) + [manifest['items']]:
+        if kind == 'images' and entry.get('background'):
+            names.add(entry['background'])
+        names.update(entry.get(kind, []))
+    return sorted(names)
+
+
+def find_missing(gd, manifest):
+    """The names in the manifest the resource loader can't find"""
+    missing = []
+    for kind in ('images', 'music', 'sounds'):
+        for name in manifest_names(manifest, kind):
+            try:
+                gd.resource.get_resource_path(name)
+            except ResourceNotFound:
+                missing.append(name)
+    return missing
+
+
+def find_images(gd, manifest=None):
+    """The paths of the images of the scenes, things and items"""
+    if manifest is None:
+        manifest = load_manifest(gd)
+    paths = []
+    for name in manifest_names(manifest, 'images'):
+        try:
+            paths.append(gd.resource.get_resource_path(name))
+        except ResourceNotFound:
+            pass
+    return paths
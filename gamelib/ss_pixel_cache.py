@@ -0,0 +1,111 @@
+"""On-disk cache of decoded image pixels for Suspended Sentence."""
+
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+
+import pygame
+from pygame.locals import SRCALPHA
+
+# Each cached image starts with PIXEL_MAGIC, the SHA-1 hash of the image
+# file it was decoded from, its size and the byte order of its pixels (as
+# used by pygame.image.frombuffer), padded to PIXEL_HEADER_SIZE. The
+# pixels follow, 4 bytes each, without any padding between rows.
+PIXEL_MAGIC = b'SSPIX001'
+PIXEL_HEADER = struct.Struct('<8s20sII4s')
+PIXEL_HEADER_SIZE = 64
+
+# The byte orders frombuffer can use for pixels with alpha
+PIXEL_FORMATS = ('BGRA', 'RGBA', 'ARGB')
+
+
+def display_pixel_format():
+    """The byte order of pixels in images converted for the display.
+
+       Returns None if frombuffer can't create images in that format."""
+    probe = pygame.Surface((1, 1), SRCALPHA, 32)
+    if pygame.display.get_surface() is not None:
+        probe = probe.convert_alpha(pygame.display.get_surface())
+    for pixel_format in PIXEL_FORMATS:
+        image = pygame.image.frombuffer(
+            pygame.image.tostring(probe, pixel_format), (1, 1), pixel_format)
+        if (image.get_masks() == probe.get_masks()
+                and image.get_bitsize() == probe.get_bitsize()):
+            return pixel_format
+    return None
+
+
+class PixelCache(object):
+    """Decoded images, stored in the display's pixel format.
+
+       Each image file has a cache file named after its path, which holds
+       the hash of the contents it was decoded from. If the image file
+       changes, it's decoded again and the cache file is replaced.
+
+       Cached images are memory-mapped, so the images share the pages of
+       the cache file until they are drawn on."""
+
+    def __init__(self, folder, pixel_format=None):
+        self.folder = folder
+        if pixel_format is None:
+            pixel_format = display_pixel_format()
+        self.pixel_format = pixel_format
+
+    def _cache_path(self, path):
+        name = hashlib.sha1(path.encode('utf-8')).hexdigest()
+        return os.path.join(self.folder, name + '.pixels')
+
+    def get(self, path, data):
+        """The image decoded from path, if it was cached from the same data.
+
+           Returns None if it isn't cached."""
+        if self.pixel_format is None:
+            return None
+        try:
+            with open(self._cache_path(path), 'rb') as cache_file:
+                pixels = mmap.mmap(
+                    cache_file.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (IOError, OSError, ValueError):
+            return None
+        if len(pixels) < PIXEL_HEADER_SIZE:
+            return None
+        magic, digest, width, height, pixel_format = (
+            PIXEL_HEADER.unpack_from(pixels))
+        if (magic != PIXEL_MAGIC
+                or pixel_format != self.pixel_format.encode('ascii')
+                or len(pixels) != PIXEL_HEADER_SIZE + width * height * 4
+                or digest != hashlib.sha1(data).digest()):
+            return None
+        # The image keeps the map open
+        return pygame.image.frombuffer(
+            memoryview(pixels)[PIXEL_HEADER_SIZE:], (width, height),
+            self.pixel_format)
+
+    def put(self, path, data, image):
+        """Cache the image decoded from path, which contained data.
+
+           Palettised images aren't cached, as they're kept as 8-bit
+           images, and are quick to decode anyway."""
+        if self.pixel_format is None or image.get_bitsize() == 8:
+            return
+        header = PIXEL_HEADER.pack(
+            PIXEL_MAGIC, hashlib.sha1(data).digest(), image.get_width(),
+            image.get_height(), self.pixel_format.encode('ascii'))
+        cache_path = self._cache_path(path)
+        temp_path = None
+        try:
+            if not os.path.isdir(self.folder):
+                os.makedirs(self.folder)
+            # Images can be loaded by more than one thread at a time
+            fd, temp_path = tempfile.mkstemp(dir=self.folder)
+            with os.fdopen(fd, 'wb') as cache_file:
+                cache_file.write(header.ljust(PIXEL_HEADER_SIZE, b'\0'))
+                cache_file.write(
+                    pygame.image.tostring(image, self.pixel_format))
+            os.rename(temp_path, cache_path)
+        except (IOError, OSError):
+            # We can do without the cache
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
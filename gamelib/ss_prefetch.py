@@ -0,0 +1,124 @@
+"""Background loading of the assets of the scenes the player can go to."""
+
+import threading
+
+try:
+    from queue import Queue
+except ImportError:
+    from Queue import Queue
+
+import pygame
+
+from pyntnclick.resources import ResourceNotFound
+
+
+def sound_size(sound):
+    """The memory used by a loaded sound, in bytes"""
+    mixer = pygame.mixer.get_init()
+    if mixer is None:
+        return 0
+    frequency, size, channels = mixer
+    return int(sound.get_length() * frequency) * channels * abs(size) // 8
+
+
+class Prefetcher(object):
+    """Loads the backgrounds, thing images, sounds and music of the scenes
+       the player can get to from the current one in a worker thread, so
+       they're in memory by the time the player changes scene. The assets
+       of each scene come from the asset manifest (see gamelib.ss_manifest).
+
+       Images and sounds are loaded into their caches until the ones still
+       in memory add up to the memory budget (in bytes); the images freed
+       when the player leaves scenes (see gamelib.ss_surfaces) don't
+       count. Music is streamed from its file when it
+       plays, so the files are only read ahead, to get them into the OS's
+       file cache."""
+
+    def __init__(self, gd, budget):
+        self._gd = gd
+        self._resource = gd.resource
+        self._sound = gd.sound
+        self._manifest = None
+        self.budget = budget
+        # Maps the path of each prefetched image or sound -> its size
+        self._prefetched = {}
+        self._lock = threading.Lock()
+        self._queue = Queue()
+        self._thread = None
+        # Prefetches queued before the player last changed scene are
+        # skipped
+        self._generation = 0
+
+    @property
+    def used(self):
+        """The memory used by the prefetched images and sounds that are
+           still cached"""
+        with self._lock:
+            for path in list(self._prefetched):
+                if not (self._resource.is_image_cached(path)
+                        or path in self._sound.sound_cache):
+                    del self._prefetched[path]
+            return sum(self._prefetched.values())
+
+    def _add_prefetched(self, path, size):
+        with self._lock:
+            self._prefetched[path] = size
+
+    def prefetch_from(self, scene):
+        """Prefetch the assets of the scenes reachable from scene"""
+        if self.used >= self.budget:
+            return
+        if self._manifest is None:
+            self._manifest = self._gd.get_manifest()
+        self._generation += 1
+        for name in scene.get_destinations():
+            entry = self._manifest['scenes'].get(name)
+            if entry is not None:
+                self._queue.put((self._generation, entry))
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name='prefetch')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def wait(self):
+        """Wait for everything queued to be prefetched"""
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            generation, entry = self._queue.get()
+            try:
+                if generation == self._generation:
+                    self.prefetch_scene(entry)
+            except (ResourceNotFound, pygame.error, IOError, OSError):
+                # It'll fail again when it's needed, in the main thread
+                pass
+            finally:
+                self._queue.task_done()
+
+    def prefetch_scene(self, entry):
+        """Prefetch the assets in a scene's manifest entry"""
+        images = entry['images']
+        if entry['background']:
+            images = [entry['background']] + images
+        for name in images:
+            if self.used >= self.budget:
+                break
+            path = self._resource.get_resource_path(name)
+            if not self._resource.is_image_cached(path):
+                image = self._resource.get_image(name.split('/', 1)[1])
+                self._add_prefetched(path, image.get_width()
+                                     * image.get_height()
+                                     * image.get_bytesize())
+        for name in entry['sounds']:
+            if self.used >= self.budget or not self._sound.sound_enabled:
+                break
+            path = self._resource.get_resource_path(name)
+            if path not in self._sound.sound_cache:
+                self._add_prefetched(path, sound_size(
+                    self._sound.get_sound(name.split('/', 1)[1])))
+        for name in entry['music']:
+            path = self._sound.get_music(name.split('/', 1)[1])
+            if path is not None:
+                self._resource.read_resource(path)
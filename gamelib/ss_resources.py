@@ -0,0 +1,540 @@
+"""Resource loading for Suspended Sentence."""
+
+import hashlib
+import io
+import json
+import mmap
+import multiprocessing
+import os
+import posixpath
+import struct
+import weakref
+
+from pkg_resources import resource_filename
+
+import pygame
+import pygame.font
+import pygame.mask
+from pygame.locals import SRCALPHA
+
+from pyntnclick.resources import Resources, ResourceNotFound
+
+# Name of the index written next to the images by gamelib.tools.pack_atlases
+ATLAS_INDEX = 'atlases.json'
+
+# Name of the index of image hashes written into the data folder by
+# gamelib.tools.hash_images. It maps the name of each image (relative to the
+# data folder, '/' separated) to the SHA-1 hash of its decoded pixels.
+IMAGE_HASHES = 'image_hashes.json'
+
+# Name of the archive written into the data folder by gamelib.tools.pack_data
+ARCHIVE_NAME = 'data.pak'
+
+# The archive starts with ARCHIVE_MAGIC and the number of entries in the
+# index, which follows straight after. Each entry is the offset and size of
+# a file, and the length of its name, followed by the name (utf-8, relative
+# to the data folder, '/' separated). The offsets are from the start of the
+# archive.
+ARCHIVE_MAGIC = b'SSPAK001'
+ARCHIVE_HEADER = struct.Struct('<8sI')
+ARCHIVE_ENTRY = struct.Struct('<QQH')
+
+
+def decode_image(job):
+    """Decode an image file, in a worker process.
+
+       Returns the path and size of the image, and its pixels, palette and
+       colour key. Palettised images (see gamelib.tools.palettise) come
+       back as palette indices, with the index of their colour key, if
+       any; other images come back as RGBA pixels, with no palette."""
+    path, data = job
+    if data is None:
+        image = pygame.image.load(path)
+    else:
+        image = pygame.image.load(BufferFile(data), path)
+    if image.get_bitsize() == 8:
+        colorkey = image.get_colorkey()
+        if colorkey is not None:
+            colorkey = image.map_rgb(colorkey)
+        return (path, image.get_size(), pygame.image.tostring(image, 'P'),
+                [tuple(colour) for colour in image.get_palette()], colorkey)
+    return (path, image.get_size(), pygame.image.tostring(image, 'RGBA'),
+            None, None)
+
+
+class BufferFile(io.RawIOBase):
+    """A read-only file that reads straight out of a buffer (such as a part
+       of the memory-mapped data archive), without copying the rest of it"""
+
+    def __init__(self, buffer):
+        super(BufferFile, self).__init__()
+        self._view = memoryview(buffer)
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, b):
+        data = self._view[self._pos:self._pos + len(b)]
+        b[:len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError('negative seek position %d' % (offset,))
+        self._pos = offset
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def close(self):
+        if not self.closed:
+            self._view.release()
+        super(BufferFile, self).close()
+
+
+class Archive(object):
+    """Files packed into a single memory-mapped archive"""
+
+    def __init__(self, path):
+        self.path = path
+        self.folder = os.path.dirname(path)
+        with open(path, 'rb') as archive_file:
+            self._map = mmap.mmap(
+                archive_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        magic, count = ARCHIVE_HEADER.unpack_from(self._map, 0)
+        if magic != ARCHIVE_MAGIC:
+            raise ValueError('%s is not a data archive' % (path,))
+        # Maps name -> (offset, size)
+        self._index = {}
+        pos = ARCHIVE_HEADER.size
+        for i in range(count):
+            offset, size, name_len = ARCHIVE_ENTRY.unpack_from(self._map, pos)
+            pos += ARCHIVE_ENTRY.size
+            name = self._view[pos:pos + name_len].tobytes().decode('utf-8')
+            pos += name_len
+            self._index[name] = (offset, size)
+
+    def name(self, path):
+        """The name in the archive of a file in the data folder"""
+        name = os.path.relpath(path, self.folder)
+        return '/'.join(name.split(os.sep))
+
+    def __contains__(self, path):
+        return self.name(path) in self._index
+
+    def get_data(self, path):
+        """A buffer of the contents of a file, without copying them"""
+        offset, size = self._index[self.name(path)]
+        return self._view[offset:offset + size]
+
+    def names(self):
+        return sorted(self._index)
+
+
+class SSResources(Resources):
+    """Resources that load animation frames out of sprite atlases, and
+       files out of the data archive.
+
+       If a folder of images contains an atlas index, the frames listed in
+       it are loaded as subsurfaces of a single atlas image, rather than
+       from their own files. Frames with a localised override are not in
+       the atlas of their folder, so are still loaded from their own
+       files.
+
+       If the game's data folder contains a data archive, files that
+       aren't in the data folder itself are read from the archive. Without
+       one (when developing), everything is loaded from the data folder.
+
+       The localised files for our language are indexed the first time a
+       resource is looked up, and each resource name is only looked up
+       once, so finding a file doesn't check for it in each of the places
+       it could be.
+
+       Palettised images (see gamelib.tools.palettise) are kept as 8-bit
+       surfaces, rather than converted for the display.
+
+       Images with the same pixels share a single surface. They're matched
+       by the hashes in the image hash index, or by the hashes of their
+       files, if there's no index."""
+
+    # Where a file is loaded from
+    FILE = 'file'
+    ARCHIVE = 'archive'
+
+    def __init__(self, resource_module, language=None):
+        super(SSResources, self).__init__(resource_module, language)
+        # Maps image folder path -> {frame name: (atlas path, rect)}
+        self._atlas_indexes = {}
+        self._trimmed_image_cache = {}
+        self._mask_cache = {}
+        self._pixel_cache = None
+        # Maps image hash -> image loaded by preload_images, but not yet
+        # used
+        self._preloaded = {}
+        self._data_folder = resource_filename(resource_module, '')
+        # Maps name -> hash, from the image hash index
+        self._image_hashes = None
+        # Maps hash -> the surface shared by the images with that hash,
+        # while it's in use
+        self._unique_images = weakref.WeakValueDictionary()
+        # Maps resource name -> path
+        self._resource_paths = {}
+        # Maps (locale, folder, name) -> path of the localised files
+        self._overrides = None
+        self._archive = None
+        archive_path = os.path.join(self._data_folder, ARCHIVE_NAME)
+        if os.path.exists(archive_path):
+            self._archive = Archive(archive_path)
+        # Maps path -> where the file is: FILE, ARCHIVE or None, if it
+        # doesn't exist
+        self._locations = {}
+
+    def _get_location(self, path):
+        """Find where a file is, the first time it's looked for. Loose files
+           in the data folder win over the archive."""
+        if path not in self._locations:
+            location = None
+            if os.path.exists(path):
+                location = self.FILE
+            elif self._archive is not None and path in self._archive:
+                location = self.ARCHIVE
+            self._locations[path] = location
+        return self._locations[path]
+
+    def resource_exists(self, path):
+        return self._get_location(path) is not None
+
+    def in_archive(self, path):
+        """Is the file only available from the data archive?"""
+        return self._get_location(path) == self.ARCHIVE
+
+    def open_resource(self, path):
+        """Open a file from the data folder or the data archive. Files in
+           the archive are read straight out of it."""
+        if self.in_archive(path):
+            return BufferFile(self._archive.get_data(path))
+        return open(path, 'rb')
+
+    def get_resource_path(self, *resource_path_fragments):
+        resource_name = '/'.join(resource_path_fragments)
+        path = self._resource_paths.get(resource_name)
+        if path is None:
+            path = self._find_resource(resource_name)
+            self._resource_paths[resource_name] = path
+        return path
+
+    def _find_resource(self, resource_name):
+        folder, name = posixpath.split(resource_name)
+        overrides = self._get_overrides()
+        for locale in self._get_locales():
+            if (locale, folder, name) in overrides:
+                return overrides[(locale, folder, name)]
+        resource_name = os.path.join(*resource_name.split('/'))
+        path = os.path.join(self._data_folder, resource_name)
+        if self.resource_exists(path):
+            return path
+        # Fall back to pyntnclick's defaults
+        for path in self.get_paths(resource_name):
+            if self.resource_exists(path):
+                return path
+        raise ResourceNotFound(resource_name)
+
+    def _get_locales(self):
+        """The locales we use the localised files of, most specific first"""
+        locales = []
+        for locale in (self.lang_dialect, self.language):
+            if locale and locale not in locales:
+                locales.append(locale)
+        return locales
+
+    def _get_overrides(self):
+        """Index the localised files in the data folder and the data archive
+           for the locales we use, by (locale, folder, name)."""
+        if self._overrides is None:
+            overrides = {}
+            for locale in self._get_locales():
+                locale_folder = os.path.join(self._data_folder, locale)
+                names = []
+                if self._archive is not None:
+                    names.extend(
+                        archive_name[len(locale) + 1:]
+                        for archive_name in self._archive.names()
+                        if archive_name.startswith(locale + '/'))
+                for dirpath, dirnames, filenames in os.walk(locale_folder):
+                    folder = os.path.relpath(dirpath, locale_folder)
+                    parts = [] if folder == os.curdir else folder.split(os.sep)
+                    names.extend('/'.join(parts + [filename])
+                                 for filename in filenames)
+                for name in names:
+                    path = os.path.join(locale_folder, *name.split('/'))
+                    key = (locale,) + posixpath.split(name)
+                    overrides[key] = path
+            # Other threads may be finding resources too
+            self._overrides = overrides
+        return self._overrides
+
+    def read_resource(self, path):
+        """The contents of a file from the data folder or the data archive"""
+        if self.in_archive(path):
+            return self._archive.get_data(path)
+        with open(path, 'rb') as resource_file:
+            return resource_file.read()
+
+    def get_image_hash(self, path):
+        """A hash that's the same for image files with the same pixels"""
+        if self._image_hashes is None:
+            self._image_hashes = {}
+            index_path = os.path.join(self._data_folder, IMAGE_HASHES)
+            if self.resource_exists(index_path):
+                with self.open_resource(index_path) as index_file:
+                    self._image_hashes = json.loads(
+                        index_file.read().decode('utf-8'))
+        name = '/'.join(
+            os.path.relpath(path, self._data_folder).split(os.sep))
+        if name not in self._image_hashes:
+            self._image_hashes[name] = 'file:' + hashlib.sha1(
+                self.read_resource(path)).hexdigest()
+        return self._image_hashes[name]
+
+    def load_unique_image(self, path):
+        """Load an image (out of its atlas, if it's in one), sharing the
+           surface with any image with the same pixels that's already
+           loaded."""
+        image_hash = self.get_image_hash(path)
+        image = self._unique_images.get(image_hash)
+        if image is None:
+            image = self._get_atlas_frame(path)
+            if image is None:
+                image = self.load_image(path)
+            self._unique_images[image_hash] = image
+        return image
+
+    def set_pixel_cache(self, pixel_cache):
+        """Use a PixelCache for the images we decode"""
+        self._pixel_cache = pixel_cache
+
+    def preload_images(self, paths, processes=None):
+        """Decode image files in a pool of worker processes, ready for
+           load_image.
+
+           The workers send back the decoded pixels, which are made into
+           surfaces here. Images in the pixel cache aren't decoded again.
+           processes defaults to the number of CPUs."""
+        jobs = []
+        contents = {}
+        # Maps path -> hash of the images to decode. Only one of the
+        # images with the same pixels is decoded.
+        hashes = {}
+        queued = set()
+        for path in paths:
+            frame = self._get_atlas_index(os.path.dirname(path)).get(
+                os.path.basename(path))
+            if frame is not None:
+                path = frame[0]
+            if path in self._image_cache or path in hashes:
+                continue
+            image_hash = self.get_image_hash(path)
+            if (image_hash in self._preloaded
+                    or image_hash in self._unique_images
+                    or image_hash in queued):
+                continue
+            hashes[path] = image_hash
+            queued.add(image_hash)
+            if self._pixel_cache is not None:
+                contents[path] = self.read_resource(path)
+                image = self._pixel_cache.get(path, contents[path])
+                if image is not None:
+                    self._preloaded[image_hash] = image
+                    continue
+            if self.in_archive(path):
+                jobs.append((path, bytes(self.read_resource(path))))
+            else:
+                # Cheaper for the worker to read it than to send it
+                jobs.append((path, None))
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        if processes > 1 and len(jobs) > 1:
+            pool = multiprocessing.Pool(min(processes, len(jobs)))
+            try:
+                results = list(pool.imap_unordered(decode_image, jobs, 4))
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = [decode_image(job) for job in jobs]
+        for path, size, pixels, palette, colorkey in results:
+            if palette is None:
+                image = self._convert(
+                    pygame.image.fromstring(pixels, size, 'RGBA'))
+            else:
+                image = pygame.image.fromstring(pixels, size, 'P')
+                image.set_palette(palette)
+                if colorkey is not None:
+                    image.set_colorkey(colorkey)
+            if self._pixel_cache is not None:
+                self._pixel_cache.put(path, contents[path], image)
+            self._preloaded[hashes[path]] = image
+
+    def load_image(self, path):
+        """Load an image file, converted for the display if CONVERT_ALPHA is
+           set, without caching it in memory."""
+        if self._preloaded:
+            image = self._preloaded.pop(self.get_image_hash(path), None)
+            if image is not None:
+                return image
+        if self._pixel_cache is None:
+            if self.in_archive(path):
+                image = pygame.image.load(self.open_resource(path), path)
+            else:
+                image = pygame.image.load(path)
+            return self._convert(image)
+        data = self.read_resource(path)
+        image = self._pixel_cache.get(path, data)
+        if image is None:
+            image = self._convert(pygame.image.load(BufferFile(data), path))
+            self._pixel_cache.put(path, data, image)
+        return image
+
+    def _convert(self, image):
+        if image.get_bitsize() == 8:
+            # A palettised image, which is blitted as it is
+            return image
+        if self.CONVERT_ALPHA:
+            return image.convert_alpha(pygame.display.get_surface())
+        return image
+
+    def drawable_copy(self, image):
+        """A copy of an image to draw on.
+
+           Palettised images are copied to 32-bit images, so what's drawn
+           on them isn't limited to the colours in their palette."""
+        if image.get_bitsize() != 8:
+            return image.copy()
+        copy = pygame.Surface(image.get_size(), SRCALPHA, 32)
+        copy.fill((0, 0, 0, 0))
+        copy.blit(image, (0, 0))
+        return self._convert(copy)
+
+    def is_image_cached(self, path):
+        return path in self._image_cache
+
+    def get_image(self, *image_name_fragments, **kw):
+        basedir = kw.get('basedir', 'images')
+        image_path = self.get_resource_path(basedir, *image_name_fragments)
+        if image_path not in self._image_cache:
+            self._image_cache[image_path] = self.load_unique_image(
+                image_path)
+        transforms = kw.get('transforms', ())
+        key = (image_path, transforms)
+        if transforms and key not in self._transformed_image_cache:
+            # Transforms draw on the image, so palettised images need to be
+            # copied first
+            image = self._image_cache[image_path]
+            if image.get_bitsize() == 8:
+                image = self.drawable_copy(image)
+            for transform in transforms:
+                image = transform(image)
+            self._transformed_image_cache[key] = image
+        return super(SSResources, self).get_image(
+            *image_name_fragments, **kw)
+
+    def forget_image(self, *image_name_fragments, **kw):
+        """Drop an image from the caches, so it can be freed once nothing
+           else uses it. It's loaded again the next time it's asked for."""
+        basedir = kw.get('basedir', 'images')
+        image_path = self.get_resource_path(basedir, *image_name_fragments)
+        self._image_cache.pop(image_path, None)
+        for key in list(self._transformed_image_cache):
+            if key[0] == image_path:
+                del self._transformed_image_cache[key]
+        trimmed = self._trimmed_image_cache.pop(image_path, None)
+        if trimmed is not None:
+            key = ('trimmed', self.get_image_hash(image_path))
+            if self._trimmed_image_cache.get(key) is trimmed:
+                del self._trimmed_image_cache[key]
+        mask = self._mask_cache.pop(image_path, None)
+        if mask is not None:
+            key = ('mask', self.get_image_hash(image_path))
+            if self._mask_cache.get(key) is mask:
+                del self._mask_cache[key]
+
+    def get_font(self, file_name, font_size, basedir=None):
+        if basedir is None:
+            basedir = 'fonts'
+        key = (basedir, file_name, font_size)
+        if key not in self._font_cache:
+            font_path = self.get_resource_path(basedir, file_name)
+            if self.in_archive(font_path):
+                # The font keeps reading from the file it's given
+                self._font_cache[key] = pygame.font.Font(
+                    self.open_resource(font_path), font_size)
+        return super(SSResources, self).get_font(
+            file_name, font_size, basedir)
+
+    def get_trimmed_image(self, *image_name_fragments):
+        """Load an image cropped to the area that isn't fully transparent.
+
+           Returns the image, its offset within the original image and the
+           size of the original image."""
+        image_path = self.get_resource_path('images', *image_name_fragments)
+        if image_path not in self._trimmed_image_cache:
+            image = self.load_unique_image(image_path)
+            # Images with the same pixels share the trimmed copy too
+            key = ('trimmed', self.get_image_hash(image_path))
+            trimmed = self._trimmed_image_cache.get(key)
+            if trimmed is None:
+                size = image.get_size()
+                bounds = image.get_bounding_rect()
+                if bounds.size != size:
+                    # Copy the area we want, so the full image can be freed
+                    image = image.subsurface(bounds).copy()
+                trimmed = (image, bounds.topleft, size)
+                self._trimmed_image_cache[key] = trimmed
+            self._trimmed_image_cache[image_path] = trimmed
+        return self._trimmed_image_cache[image_path]
+
+    def get_trimmed_mask(self, *image_name_fragments):
+        """Get the mask of the opaque parts of a trimmed image."""
+        image_path = self.get_resource_path('images', *image_name_fragments)
+        if image_path not in self._mask_cache:
+            key = ('mask', self.get_image_hash(image_path))
+            if key not in self._mask_cache:
+                image = self.get_trimmed_image(*image_name_fragments)[0]
+                self._mask_cache[key] = pygame.mask.from_surface(image)
+            self._mask_cache[image_path] = self._mask_cache[key]
+        return self._mask_cache[image_path]
+
+    def _get_atlas_frame(self, image_path):
+        folder, name = os.path.split(image_path)
+        index = self._get_atlas_index(folder)
+        if name not in index:
+            return None
+        atlas_path, rect = index[name]
+        if atlas_path not in self._image_cache:
+            self._image_cache[atlas_path] = self.load_image(atlas_path)
+        return self._image_cache[atlas_path].subsurface(rect)
+
+    def _get_atlas_index(self, folder):
+        if folder not in self._atlas_indexes:
+            index = {}
+            index_path = os.path.join(folder, ATLAS_INDEX)
+            if self.resource_exists(index_path):
+                with self.open_resource(index_path) as index_file:
+                    atlases = json.loads(index_file.read().decode('utf-8'))
+                for atlas_name, frames in atlases.items():
+                    atlas_path = os.path.join(folder, atlas_name)
+                    for name, rect in frames.items():
+                        index[name] = (atlas_path, pygame.Rect(rect))
+            self._atlas_indexes[folder] = index
+        return self._atlas_indexes[folder]
@@ -0,0 +1,73 @@
+"""Interactive scene elements for Suspended Sentence."""
+
+from pygame import Rect
+
+from pyntnclick.scenewidgets import (
+    InteractAnimated, InteractImage, TakeableThing, GenericDescThing)
+
+from gamelib.ss_state import SSThing
+
+
+class SSInteractImage(InteractImage):
+    """Image interact that only draws the part of the image that isn't
+       transparent.
+
+       The interact rect still covers the whole image, but things only
+       count points on the opaque parts of the image as inside them (see
+       SSThing.hits_image)."""
+
+    def set_thing(self, thing):
+        self.image, offset, size = thing.resource.get_trimmed_image(
+            thing.folder, self._image_name)
+        self.mask = thing.resource.get_trimmed_mask(
+            thing.folder, self._image_name)
+        self.interact_rect = Rect(self._pos, size)
+        self.rect = Rect(self.interact_rect.move(offset).topleft,
+                         self.image.get_size())
+
+
+class SSInteractAnimated(InteractAnimated):
+    """Animation that changes images with the time on its scene's timeline.
+
+       The delay is still given in frames, at the game's frame rate, so
+       the animation looks the same at any frame rate."""
+
+    def __init__(self, x, y, anim_seq, delay):
+        super(SSInteractAnimated, self).__init__(x, y, anim_seq, delay)
+        self._start_time = None
+        self._image_time = None
+
+    def set_thing(self, thing):
+        super(SSInteractAnimated, self).set_thing(thing)
+        self._start_time = None
+        self._image_time = (
+            (self._delay + 1) / float(thing.gd.constants.frame_rate))
+
+    def restart(self):
+        """Start again from the first image when next advanced"""
+        self._start_time = None
+        self._anim_pos = 0
+        self.image = self._anim_seq[0]
+
+    def advance(self, time):
+        """Show the image for the given time, skipping any we were too slow
+           to show.
+
+           Return true if the image changed."""
+        if self._start_time is None:
+            self._start_time = time - self._anim_pos * self._image_time
+        anim_pos = int((time - self._start_time) / self._image_time)
+        anim_pos %= len(self._anim_seq)
+        if anim_pos == self._anim_pos:
+            return False
+        self._anim_pos = anim_pos
+        self.image = self._anim_seq[anim_pos]
+        return True
+
+
+class SSTakeableThing(SSThing, TakeableThing):
+    "Thing that can be taken."
+
+
+class SSGenericDescThing(SSThing, GenericDescThing):
+    "Thing with an InteractiveUnionRect and a description"
@@ -0,0 +1,47 @@
+"""Sound management for Suspended Sentence."""
+
+from __future__ import print_function
+
+import pygame
+
+from pyntnclick.sound import Sound, DummySound, music, pygame_Sound
+from pyntnclick.resources import ResourceNotFound
+
+
+class SSSound(Sound):
+    """Sound that can load sounds and music out of the data archive."""
+
+    def __init__(self, resource_finder):
+        super(SSSound, self).__init__(resource_finder)
+        # The music stream reads from this while it plays
+        self._music_file = None
+
+    def get_sound(self, *names):
+        if not self.sound_enabled:
+            return DummySound()
+        try:
+            path = self._resource_finder.get_resource_path("sounds", *names)
+        except ResourceNotFound:
+            return super(SSSound, self).get_sound(*names)
+        if (path not in self.sound_cache
+                and self._resource_finder.in_archive(path)):
+            try:
+                sound = pygame_Sound(
+                    file=self._resource_finder.open_resource(path))
+            except pygame.error:
+                print("Sound file not found: %s" % names)
+                sound = DummySound()
+            self.sound_cache[path] = sound
+        return super(SSSound, self).get_sound(*names)
+
+    def start_next_music(self):
+        if self._current_playlist:
+            tune = self._current_playlist.get_next()
+            if tune:
+                if self._resource_finder.in_archive(tune):
+                    self._music_file = self._resource_finder.open_resource(
+                        tune)
+                    music.load(self._music_file, tune)
+                else:
+                    music.load(tune)
+                music.play()
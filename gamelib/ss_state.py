@@ -1,10 +1,215 @@
-"""The Custom state object for Suspended Sentence"""
+"""The Custom state object and scene classes for Suspended Sentence"""
 
-from pyntnclick.state import GameState
+import copy
+import inspect
+from functools import partial
+from itertools import count
+
+from pygame.surface import Surface
+
+from pyntnclick.state import (
+    CloneableItem, GameState, InteractiveMixin, Item, Scene, Thing)
+from pyntnclick.scenewidgets import (
+    InteractAnimated, InteractImage, InteractUnion)
+
+from gamelib.ss_timeline import Timeline
+
+
+def image_interacts(interact):
+    """The interacts that draw a single image, in an interact"""
+    if isinstance(interact, InteractUnion):
+        interacts = []
+        for sub_interact in interact._interact_list:
+            interacts.extend(image_interacts(sub_interact))
+        return interacts
+    if isinstance(interact, InteractImage):
+        return [interact]
+    return []
+
+
+def surfaces_size(surfaces):
+    """The memory used by the pixels of some surfaces, in bytes.
+
+       Subsurfaces are left out, as their pixels belong to their parent."""
+    seen = set()
+    size = 0
+    for surface in surfaces:
+        if id(surface) in seen or surface.get_parent() is not None:
+            continue
+        seen.add(id(surface))
+        size += (surface.get_width() * surface.get_height()
+                 * surface.get_bytesize())
+    return size
+
+
+# Maps class -> {tool name: interact_with_<tool name> handler}
+_dispatch_tables = {}
+
+
+def get_dispatch_table(cls):
+    """The interact_with_ handlers of an interactive class by tool name.
+
+       Built the first time it's needed for each class, which is when the
+       scene modules are loaded for the classes in them."""
+    if cls not in _dispatch_tables:
+        prefix = 'interact_with_'
+        table = {}
+        for attr in dir(cls):
+            if attr.startswith(prefix):
+                handler = getattr(cls, attr)
+                if callable(handler):
+                    table[attr[len(prefix):]] = handler
+        _dispatch_tables[cls] = table
+    return _dispatch_tables[cls]
+
+
+def build_dispatch_tables(module):
+    """Build the dispatch tables of the interactive classes in a module"""
+    for obj in vars(module).values():
+        if inspect.isclass(obj) and issubclass(obj, InteractiveMixin):
+            get_dispatch_table(obj)
+
+
+def interaction_matrix():
+    """The handlers for using each item on each thing.
+
+       Returns {item NAME: {thing NAME: handler}}, with None as the
+       handler where the thing's interact_default is used, for the item
+       and thing classes whose dispatch tables have been built."""
+    items = {}
+    things = {}
+    for cls in _dispatch_tables:
+        if cls.NAME is None:
+            continue
+        if issubclass(cls, Item):
+            items[cls.NAME] = cls.TOOL_NAME or cls.NAME
+        elif issubclass(cls, Thing):
+            things[cls.NAME] = get_dispatch_table(cls)
+    return dict(
+        (item_name, dict((thing_name, table.get(tool_name))
+                         for thing_name, table in things.items()))
+        for item_name, tool_name in items.items())
+
+
+class SSInteractiveMixin(object):
+    """Looks up the handlers for interactions in the class's dispatch
+       table, rather than building the method name on each interaction."""
+
+    def interact(self, tool):
+        if not self.is_interactive(tool):
+            return None
+        if tool is None:
+            return self.interact_without()
+        handler = get_dispatch_table(type(self)).get(tool.tool_name)
+        if handler is not None:
+            return handler(self, tool)
+        inverse_handler = self.get_inverse_interact(tool)
+        if inverse_handler is not None:
+            return inverse_handler(self)
+        return self.interact_default(tool)
+
+
+class SSItem(SSInteractiveMixin, Item):
+
+    def get_inverse_interact(self, tool):
+        handler = get_dispatch_table(type(tool)).get(self.tool_name)
+        if handler is not None:
+            return partial(handler, tool)
+        return None
+
+
+class SSCloneableItem(SSItem, CloneableItem):
+    pass
+
+
+class Inventory(list):
+    """List of item names, indexed by name, so finding an item doesn't
+       search the list."""
+
+    def __init__(self, item_names=()):
+        super(Inventory, self).__init__(item_names)
+        self._reindex()
+
+    def __deepcopy__(self, memo):
+        return Inventory(copy.deepcopy(list(self), memo))
+
+    def _reindex(self):
+        # Maps item name -> position in the list
+        self._positions = dict(
+            (item_name, position) for position, item_name in enumerate(self))
+
+    def __contains__(self, item_name):
+        return item_name in self._positions
+
+    def index(self, item_name, *args):
+        if args or item_name not in self._positions:
+            return super(Inventory, self).index(item_name, *args)
+        return self._positions[item_name]
+
+    def append(self, item_name):
+        super(Inventory, self).append(item_name)
+        self._positions[item_name] = len(self) - 1
+
+    def remove(self, item_name):
+        super(Inventory, self).remove(item_name)
+        # Everything after it has moved
+        self._reindex()
+
+    def __setitem__(self, index, item_name):
+        if isinstance(index, slice):
+            super(Inventory, self).__setitem__(index, item_name)
+            self._reindex()
+            return
+        del self._positions[self[index]]
+        super(Inventory, self).__setitem__(index, item_name)
+        self._positions[item_name] = index % len(self)
+
+    def __delitem__(self, index):
+        super(Inventory, self).__delitem__(index)
+        self._reindex()
+
+    def insert(self, index, item_name):
+        super(Inventory, self).insert(index, item_name)
+        self._reindex()
+
+    def extend(self, item_names):
+        super(Inventory, self).extend(item_names)
+        self._reindex()
+
+    def __iadd__(self, item_names):
+        self.extend(item_names)
+        return self
+
+    def __imul__(self, count):
+        super(Inventory, self).__imul__(count)
+        self._reindex()
+        return self
+
+    def pop(self, *args):
+        item_name = super(Inventory, self).pop(*args)
+        self._reindex()
+        return item_name
+
+    def clear(self):
+        del self[:]
+
+    def sort(self, *args, **kw):
+        super(Inventory, self).sort(*args, **kw)
+        self._reindex()
+
+    def reverse(self):
+        super(Inventory, self).reverse()
+        self._reindex()
 
 
 class SSState(GameState):
 
+    def __init__(self, state_dict=None):
+        super(SSState, self).__init__(state_dict)
+        inventories = self['inventories']
+        for name in inventories:
+            inventories[name] = Inventory(inventories[name])
+
     def get_jim_state(self):
         """Check JIM's health"""
         return self['bridge']['ai status']
@@ -22,3 +227,334 @@ class SSState(GameState):
     def increase_sentence(self, years):
         if self['bridge']['ai status'] == 'online':
             self['cryo']['sentence'] += years
+
+
+class SSScene(Scene):
+    """Scene that tracks which parts of it need to be redrawn.
+
+       Things report the areas they change (in scene coordinates) with
+       mark_dirty, and the game screen collects them with pop_dirty_rects
+       when drawing.
+
+       The background and the things that don't animate are flattened
+       into a single cached surface, which is rebuilt when a thing changes
+       its interact or is added or removed.
+
+       Things that animate are advanced by the scene's timeline.
+
+       The things' interact rects are indexed in a grid of cells, so
+       finding the thing at a point only checks the rects in its cell.
+
+       The description of the thing under the cursor is rendered once and
+       reused until the cursor moves to another thing, or something that
+       could change the description happens (the thing changing, or an
+       interaction).
+
+       The surfaces the scene holds can be released while the player is
+       elsewhere (see gamelib.ss_surfaces). They're loaded or drawn again
+       the next time they're needed."""
+
+    HIT_CELL_SIZE = 16
+
+    def __init__(self, state):
+        super(SSScene, self).__init__(state)
+        self._dirty_rects = []
+        self._static_layer = None
+        # The background the static layer was built from
+        self._static_background = None
+        # Things drawn over the static layer every frame
+        self._dynamic_things = []
+        self.timeline = Timeline()
+        # Maps cell -> [(thing order, thing, rect)] for the rects that
+        # overlap the cell, in the order the things are checked
+        self._hit_cells = {}
+        # Maps thing name -> the cells its rects are in
+        self._thing_cells = {}
+        # Maps thing name -> position in self.things
+        self._thing_order = {}
+        self._next_order = count()
+        # ((thing, width), label) for the last description drawn
+        self._description = None
+
+    def add_thing(self, thing):
+        super(SSScene, self).add_thing(thing)
+        if self.things.get(thing.name) is thing:
+            if thing.name not in self._thing_order:
+                self._thing_order[thing.name] = next(self._next_order)
+            self.thing_changed(thing)
+
+    def remove_thing(self, thing):
+        self.thing_changed(thing)
+        self.timeline.unregister(thing)
+        self._unindex_thing(thing)
+        del self._thing_order[thing.name]
+        super(SSScene, self).remove_thing(thing)
+
+    def thing_changed(self, thing):
+        """Called when a thing's appearance or interact rects change other
+           than by animating"""
+        self.mark_dirty(*thing.get_draw_rects())
+        self.invalidate_static_layer()
+        if thing.uses_timeline():
+            self.timeline.register(thing)
+        else:
+            self.timeline.unregister(thing)
+        self._index_thing(thing)
+        self.invalidate_description()
+
+    def _unindex_thing(self, thing):
+        for cell in self._thing_cells.pop(thing.name, ()):
+            entries = [entry for entry in self._hit_cells[cell]
+                       if entry[1] is not thing]
+            if entries:
+                self._hit_cells[cell] = entries
+            else:
+                del self._hit_cells[cell]
+
+    def _index_thing(self, thing):
+        self._unindex_thing(thing)
+        if thing.name not in self._thing_order:
+            # We're still adding it
+            return
+        order = self._thing_order[thing.name]
+        size = self.HIT_CELL_SIZE
+        cells = set()
+        for rect in thing.get_interact_rects():
+            if not rect.width or not rect.height:
+                continue
+            for x in range(rect.left // size, (rect.right - 1) // size + 1):
+                for y in range(rect.top // size,
+                               (rect.bottom - 1) // size + 1):
+                    entries = self._hit_cells.setdefault((x, y), [])
+                    entries.append((order, thing, rect))
+                    entries.sort(key=lambda entry: entry[0])
+                    cells.add((x, y))
+        self._thing_cells[thing.name] = cells
+
+    def thing_at(self, pos):
+        """Find the first thing with an interact rect containing pos"""
+        size = self.HIT_CELL_SIZE
+        for order, thing, rect in self._hit_cells.get(
+                (pos[0] // size, pos[1] // size), ()):
+            if rect.collidepoint(pos) and thing.hits_image(pos):
+                return thing
+        return None
+
+    def update_current_thing(self, pos):
+        thing = self.thing_at(pos)
+        if thing is self.current_thing:
+            # Still over the same thing, so there's nothing to enter
+            return
+        if self.current_thing is not None:
+            self.current_thing.leave()
+        self.current_thing = thing
+        if thing is not None:
+            thing.enter(self.game.tool)
+
+    def interact(self, item, pos):
+        result = super(SSScene, self).interact(item, pos)
+        # The interaction may have changed what the description says
+        self.invalidate_description()
+        return result
+
+    def invalidate_description(self):
+        self._description = None
+
+    def _get_description(self, dest_rect):
+        key = (self.current_thing, dest_rect.width)
+        if self._description is None or self._description[0] != key:
+            self._description = (
+                key, super(SSScene, self)._get_description(dest_rect))
+        return self._description[1]
+
+    def get_description_rect(self, dest_rect):
+        """The area the current thing's description is drawn in, or None"""
+        description = self._get_description(dest_rect)
+        if description is None:
+            return None
+        return description.rect.copy()
+
+    def invalidate_static_layer(self):
+        self._static_layer = None
+
+    def mark_dirty(self, *rects):
+        self._dirty_rects.extend(rects)
+
+    def pop_dirty_rects(self):
+        rects, self._dirty_rects = self._dirty_rects, []
+        return rects
+
+    def _build_static_layer(self, surface):
+        layer = Surface(surface.get_size(), 0, surface)
+        self.draw_background(layer)
+        self._dynamic_things = []
+        dynamic_rects = []
+        for thing in self.things.values():
+            rects = thing.get_draw_rects()
+            # Things drawn on top of animated things need to be drawn after
+            # them every frame, to keep the order of drawing
+            if thing.is_animated() or any(
+                    rect.collidelist(dynamic_rects) != -1 for rect in rects):
+                self._dynamic_things.append(thing)
+                dynamic_rects.extend(rects)
+            else:
+                thing.draw(layer)
+        self._static_layer = layer
+        self._static_background = self._background
+
+    def draw_things(self, surface):
+        for thing in self._dynamic_things:
+            thing.draw(surface)
+
+    def draw(self, surface):
+        if (self._static_layer is None
+                or self._static_layer.get_size() != surface.get_size()
+                or self._static_background is not self._background):
+            self._build_static_layer(surface)
+        surface.blit(self._static_layer, (0, 0))
+        self.draw_things(surface)
+
+    def is_idle(self):
+        """Can the scene only change in response to input?"""
+        return all(thing.is_idle() for thing in self.things.values())
+
+    def get_surfaces(self):
+        """The surfaces the scene and its things hold that release_surfaces
+           lets go of"""
+        surfaces = [self._static_layer, self._background]
+        for thing in self.things.values():
+            surfaces.extend(thing.get_surfaces())
+        return [surface for surface in surfaces if surface is not None]
+
+    def release_surfaces(self):
+        """Let go of the scene's surfaces, so their memory can be freed"""
+        self._static_layer = None
+        self._static_background = None
+        self._description = None
+        self._background = None
+        if self.BACKGROUND:
+            # Including the copy the prefetcher loaded, if the scene's
+            # background was never drawn
+            self.resource.forget_image(self.FOLDER, self.BACKGROUND)
+        for thing in self.things.values():
+            thing.release_surfaces()
+
+    def get_destinations(self):
+        """The scenes the player can currently get to from this one"""
+        dests = set()
+        for thing in self.things.values():
+            dest = thing.get_destination()
+            if dest is not None and dest != self.name:
+                dests.add(dest)
+        return sorted(dests)
+
+    def animate(self):
+        """Advance the timeline of the scene.
+
+           Return true if any of the things need to queue a redraw"""
+        result = False
+        for thing in self.timeline.advance():
+            self.mark_dirty(*thing.get_draw_rects())
+            result = True
+        return result
+
+
+class SSThing(SSInteractiveMixin, Thing):
+    """Thing that tells its scene when its appearance changes."""
+
+    def is_animated(self):
+        """Can the thing's appearance change from frame to frame?"""
+        return isinstance(self.current_interact, InteractAnimated)
+
+    def is_idle(self):
+        """Can the thing only change in response to input?"""
+        return not self.is_animated()
+
+    def uses_timeline(self):
+        """Does the thing need to be advanced by its scene's timeline?"""
+        return self.is_animated()
+
+    def _image_interacts(self):
+        interacts = []
+        for interact in self.interacts.values():
+            interacts.extend(image_interacts(interact))
+        return interacts
+
+    def get_surfaces(self):
+        """The images of the thing's interacts that release_surfaces lets
+           go of"""
+        return [interact.image for interact in self._image_interacts()
+                if getattr(interact, 'image', None) is not None]
+
+    def release_surfaces(self):
+        """Let go of the images of the thing's interacts. They're loaded
+           again when they're next drawn."""
+        for interact in self._image_interacts():
+            if getattr(interact, 'image', None) is not None:
+                interact.image = None
+                if getattr(interact, 'mask', None) is not None:
+                    interact.mask = None
+                self.resource.forget_image(self.folder, interact._image_name)
+
+    def _reload_images(self):
+        for interact in image_interacts(self.current_interact):
+            if interact.image is None:
+                interact.set_thing(self)
+
+    def draw(self, surface):
+        self._reload_images()
+        super(SSThing, self).draw(surface)
+
+    def advance(self, time):
+        """Called by the scene's timeline with the time on it.
+
+           Return true if the thing needs to be redrawn."""
+        if self.is_animated():
+            return self.current_interact.advance(time)
+        return False
+
+    def get_destination(self):
+        """The scene interacting with the thing would take the player to,
+           if any"""
+        return None
+
+    def get_draw_rects(self):
+        """The areas of the scene covered by the current interact"""
+        rect = self.current_interact.rect
+        if rect is not None:
+            return [rect.move(self.scene.OFFSET)]
+        # Interacts without a single image rect (unions of text and
+        # rects) draw within their interact rects.
+        return self.get_interact_rects()
+
+    def contains(self, pos):
+        return (super(SSThing, self).contains(pos)
+                and self.hits_image(pos))
+
+    def hits_image(self, pos):
+        """Is pos on an opaque part of the current interact's image?
+
+           Always true if the interact doesn't have a mask of its image."""
+        # The mask goes with the image when the scene's surfaces are
+        # released
+        self._reload_images()
+        mask = getattr(self.current_interact, 'mask', None)
+        if mask is None:
+            return True
+        rect = self.current_interact.rect.move(self.scene.OFFSET)
+        if not rect.collidepoint(pos):
+            return False
+        return bool(mask.get_at((pos[0] - rect.left, pos[1] - rect.top)))
+
+    def get_interact_rects(self):
+        """The areas of the scene the thing can be interacted with in"""
+        if hasattr(self.rect, 'collidepoint'):
+            return [self.rect]
+        return list(self.rect)
+
+    def _set_interact(self, name):
+        if self.scene and self.current_interact is not None:
+            self.scene.mark_dirty(*self.get_draw_rects())
+        super(SSThing, self)._set_interact(name)
+        if self.scene:
+            self.scene.thing_changed(self)
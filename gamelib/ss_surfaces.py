@@ -0,0 +1,48 @@
+"""Freeing the surfaces of the scenes the player isn't in."""
+
+from collections import OrderedDict
+
+from gamelib.ss_state import surfaces_size
+
+
+class SurfaceBudget(object):
+    """Keeps the surfaces of the scenes the player has left within a memory
+       budget (in bytes).
+
+       Each time a scene is shown, the scenes that aren't on screen are
+       checked, and the least recently shown ones release their surfaces
+       (see SSScene.release_surfaces) until the rest fit in the budget.
+       They're loaded again (from the pixel cache, if there is one) when the
+       player goes back to them."""
+
+    def __init__(self, budget):
+        self.budget = budget
+        # Maps scene name -> scene, least recently shown first
+        self._scenes = OrderedDict()
+
+    def clear(self):
+        """Forget the scenes of the last game"""
+        self._scenes.clear()
+
+    def scene_shown(self, scene, on_screen):
+        """Called when the player goes to a scene. on_screen is the list of
+           scenes currently shown, which aren't released."""
+        self._scenes.pop(scene.name, None)
+        self._scenes[scene.name] = scene
+        sizes = OrderedDict(
+            (name, surfaces_size(old_scene.get_surfaces()))
+            for name, old_scene in self._scenes.items()
+            if old_scene not in on_screen)
+        used = sum(sizes.values())
+        for name, size in sizes.items():
+            if used <= self.budget:
+                break
+            self._scenes.pop(name).release_surfaces()
+            used -= size
+
+    def get_used(self, on_screen=()):
+        """The memory used by the surfaces of the scenes that aren't on
+           screen"""
+        return sum(surfaces_size(scene.get_surfaces())
+                   for scene in self._scenes.values()
+                   if scene not in on_screen)
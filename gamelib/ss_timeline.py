@@ -0,0 +1,51 @@
+"""Wall-clock timeline for the animations in Suspended Sentence."""
+
+import pygame.time
+
+
+class Timeline(object):
+    """Advances the animations registered with it by the time that has
+       passed since it was last advanced, rather than by a frame.
+
+       Animations have an advance method, which is called with the time on
+       the timeline (in seconds) and returns true if the animation needs to
+       be redrawn.
+
+       The timeline only runs while it's being advanced, and never steps
+       forward by more than MAX_STEP at a time, so pausing doesn't make
+       the animations jump ahead."""
+
+    MAX_STEP = 1.0
+
+    def __init__(self):
+        self.time = 0.0
+        # How far the timeline moved the last time it was advanced
+        self.step = 0.0
+        self._last_ticks = None
+        self._animations = []
+
+    def register(self, animation):
+        if animation not in self._animations:
+            self._animations.append(animation)
+
+    def unregister(self, animation):
+        if animation in self._animations:
+            self._animations.remove(animation)
+
+    def pause(self):
+        """Stop the timeline until it's next advanced"""
+        self._last_ticks = None
+
+    def advance(self):
+        """Advance the timeline to the current time.
+
+           Returns the animations that need to be redrawn."""
+        ticks = pygame.time.get_ticks()
+        self.step = 0.0
+        if self._last_ticks is not None:
+            self.step = min((ticks - self._last_ticks) / 1000.0,
+                            self.MAX_STEP)
+        self._last_ticks = ticks
+        self.time += self.step
+        return [animation for animation in self._animations[:]
+                if animation.advance(self.time)]
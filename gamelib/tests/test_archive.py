@@ -0,0 +1,90 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+import pygame
+
+from gamelib.ss_resources import (
+    Archive, BufferFile, SSResources, ARCHIVE_NAME)
+from gamelib.tools.pack_data import find_files, write_archive
+
+
+class TestArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        for name, data in [('images/a.png', b'a'),
+                           ('images/scene/b.json', b'{"b": 1}'),
+                           ('ru/images/a.png', b'ru'),
+                           ('sounds/c.ogg', b'c' * 100),
+                           ('sounds/sources.txt', b'licence'),
+                           ('locale/d.mo', b'd')]:
+            path = os.path.join(self.folder, *name.split('/'))
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            with open(path, 'wb') as f:
+                f.write(data)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_find_files(self):
+        self.assertEqual(find_files(self.folder),
+                         ['images/a.png', 'images/scene/b.json',
+                          'ru/images/a.png', 'sounds/c.ogg'])
+
+    def test_archive(self):
+        archive_path = os.path.join(self.folder, ARCHIVE_NAME)
+        names = find_files(self.folder)
+        write_archive(archive_path, self.folder, names)
+        archive = Archive(archive_path)
+        self.assertEqual(archive.names(), names)
+        for name in names:
+            path = os.path.join(self.folder, *name.split('/'))
+            with open(path, 'rb') as f:
+                self.assertEqual(archive.get_data(path).tobytes(), f.read())
+        self.assertFalse(os.path.join(self.folder, 'locale', 'd.mo')
+                         in archive)
+
+    def test_loose_files_win(self):
+        archive_path = os.path.join(self.folder, ARCHIVE_NAME)
+        write_archive(archive_path, self.folder, find_files(self.folder))
+        resources = SSResources('data')
+        resources._archive = Archive(archive_path)
+        path = os.path.join(self.folder, 'images', 'a.png')
+        self.assertFalse(resources.in_archive(path))
+        os.remove(path)
+        # Where a file is is only checked the first time
+        self.assertFalse(resources.in_archive(path))
+        resources = SSResources('data')
+        resources._archive = Archive(archive_path)
+        self.assertTrue(resources.in_archive(path))
+        self.assertTrue(resources.resource_exists(path))
+        self.assertEqual(resources.open_resource(path).read(), b'a')
+
+    def test_buffer_file(self):
+        archive_path = os.path.join(self.folder, ARCHIVE_NAME)
+        write_archive(archive_path, self.folder, find_files(self.folder))
+        archive = Archive(archive_path)
+        resource_file = BufferFile(archive.get_data(
+            os.path.join(self.folder, 'sounds', 'c.ogg')))
+        self.assertEqual(resource_file.read(3), b'ccc')
+        buf = bytearray(200)
+        self.assertEqual(resource_file.readinto(buf), 97)
+        self.assertEqual(resource_file.read(), b'')
+        resource_file.seek(-10, io.SEEK_END)
+        self.assertEqual(resource_file.tell(), 90)
+        self.assertEqual(resource_file.read(), b'c' * 10)
+        resource_file.seek(0)
+        self.assertEqual(resource_file.read(), b'c' * 100)
+
+    def test_load_from_archive(self):
+        path = os.path.join('data', 'images', 'items', 'square.png')
+        with open(path, 'rb') as f:
+            data = f.read()
+        image = pygame.image.load(BufferFile(data), path)
+        self.assertEqual(pygame.image.tostring(image, 'RGBA'),
+                         pygame.image.tostring(pygame.image.load(path),
+                                               'RGBA'))
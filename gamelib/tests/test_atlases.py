@@ -0,0 +1,48 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import pygame
+
+from gamelib.ss_resources import SSResources, ATLAS_INDEX
+from gamelib.tools.pack_atlases import make_atlas, merge_animations
+
+
+class TestAtlases(unittest.TestCase):
+
+    FRAMES = ['stars_1.png', 'stars_2.png', 'stars_3.png']
+
+    def setUp(self):
+        self.resources = SSResources('data')
+        self.resources.CONVERT_ALPHA = False
+        self.folder = tempfile.mkdtemp()
+        for name in self.FRAMES:
+            shutil.copy(self.resources.get_resource_path(
+                'images', 'engine', name), self.folder)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_merge_animations(self):
+        self.assertEqual(merge_animations([{'a', 'b'}, {'c'}, {'b', 'd'}]),
+                         [{'a', 'b', 'd'}, {'c'}])
+
+    def test_atlas_frames_match_images(self):
+        atlas, frames = make_atlas(self.folder, self.FRAMES)
+        pygame.image.save(atlas, os.path.join(self.folder, 'atlas.png'))
+        with open(os.path.join(self.folder, ATLAS_INDEX), 'w') as index:
+            json.dump({'atlas.png': frames}, index)
+
+        for name in self.FRAMES:
+            path = os.path.join(self.folder, name)
+            frame = self.resources._get_atlas_frame(path)
+            image = pygame.image.load(path)
+            self.assertEqual(frame.get_size(), image.get_size())
+            self.assertEqual(pygame.image.tostring(frame, 'RGBA'),
+                             pygame.image.tostring(image, 'RGBA'))
+
+    def test_no_atlas(self):
+        path = os.path.join(self.folder, self.FRAMES[0])
+        self.assertEqual(self.resources._get_atlas_frame(path), None)
@@ -0,0 +1,69 @@
+import pygame
+from pygame import Surface
+
+from pyntnclick.tests.game_logic_utils import GameLogicTestCase
+
+import gamelib.main
+
+
+def pixels(surface):
+    return pygame.image.tostring(surface, 'RGB')
+
+
+class TestCompScreens(GameLogicTestCase):
+
+    GAME_DESCRIPTION_CLASS = gamelib.main.SuspendedSentence
+    CURRENT_SCENE = 'bridge'
+
+    def setUp(self):
+        super(TestCompScreens, self).setUp()
+        pygame.font.init()
+
+    def test_bridge_screens(self):
+        detail = self.state.detail_views['bridge_comp_detail']
+        detail.set_background()
+        screen = detail._background
+        # The same screen is used until what it shows changes
+        detail.set_background()
+        self.assertTrue(detail._background is screen)
+        self.state.scenes['bridge'].set_data('ai status', 'looping')
+        detail.set_background()
+        self.assertFalse(detail._background is screen)
+        for tab in ('alert', 'log', 'nav'):
+            detail.set_data('tab', tab)
+            detail.set_background()
+            self.assertEqual(pixels(detail._background),
+                             pixels(detail._compose_screen(tab)), tab)
+        # The log pages are used as they are
+        self.assertTrue(detail._screens['log'][1] is detail._logs[0])
+
+    def draw_engine_alerts(self, detail):
+        """Draw the background and alerts one by one"""
+        surface = Surface(detail.get_detail_size())
+        surface.blit(detail.get_image(detail.FOLDER, detail.BACKGROUND),
+                     (0, 0))
+        surface.blit(detail._alert_header, (15, 55))
+        xpos, ypos = detail.ALERT_OFFSET
+        for key in detail._get_alerts():
+            image = detail._alert_messages[key]
+            surface.blit(image, (xpos, ypos))
+            ypos += image.get_height() + detail.ALERT_SPACING
+        return surface
+
+    def test_engine_alerts(self):
+        detail = self.state.detail_views['engine_comp_detail']
+        engine = self.state.scenes['engine']
+        for thing, key in [(None, None),
+                           ('engine.cracked_pipe', 'fixed'),
+                           ('engine.cryo_containers', 'filled'),
+                           ('engine.superconductor', 'working')]:
+            if thing is not None:
+                engine.things[thing].set_data(key, True)
+            surface = Surface(detail.get_detail_size())
+            detail.draw_background(surface)
+            overlay = detail._alert_overlay
+            self.assertEqual(pixels(surface),
+                             pixels(self.draw_engine_alerts(detail)), thing)
+            # Drawing again reuses the overlay
+            detail.draw_background(surface)
+            self.assertTrue(detail._alert_overlay is overlay)
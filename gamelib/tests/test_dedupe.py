@@ -0,0 +1,51 @@
+import unittest
+
+import pygame
+
+from gamelib.ss_resources import SSResources
+from gamelib.tools.hash_images import find_duplicates, hash_image
+
+
+class TestDedupe(unittest.TestCase):
+
+    def setUp(self):
+        pygame.display.init()
+        self.resources = SSResources('data')
+        self.resources.CONVERT_ALPHA = False
+
+    def get_path(self, *fragments):
+        return self.resources.get_resource_path('images', *fragments)
+
+    def test_same_file(self):
+        # The bridge and the crew quarters have the same camera
+        bridge = self.resources.get_image('bridge', 'camera_small.png')
+        crew = self.resources.get_image('crew_quarters', 'camera_small.png')
+        self.assertTrue(bridge is crew)
+        self.assertTrue(
+            self.resources.get_trimmed_image('bridge', 'camera_small.png')
+            is self.resources.get_trimmed_image(
+                'crew_quarters', 'camera_small.png'))
+        self.assertFalse(
+            self.resources.get_image('bridge', 'camera_small.png')
+            is self.resources.get_image('engine', 'stars_1.png'))
+
+    def test_same_pixels(self):
+        # The can opener's cursor is a re-encoded copy of its image
+        image_path = self.get_path('items', 'can_opener.png')
+        cursor_path = self.get_path('items', 'can_opener_cursor.png')
+        self.assertEqual(hash_image(image_path), hash_image(cursor_path))
+        self.assertNotEqual(hash_image(image_path), hash_image(
+            self.get_path('items', 'cryo_pipe_cursor.png')))
+        self.resources._image_hashes = {
+            'images/items/can_opener.png': hash_image(image_path),
+            'images/items/can_opener_cursor.png': hash_image(cursor_path),
+        }
+        self.assertTrue(
+            self.resources.get_image('items', 'can_opener.png')
+            is self.resources.get_image('items', 'can_opener_cursor.png'))
+
+    def test_find_duplicates(self):
+        self.assertEqual(
+            find_duplicates({'a.png': '1', 'b.png': '2', 'c.png': '1',
+                             'd.png': '2', 'e.png': '3'}),
+            [['a.png', 'c.png'], ['b.png', 'd.png']])
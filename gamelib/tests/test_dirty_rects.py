@@ -0,0 +1,135 @@
+import unittest
+
+import pygame
+from pygame import Surface
+from pygame.locals import MOUSEMOTION
+
+from pyntnclick.resources import Resources
+from pyntnclick.widgets.base import ModalStackContainer
+
+from gamelib.main import SuspendedSentence
+from gamelib.ss_gamescreen import SSGameScreen
+
+
+class TestDirtyRects(unittest.TestCase):
+
+    def setUp(self):
+        pygame.display.init()
+        pygame.font.init()
+        pygame.display.set_mode((800, 600))
+        Resources.CONVERT_ALPHA = False
+        self.gd = SuspendedSentence()
+        self.screen = SSGameScreen(self.gd)
+        self.screen.reset_game()
+        self.screen.on_enter()
+        self.game = self.screen.game
+        self.display = Surface((800, 600))
+
+    def tearDown(self):
+        # The interacts are shared by every game, so the next test's
+        # animations start from the beginning
+        for scene in (list(self.game.scenes.values())
+                      + list(self.game.detail_views.values())):
+            for thing in scene.things.values():
+                for interact in thing.interacts.values():
+                    if hasattr(interact, 'restart'):
+                        interact.restart()
+
+    def draw_full(self):
+        """Draw the whole screen, as a new frame would"""
+        expected = Surface((800, 600))
+        self.screen._full_redraw = True
+        self.screen.draw(expected)
+        return pygame.image.tostring(expected, 'RGB')
+
+    def draw(self):
+        """Draw the changes since the last frame to the display"""
+        return self.screen.draw(self.display)
+
+    def step(self, seconds=0.1):
+        """Move the top scene's timeline on and animate it"""
+        timeline = self.screen.scene_modal.top.scene.timeline
+        timeline._last_ticks = pygame.time.get_ticks() - int(seconds * 1000)
+        self.screen.animate()
+
+    def assert_incremental(self, steps):
+        for step in range(1, steps + 1):
+            self.step()
+            rects = self.draw()
+            self.assertNotEqual(rects, None)
+            # Mistakes stay on the display until the next full redraw, so
+            # it's enough to check every few frames
+            if step % 5 == 0:
+                self.assertEqual(pygame.image.tostring(self.display, 'RGB'),
+                                 self.draw_full(), step)
+
+    def show(self, name, detail=None):
+        self.screen.change_scene(name)
+        if detail is not None:
+            self.screen.show_detail(detail)
+        # Dismiss the messages shown when entering the scene
+        self.screen._message_queue = []
+        while not self.screen.screen_modal.is_top(self.screen.inner_container):
+            self.screen.screen_modal.remove(self.screen.screen_modal.top)
+        self.screen._full_redraw = True
+        self.assertEqual(self.draw(), None)
+
+    def test_scenes(self):
+        for name in ('bridge', 'crew_quarters', 'cryo', 'engine', 'machine',
+                     'mess'):
+            self.show(name)
+            self.assert_incremental(200)
+
+    def test_detail_views(self):
+        self.game.scenes['engine'].set_data('engine online', True)
+        for name, detail in [('bridge', 'bridge_comp_detail'),
+                             ('engine', 'engine_comp_detail')]:
+            self.show(name, detail)
+            self.assert_incremental(50)
+            # The frozen scene under the detail view isn't redrawn
+            self.assertEqual(
+                self.screen.scene_modal.children[0].scene.pop_dirty_rects(),
+                [])
+
+    def test_motion(self):
+        self.show('engine')
+        scene = self.game.scenes['engine']
+        pipe = scene.things['engine.cracked_pipe']
+        pos = next((x, y) for x in range(0, 800, 4) for y in range(0, 550, 4)
+                   if scene.thing_at((x, y)) is pipe)
+        for pos in [(pos[0], 580), pos, (pos[0] + 1, pos[1]), (400, 580)]:
+            self.screen.dispatch(pygame.event.Event(MOUSEMOTION, pos=pos))
+            rects = self.draw()
+            self.assertNotEqual(rects, None, pos)
+            self.assertEqual(pygame.image.tostring(self.display, 'RGB'),
+                             self.draw_full(), pos)
+
+    def test_static_layer(self):
+        self.show('engine')
+        scene = self.game.scenes['engine']
+        superconductor = scene.things['engine.superconductor']
+        self.draw()
+        self.assertFalse(superconductor in scene._dynamic_things)
+        layer = scene._static_layer
+        superconductor.set_data('present', False)
+        superconductor.set_interact()
+        self.assertEqual(scene._static_layer, None)
+        self.draw()
+        self.assertFalse(scene._static_layer is layer)
+        self.assertEqual(pygame.image.tostring(self.display, 'RGB'),
+                         self.draw_full())
+
+    def test_backdrop(self):
+        self.show('bridge', 'bridge_comp_detail')
+        modal = self.screen.scene_modal
+        drawn = self.draw_full()
+        backdrop = modal._backdrop
+        self.assertNotEqual(backdrop, None)
+        self.assertEqual(self.draw_full(), drawn)
+        self.assertTrue(modal._backdrop is backdrop)
+        # The same as drawing and dimming every scene in the stack
+        surfaces = [Surface((800, 600)), Surface((800, 600))]
+        modal.draw(surfaces[0])
+        ModalStackContainer.draw(modal, surfaces[1])
+        self.assertEqual(pygame.image.tostring(surfaces[0], 'RGB'),
+                         pygame.image.tostring(surfaces[1], 'RGB'))
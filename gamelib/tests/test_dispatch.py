@@ -0,0 +1,38 @@
+from pyntnclick.tests.game_logic_utils import GameLogicTestCase
+
+import gamelib.main
+from gamelib.ss_state import get_dispatch_table, interaction_matrix
+
+
+class TestDispatch(GameLogicTestCase):
+
+    GAME_DESCRIPTION_CLASS = gamelib.main.SuspendedSentence
+    CURRENT_SCENE = 'bridge'
+
+    def test_matrix(self):
+        matrix = interaction_matrix()
+        safe = self.state.scenes['crew_quarters'].things['crew.safe']
+        self.assertEqual(matrix['stethoscope']['crew.safe'],
+                         type(safe).interact_with_stethoscope)
+        self.assertEqual(matrix['stethoscope']['engine.canopener'], None)
+
+    def test_handlers_have_items(self):
+        matrix = interaction_matrix()
+        tool_names = set(
+            self.state.item_factories[name].item_class.TOOL_NAME or name
+            for name in matrix)
+        for scene in (list(self.state.scenes.values())
+                      + list(self.state.detail_views.values())):
+            for thing in scene.things.values():
+                for tool_name in get_dispatch_table(type(thing)):
+                    self.assertTrue(tool_name in tool_names,
+                                    (thing.name, tool_name))
+
+    def test_interact_uses_table(self):
+        self.state.add_inventory_item('stethoscope')
+        stethoscope = self.state.get_item('stethoscope:')
+        safe = self.state.scenes['crew_quarters'].things['crew.safe']
+        safe.interact(stethoscope)
+        self.assertTrue(safe.get_data('is_cracked'))
+        self.assertEqual(safe.interact(stethoscope).message,
+                         "It's already unlocked. There's no more challenge.")
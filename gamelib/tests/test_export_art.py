@@ -0,0 +1,121 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import pygame
+
+from gamelib.tools.export_art import (
+    EXPORTS_NAME, XCF_HEADER, export_art, find_outputs, xcf_size)
+
+
+def copy_export(job):
+    """Export a source by copying it, so GIMP isn't needed"""
+    name, source, hash_, outputs = job
+    for output in outputs:
+        shutil.copyfile(source, output)
+    return name, hash_, outputs, None
+
+
+class TestExportArt(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.art_folder = os.path.join(self.folder, 'art')
+        self.data_folder = os.path.join(self.folder, 'data')
+        os.makedirs(self.art_folder)
+        for name, size in [('bridge', (800, 600)), ('can_opener', (50, 50)),
+                           ('logo', (20, 20))]:
+            self.write_source(name, size)
+        for path, size in [('images/bridge/bridge.png', (800, 600)),
+                           ('images/engine/can_opener.png', (23, 22)),
+                           ('images/items/can_opener.png', (50, 50)),
+                           ('ru/images/bridge/bridge.png', (800, 600))]:
+            path = os.path.join(self.data_folder, *path.split('/'))
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            pygame.image.save(pygame.Surface(size), path)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def write_source(self, name, size, contents=b''):
+        path = os.path.join(self.art_folder, name + '.xcf')
+        with open(path, 'wb') as source_file:
+            source_file.write(XCF_HEADER.pack(b'gimp xcf v011', *size))
+            source_file.write(contents)
+        return path
+
+    def read_output(self, name):
+        with open(os.path.join(self.data_folder, *name.split('/')),
+                  'rb') as output_file:
+            return output_file.read()
+
+    def test_find_outputs(self):
+        source = os.path.join(self.art_folder, 'can_opener.xcf')
+        self.assertEqual(xcf_size(source), (50, 50))
+        # The engine's can opener is a different image
+        self.assertEqual(find_outputs(source, self.data_folder),
+                         ['images/items/can_opener.png'])
+        # The localised images aren't exported from the sources
+        self.assertEqual(find_outputs(
+            os.path.join(self.art_folder, 'bridge.xcf'), self.data_folder),
+            ['images/bridge/bridge.png'])
+
+    def test_incremental(self):
+        exported, unmapped, failed = export_art(
+            self.art_folder, self.data_folder, 2, copy_export)
+        self.assertEqual(exported, ['bridge.xcf', 'can_opener.xcf'])
+        self.assertEqual(unmapped, ['logo.xcf'])
+        self.assertEqual(failed, {})
+        with open(os.path.join(self.art_folder, EXPORTS_NAME)) as f:
+            exports = json.load(f)
+        self.assertEqual(exports['can_opener.xcf']['outputs'],
+                         ['images/items/can_opener.png'])
+        # Nothing has changed
+        self.assertEqual(export_art(
+            self.art_folder, self.data_folder, 2, copy_export)[0], [])
+        # Only the changed source is exported
+        self.write_source('bridge', (800, 600), b'stars')
+        self.assertEqual(export_art(
+            self.art_folder, self.data_folder, 2, copy_export)[0],
+            ['bridge.xcf'])
+        self.assertTrue(
+            self.read_output('images/bridge/bridge.png').endswith(b'stars'))
+        # Missing images are exported again
+        os.remove(os.path.join(self.data_folder, 'images', 'items',
+                               'can_opener.png'))
+        self.assertEqual(export_art(
+            self.art_folder, self.data_folder, 1, copy_export)[0],
+            ['can_opener.xcf'])
+
+    def test_manifest_outputs(self):
+        # Sources can be given their images in the manifest
+        with open(os.path.join(self.art_folder, EXPORTS_NAME), 'w') as f:
+            json.dump({'logo.xcf': {'outputs': [
+                'images/engine/can_opener.png']}}, f)
+        exported, unmapped, failed = export_art(
+            self.art_folder, self.data_folder, 1, copy_export)
+        self.assertEqual(exported,
+                         ['bridge.xcf', 'can_opener.xcf', 'logo.xcf'])
+        self.assertEqual(unmapped, [])
+        # Removed sources are dropped from the manifest
+        os.remove(os.path.join(self.art_folder, 'logo.xcf'))
+        export_art(self.art_folder, self.data_folder, 1, copy_export)
+        with open(os.path.join(self.art_folder, EXPORTS_NAME)) as f:
+            self.assertEqual(sorted(json.load(f)),
+                             ['bridge.xcf', 'can_opener.xcf'])
+
+    def test_export_fails(self):
+        def fail_export(job):
+            return job[0], job[2], job[3], 'No GIMP'
+        exported, unmapped, failed = export_art(
+            self.art_folder, self.data_folder, 1, fail_export)
+        self.assertEqual(exported, [])
+        self.assertEqual(failed, {'bridge.xcf': 'No GIMP',
+                                  'can_opener.xcf': 'No GIMP'})
+        # They're tried again next time
+        self.assertEqual(export_art(
+            self.art_folder, self.data_folder, 1, copy_export)[0],
+            ['bridge.xcf', 'can_opener.xcf'])
@@ -0,0 +1,39 @@
+from pyntnclick.tests.game_logic_utils import GameLogicTestCase
+
+import gamelib.main
+
+
+class TestHitMap(GameLogicTestCase):
+
+    GAME_DESCRIPTION_CLASS = gamelib.main.SuspendedSentence
+    CURRENT_SCENE = 'engine'
+
+    def assert_hit_map(self, scene):
+        for x in range(0, 800, 5):
+            for y in range(0, 550, 5):
+                expected = None
+                for thing in scene.things.values():
+                    if thing.contains((x, y)):
+                        expected = thing
+                        break
+                self.assertTrue(scene.thing_at((x, y)) is expected, (x, y))
+
+    def test_hit_map(self):
+        self.assert_hit_map(self.state.get_current_scene())
+
+    def test_hit_map_updates(self):
+        scene = self.state.get_current_scene()
+        scene.things['engine.cracked_pipe'].set_data('fixed', True)
+        scene.things['engine.cracked_pipe'].set_interact()
+        scene.remove_thing(scene.things['engine.canopener'])
+        self.assert_hit_map(scene)
+
+    def test_transparent_parts_of_images_miss(self):
+        cryo = self.state.scenes['cryo']
+        pipe = cryo.things['cryo.pipe.right.bottom']
+        # The pipe's image has a transparent border
+        self.assertTrue(pipe.rect.collidepoint((645, 334)))
+        self.assertFalse(pipe.contains((645, 334)))
+        self.assertFalse(cryo.thing_at((645, 334)) is pipe)
+        self.assertTrue(pipe.contains((660, 380)))
+        self.assertTrue(cryo.thing_at((660, 380)) is pipe)
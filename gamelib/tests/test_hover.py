@@ -0,0 +1,62 @@
+import pygame
+from pygame.locals import MOUSEBUTTONDOWN, MOUSEMOTION
+
+from pyntnclick.tests.game_logic_utils import GameLogicTestCase
+
+import gamelib.main
+from gamelib.ss_engine import coalesce_motion
+
+
+class TestHover(GameLogicTestCase):
+
+    GAME_DESCRIPTION_CLASS = gamelib.main.SuspendedSentence
+    CURRENT_SCENE = 'engine'
+
+    def setUp(self):
+        super(TestHover, self).setUp()
+        pygame.display.init()
+        pygame.display.set_mode((800, 600))
+        pygame.font.init()
+        self.scene = self.state.get_current_scene()
+        self.pipe = self.scene.things['engine.cracked_pipe']
+        self.pos = next((x, y) for x in range(0, 800, 2)
+                        for y in range(0, 550, 2)
+                        if self.scene.thing_at((x, y)) is self.pipe
+                        and self.scene.thing_at((x + 1, y)) is self.pipe)
+        self.dest_rect = pygame.Rect(0, 0, 800, 550)
+
+    def test_coalesce_motion(self):
+        events = [pygame.event.Event(MOUSEMOTION, pos=(1, 1)),
+                  pygame.event.Event(MOUSEBUTTONDOWN, pos=(2, 2), button=1),
+                  pygame.event.Event(MOUSEMOTION, pos=(3, 3)),
+                  pygame.event.Event(MOUSEMOTION, pos=(4, 4))]
+        self.assertEqual(coalesce_motion(events),
+                         [events[1], events[3]])
+        self.assertEqual(coalesce_motion(events[:2]), events[:2])
+
+    def test_enter_once(self):
+        entered = []
+        self.pipe.enter = entered.append
+        self.scene.mouse_move(self.pos)
+        self.scene.mouse_move((self.pos[0] + 1, self.pos[1]))
+        self.assertEqual(entered, [None])
+        self.assertTrue(self.scene.current_thing is self.pipe)
+
+    def test_description_reused(self):
+        self.scene.mouse_move(self.pos)
+        label = self.scene._get_description(self.dest_rect)
+        self.assertEqual(label.text, self.pipe.get_description())
+        self.scene.mouse_move((self.pos[0] + 1, self.pos[1]))
+        self.assertTrue(self.scene._get_description(self.dest_rect) is label)
+
+    def test_description_updated(self):
+        self.scene.mouse_move(self.pos)
+        label = self.scene._get_description(self.dest_rect)
+        self.pipe.set_data('fixed', True)
+        self.pipe.set_interact()
+        new_label = self.scene._get_description(self.dest_rect)
+        self.assertFalse(new_label is label)
+        self.assertEqual(new_label.text, self.pipe.get_description())
+        self.assertNotEqual(new_label.text, label.text)
+        self.scene.mouse_move((0, 0))
+        self.assertEqual(self.scene._get_description(self.dest_rect), None)
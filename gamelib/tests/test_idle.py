@@ -0,0 +1,18 @@
+from pyntnclick.tests.game_logic_utils import GameLogicTestCase
+
+import gamelib.main
+
+
+class TestIdle(GameLogicTestCase):
+
+    GAME_DESCRIPTION_CLASS = gamelib.main.SuspendedSentence
+    CURRENT_SCENE = 'map'
+
+    def test_static_scenes_are_idle(self):
+        self.assertTrue(self.state.scenes['map'].is_idle())
+        self.assertTrue(self.state.detail_views['cryo_comp_detail'].is_idle())
+
+    def test_animated_scenes_are_not_idle(self):
+        self.assertFalse(self.state.scenes['engine'].is_idle())
+        # The boomslang can appear at any time
+        self.assertFalse(self.state.scenes['mess'].is_idle())
@@ -0,0 +1,65 @@
+import copy
+import json
+
+from pyntnclick.tests.game_logic_utils import GameLogicTestCase
+
+import gamelib.main
+from gamelib.ss_state import Inventory
+
+
+class TestInventory(GameLogicTestCase):
+
+    GAME_DESCRIPTION_CLASS = gamelib.main.SuspendedSentence
+    CURRENT_SCENE = 'mess'
+
+    def assert_index(self, inventory):
+        fresh = Inventory(list(inventory))
+        self.assertEqual(inventory._positions, fresh._positions)
+        for position, item_name in enumerate(inventory):
+            self.assertEqual(inventory.index(item_name), position)
+
+    def test_state_uses_index(self):
+        self.assertTrue(isinstance(self.state.inventory(), Inventory))
+
+    def test_clones(self):
+        for i in range(3):
+            self.state.add_inventory_item('full_can')
+        self.state.add_inventory_item('detergent_bottle')
+        inventory = self.state.inventory()
+        self.assertTrue(self.state.is_in_inventory('full_can:2'))
+        self.assertTrue(self.state.is_in_inventory('detergent_bottle:'))
+        self.assert_index(inventory)
+
+        self.state.replace_inventory_item('full_can:1', 'empty_can')
+        self.assertFalse(self.state.is_in_inventory('full_can:1'))
+        self.assertEqual(inventory.index('empty_can:0'), 1)
+        self.assert_index(inventory)
+
+        self.state.remove_inventory_item('full_can:0')
+        self.assertFalse(self.state.is_in_inventory('full_can:0'))
+        self.assert_index(inventory)
+
+    def test_reorder(self):
+        inventory = Inventory(['a:', 'b:', 'c:'])
+        inventory.reverse()
+        self.assert_index(inventory)
+        inventory.sort()
+        self.assert_index(inventory)
+        inventory.insert(0, 'd:')
+        inventory.pop(1)
+        inventory[1:2] = ['e:', 'f:']
+        self.assert_index(inventory)
+        inventory *= 1
+        self.assertTrue(isinstance(inventory, Inventory))
+        self.assert_index(inventory)
+        inventory *= 0
+        self.assertFalse('e:' in inventory)
+        self.assert_index(inventory)
+
+    def test_save(self):
+        self.state.add_inventory_item('full_can')
+        data = json.loads(json.dumps(self.state.data.export_data()))
+        self.assertEqual(data['inventories']['main'], ['full_can:0'])
+        inventory = type(self.state.data)(data).inventory()
+        self.assertTrue(isinstance(inventory, Inventory))
+        self.assertTrue('full_can:0' in copy.deepcopy(inventory))
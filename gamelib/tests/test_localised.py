@@ -0,0 +1,49 @@
+import os
+import unittest
+
+from pyntnclick.resources import Resources, ResourceNotFound
+
+from gamelib.ss_resources import SSResources
+
+
+class TestLocalised(unittest.TestCase):
+
+    def test_same_paths(self):
+        for language in (None, 'ru', 'ru_RU'):
+            expected = Resources('data', language)
+            resources = SSResources('data', language)
+            for fragments in [('images', 'bridge', 'comp_log_1.png'),
+                              ('images', 'bridge', 'camera_small.png'),
+                              ('images/engine/engine_room.png',),
+                              ('fonts', 'DejaVuSans.ttf')]:
+                self.assertEqual(resources.get_resource_path(*fragments),
+                                 expected.get_resource_path(*fragments))
+            self.assertRaises(ResourceNotFound, resources.get_resource_path,
+                              'images', 'missing.png')
+
+    def test_override_index(self):
+        resources = SSResources('data', 'ru_RU')
+        path = resources.get_resource_path('images', 'bridge',
+                                           'comp_log_1.png')
+        self.assertTrue(
+            ('ru', 'images/bridge', 'comp_log_1.png')
+            in resources._overrides)
+        self.assertEqual(path.split(os.sep)[-4:],
+                         ['ru', 'images', 'bridge', 'comp_log_1.png'])
+        # Without a language, the localised files aren't looked at
+        resources = SSResources('data')
+        resources.get_resource_path('images', 'bridge', 'comp_log_1.png')
+        self.assertEqual(resources._overrides, {})
+
+    def test_found_once(self):
+        resources = SSResources('data', 'ru')
+        path = resources.get_resource_path('images', 'cryo', 'cryo_room.png')
+        # Later lookups don't check the file system
+        exists = os.path.exists
+        os.path.exists = None
+        try:
+            self.assertEqual(
+                resources.get_resource_path('images/cryo/cryo_room.png'),
+                path)
+        finally:
+            os.path.exists = exists
@@ -0,0 +1,63 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from gamelib.main import SuspendedSentence
+from gamelib.ss_manifest import (
+    build_manifest, find_images, find_missing, write_manifest)
+from gamelib.tools.pack_data import order_files
+
+
+class TestManifest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.gd = SuspendedSentence()
+        cls.manifest = build_manifest(cls.gd)
+
+    def test_scenes(self):
+        cryo = self.manifest['scenes']['cryo']
+        self.assertEqual(cryo['background'], 'images/cryo/cryo_room.png')
+        self.assertTrue('images/cryo/door_ajar.png' in cryo['images'])
+        self.assertTrue('sounds/creaking.ogg' in cryo['music'])
+        self.assertTrue('sounds/laser.ogg'
+                        in self.manifest['scenes']['machine']['sounds'])
+        self.assertTrue('images/items/can_opener.png'
+                        in self.manifest['items']['images'])
+
+    def test_nothing_missing(self):
+        self.assertEqual(find_missing(self.gd, self.manifest), [])
+        background = self.gd.resource.get_resource_path(
+            'images', 'cryo', 'cryo_room.png')
+        self.assertTrue(background in find_images(self.gd, self.manifest))
+
+    def test_write(self):
+        folder = tempfile.mkdtemp()
+        try:
+            path = os.path.join(folder, 'manifest.json')
+            write_manifest(self.manifest, path)
+            with open(path) as manifest_file:
+                self.assertEqual(json.load(manifest_file), self.manifest)
+        finally:
+            shutil.rmtree(folder)
+
+    def test_order_files(self):
+        manifest = {
+            'scenes': {
+                'b': {'background': 'images/b/bg.png', 'images': [],
+                      'music': ['sounds/tune.ogg'], 'sounds': []},
+                'a': {'background': None, 'images': ['images/a/x.png'],
+                      'music': [], 'sounds': ['sounds/bang.ogg']},
+            },
+            'items': {'images': ['images/items/i.png'], 'sounds': []},
+        }
+        names = ['fonts/f.ttf', 'images/a/x.png', 'images/b/bg.png',
+                 'images/items/i.png', 'ru/images/b/bg.png',
+                 'sounds/bang.ogg', 'sounds/tune.ogg']
+        self.assertEqual(order_files(names, manifest),
+                         ['images/a/x.png', 'sounds/bang.ogg',
+                          'images/b/bg.png', 'ru/images/b/bg.png',
+                          'sounds/tune.ogg', 'images/items/i.png',
+                          'fonts/f.ttf'])
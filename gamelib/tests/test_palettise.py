@@ -0,0 +1,70 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import pygame
+from pygame.locals import SRCALPHA
+
+from gamelib.ss_resources import SSResources, decode_image
+from gamelib.tools.palettise import palettise, palettise_file
+
+
+class TestPalettise(unittest.TestCase):
+
+    def setUp(self):
+        pygame.display.init()
+        self.folder = tempfile.mkdtemp()
+        self.resources = SSResources('data')
+        self.resources.CONVERT_ALPHA = False
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def make_image(self, colours, size=(40, 30)):
+        image = pygame.Surface(size, SRCALPHA, 32)
+        for i in range(size[0] * size[1]):
+            image.set_at((i % size[0], i // size[0]),
+                         colours[(i * i + i // 7) % len(colours)])
+        path = os.path.join(self.folder, 'image.png')
+        pygame.image.save(image, path)
+        return path, pygame.image.tostring(image, 'RGBA')
+
+    def test_colour_key(self):
+        path, pixels = self.make_image(
+            [(0, 0, 0, 0), (255, 0, 0, 255), (0, 0, 255, 255)])
+        self.assertNotEqual(palettise_file(path), None)
+        image = self.resources.load_image(path)
+        self.assertEqual(image.get_bitsize(), 8)
+        self.assertNotEqual(image.get_colorkey(), None)
+        self.assertEqual(pygame.image.tostring(image, 'RGBA'), pixels)
+        # The same image comes back from the worker processes
+        path, size, indices, palette, colorkey = decode_image((path, None))
+        self.assertEqual(tuple(palette[colorkey])[:3], (0, 0, 0))
+        # Drawing on it doesn't use its palette
+        copy = self.resources.drawable_copy(image)
+        self.assertEqual(copy.get_bitsize(), 32)
+        self.assertEqual(pygame.image.tostring(copy, 'RGBA'), pixels)
+        copy.fill((1, 2, 3, 255), (0, 0, 1, 1))
+        self.assertEqual(copy.get_at((0, 0)), (1, 2, 3, 255))
+        self.assertEqual(image.get_at((0, 0)), image.get_colorkey())
+
+    def test_partial_alpha(self):
+        path, pixels = self.make_image(
+            [(0, 0, 0, 0), (255, 0, 0, 128), (0, 0, 255, 255)])
+        self.assertNotEqual(palettise_file(path), None)
+        image = self.resources.load_image(path)
+        self.assertEqual(image.get_bitsize(), 32)
+        self.assertEqual(pygame.image.tostring(image, 'RGBA'), pixels)
+
+    def test_not_palettised(self):
+        path, pixels = self.make_image(
+            [(i, i, 0, 255) for i in range(256)] + [(0, 0, 1, 255)],
+            (257, 1))
+        self.assertEqual(palettise_file(path), None)
+        # A transparent colour with the same RGB as an opaque one can't be
+        # a colour key
+        image = pygame.Surface((2, 1), SRCALPHA, 32)
+        image.fill((255, 0, 0, 0), (0, 0, 1, 1))
+        image.fill((255, 0, 0, 255), (1, 0, 1, 1))
+        self.assertEqual(palettise(image), None)
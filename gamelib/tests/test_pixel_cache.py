@@ -0,0 +1,50 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import pygame
+
+from gamelib.ss_pixel_cache import PixelCache
+from gamelib.ss_resources import SSResources
+
+
+class TestPixelCache(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.resources = SSResources('data')
+        self.resources.CONVERT_ALPHA = False
+        self.path = self.resources.get_resource_path(
+            'images', 'engine', 'stars_1.png')
+        with open(self.path, 'rb') as image_file:
+            self.data = image_file.read()
+        self.image = pygame.image.load(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_round_trip(self):
+        cache = PixelCache(self.folder, 'RGBA')
+        self.assertEqual(cache.get(self.path, self.data), None)
+        cache.put(self.path, self.data, self.image)
+        image = PixelCache(self.folder, 'RGBA').get(self.path, self.data)
+        self.assertEqual(image.get_size(), self.image.get_size())
+        self.assertEqual(pygame.image.tostring(image, 'RGBA'),
+                         pygame.image.tostring(self.image, 'RGBA'))
+
+    def test_changed_image(self):
+        cache = PixelCache(self.folder, 'RGBA')
+        cache.put(self.path, self.data, self.image)
+        self.assertEqual(cache.get(self.path, self.data + b'\0'), None)
+        self.assertEqual(PixelCache(self.folder, 'BGRA').get(
+            self.path, self.data), None)
+
+    def test_resources_use_cache(self):
+        self.resources.set_pixel_cache(PixelCache(self.folder, 'RGBA'))
+        image = self.resources.load_image(self.path)
+        self.assertEqual(len(os.listdir(self.folder)), 1)
+        cached = self.resources.load_image(self.path)
+        self.assertFalse(cached is image)
+        self.assertEqual(pygame.image.tostring(cached, 'RGBA'),
+                         pygame.image.tostring(image, 'RGBA'))
@@ -0,0 +1,81 @@
+from pyntnclick.tests.game_logic_utils import GameLogicTestCase
+
+import gamelib.main
+from gamelib.ss_prefetch import Prefetcher
+
+
+class TestPrefetch(GameLogicTestCase):
+
+    GAME_DESCRIPTION_CLASS = gamelib.main.SuspendedSentence
+    CURRENT_SCENE = 'map'
+
+    def make_prefetcher(self, budget):
+        return Prefetcher(self.game_description, budget)
+
+    def is_cached(self, scene_name):
+        scene = self.state.scenes[scene_name]
+        resource = self.game_description.resource
+        return resource.is_image_cached(resource.get_resource_path(
+            'images', scene.FOLDER, scene.BACKGROUND))
+
+    def test_destinations(self):
+        scene = self.state.get_current_scene()
+        self.assertEqual(scene.get_destinations(),
+                         ['bridge', 'crew_quarters', 'cryo', 'machine',
+                          'mess'])
+        self.state.add_inventory_item('helmet')
+        self.assertTrue('engine' in scene.get_destinations())
+        self.assertEqual(self.state.scenes['bridge'].get_destinations(),
+                         ['map'])
+
+    def test_prefetch(self):
+        prefetcher = self.make_prefetcher(32 * 1024 * 1024)
+        prefetcher.prefetch_from(self.state.get_current_scene())
+        prefetcher.wait()
+        self.assertTrue(self.is_cached('bridge'))
+        self.assertTrue(self.is_cached('cryo'))
+        self.assertFalse(self.is_cached('engine'))
+
+    def test_budget(self):
+        prefetcher = self.make_prefetcher(1)
+        prefetcher.prefetch_from(self.state.get_current_scene())
+        prefetcher.wait()
+        cached = [name for name in ('bridge', 'crew_quarters', 'cryo',
+                                    'machine', 'mess')
+                  if self.is_cached(name)]
+        self.assertEqual(len(cached), 1)
+        self.assertTrue(prefetcher.used > prefetcher.budget)
+        prefetcher.prefetch_from(self.state.scenes['bridge'])
+        prefetcher.wait()
+        self.assertFalse(self.is_cached('map'))
+
+    def test_released(self):
+        prefetcher = self.make_prefetcher(1)
+        prefetcher.prefetch_from(self.state.get_current_scene())
+        prefetcher.wait()
+        self.assertTrue(prefetcher.used > prefetcher.budget)
+        # Freeing the prefetched backgrounds gives the budget back
+        for name in ('bridge', 'crew_quarters', 'cryo', 'machine', 'mess'):
+            self.state.scenes[name].release_surfaces()
+        self.assertEqual(prefetcher.used, 0)
+        prefetcher.prefetch_from(self.state.scenes['bridge'])
+        prefetcher.wait()
+        self.assertTrue(self.is_cached('map'))
+        self.assertTrue(prefetcher.used > prefetcher.budget)
+
+    def test_thing_images(self):
+        resource = self.game_description.resource
+        camera = self.state.scenes['bridge'].things['bridge.camera']
+        interact = camera.current_interact
+        path = resource.get_resource_path(
+            'images', camera.folder, interact._image_name)
+        self.state.scenes['bridge'].release_surfaces()
+        self.assertFalse(resource.is_image_cached(path))
+        prefetcher = self.make_prefetcher(32 * 1024 * 1024)
+        prefetcher.prefetch_from(self.state.get_current_scene())
+        prefetcher.wait()
+        self.assertTrue(resource.is_image_cached(path))
+        # The thing picks up the prefetched image when it's drawn
+        image = resource.get_image(camera.folder, interact._image_name)
+        camera._reload_images()
+        self.assertTrue(interact.image is image)
@@ -0,0 +1,72 @@
+import multiprocessing
+import os
+import subprocess
+import sys
+import unittest
+
+import pygame
+
+from gamelib.main import SuspendedSentence
+from gamelib.ss_manifest import find_images
+from gamelib.ss_resources import SSResources
+
+
+class TestPreload(unittest.TestCase):
+
+    def setUp(self):
+        pygame.display.init()
+        self.resources = SSResources('data')
+        self.resources.CONVERT_ALPHA = False
+
+    def get_path(self, *fragments):
+        return self.resources.get_resource_path('images', *fragments)
+
+    def test_find_images(self):
+        gd = SuspendedSentence()
+        paths = find_images(gd)
+        for fragments in [('cryo', 'cryo_room.png'),
+                          ('manual', 'manual_p1.png'),
+                          ('engine', 'stars_1.png'),
+                          ('items', 'stethoscope.png')]:
+            self.assertTrue(self.get_path(*fragments) in paths, fragments)
+
+    def test_preload_images(self):
+        paths = [self.get_path('engine', 'stars_%d.png' % i)
+                 for i in range(1, 4)]
+        self.resources.preload_images(paths, 2)
+        for path in paths:
+            image = self.resources.load_image(path)
+            expected = pygame.image.load(path)
+            self.assertEqual(image.get_size(), expected.get_size())
+            self.assertEqual(pygame.image.tostring(image, 'RGBA'),
+                             pygame.image.tostring(expected, 'RGBA'))
+            # Preloaded images are only used once
+            self.assertFalse(self.resources.get_image_hash(path)
+                             in self.resources._preloaded)
+
+    def test_preload_spawned(self):
+        # Windows and macOS start the workers without forking
+        start_method = multiprocessing.get_start_method(allow_none=True)
+        multiprocessing.set_start_method('spawn', force=True)
+        try:
+            self.test_preload_images()
+        finally:
+            multiprocessing.set_start_method(start_method, force=True)
+
+    def test_entry_scripts(self):
+        # The spawned workers import the entry scripts without running the
+        # game
+        for script in ('run_game.py', os.path.join('scripts',
+                                                   'suspended.py')):
+            process = subprocess.Popen(
+                [sys.executable, '-c',
+                 'import runpy; runpy.run_path(%r, run_name="__mp_main__")'
+                 % (script,)],
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                env=dict(os.environ, PYTHONPATH=os.getcwd()))
+            try:
+                output = process.communicate(timeout=60)[0]
+            finally:
+                if process.poll() is None:
+                    process.kill()
+            self.assertEqual(process.returncode, 0, output)
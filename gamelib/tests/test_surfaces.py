@@ -0,0 +1,93 @@
+import pygame
+from pygame import Surface
+
+from pyntnclick.tests.game_logic_utils import GameLogicTestCase
+
+import gamelib.main
+from gamelib.ss_state import surfaces_size
+from gamelib.ss_surfaces import SurfaceBudget
+
+
+class TestSurfaces(GameLogicTestCase):
+
+    GAME_DESCRIPTION_CLASS = gamelib.main.SuspendedSentence
+    CURRENT_SCENE = 'bridge'
+
+    def setUp(self):
+        super(TestSurfaces, self).setUp()
+        pygame.font.init()
+
+    def get_scene(self, name):
+        if name in self.state.detail_views:
+            return self.state.detail_views[name]
+        return self.state.scenes[name]
+
+    def draw(self, scene):
+        scene.invalidate_static_layer()
+        surface = Surface((800, 550))
+        scene.draw(surface)
+        return pygame.image.tostring(surface, 'RGB')
+
+    def test_release(self):
+        for name in ('bridge', 'bridge_comp_detail', 'cryo_comp_detail',
+                     'engine_comp_detail', 'manual_detail'):
+            scene = self.get_scene(name)
+            if name == 'bridge_comp_detail':
+                scene.set_background()
+            drawn = self.draw(scene)
+            self.assertTrue(surfaces_size(scene.get_surfaces()) > 0, name)
+            scene.release_surfaces()
+            self.assertEqual(surfaces_size(scene.get_surfaces()), 0, name)
+            if name == 'bridge_comp_detail':
+                scene.set_background()
+            self.assertEqual(self.draw(scene), drawn, name)
+
+    def test_release_alerts(self):
+        scene = self.get_scene('engine_comp_detail')
+        drawn = self.draw(scene)
+        overlay = scene._alert_overlay[0]
+        self.assertTrue(overlay in scene.get_surfaces())
+        scene.release_surfaces()
+        self.assertEqual(scene._alert_overlay, None)
+        # The alerts are drawn again with the background
+        self.assertEqual(self.draw(scene), drawn)
+        self.assertFalse(scene._alert_overlay[0] is overlay)
+
+    def test_budget(self):
+        scenes = [self.get_scene(name)
+                  for name in ('bridge', 'cryo', 'mess', 'engine')]
+        for scene in scenes:
+            self.draw(scene)
+        sizes = [surfaces_size(scene.get_surfaces()) for scene in scenes]
+        # Room for any two of the scenes, but not three
+        budget = SurfaceBudget(sum(sorted(sizes)[-2:]))
+        for scene in scenes:
+            budget.scene_shown(scene, [scene])
+        # The bridge was shown longest ago, so it's released first
+        self.assertEqual(surfaces_size(scenes[0].get_surfaces()), 0)
+        self.assertEqual(budget.get_used([scenes[3]]), sizes[1] + sizes[2])
+        # Going back to the cryo room keeps it, so the mess goes next
+        budget.scene_shown(scenes[1], [scenes[1]])
+        self.draw(scenes[0])
+        budget.scene_shown(scenes[0], [scenes[0]])
+        self.assertEqual(surfaces_size(scenes[2].get_surfaces()), 0)
+        self.assertEqual(budget.get_used([scenes[0]]), sizes[3] + sizes[1])
+
+    def test_release_masks(self):
+        scene = self.get_scene('engine')
+        self.draw(scene)
+        thing = scene.things['engine.canopener']
+        resource = self.game_description.resource
+        path = resource.get_resource_path('images', 'engine',
+                                          'can_opener.png')
+        rect = thing.rect.move(scene.OFFSET)
+        points = [(x, y) for x in range(rect.left, rect.right)
+                  for y in range(rect.top, rect.bottom)]
+        hits = [thing.contains(point) for point in points]
+        self.assertTrue(any(hits) and not all(hits))
+        scene.release_surfaces()
+        self.assertFalse(path in resource._mask_cache)
+        self.assertFalse(('mask', resource.get_image_hash(path))
+                         in resource._mask_cache)
+        # The mask comes back before the scene is drawn again
+        self.assertEqual([thing.contains(point) for point in points], hits)
@@ -0,0 +1,53 @@
+from pyntnclick.tests.game_logic_utils import GameLogicTestCase
+
+import gamelib.main
+
+
+class TestTimeline(GameLogicTestCase):
+
+    GAME_DESCRIPTION_CLASS = gamelib.main.SuspendedSentence
+    CURRENT_SCENE = 'engine'
+
+    def test_animation_follows_time(self):
+        sign = self.state.get_current_scene().things['engine.danger_sign']
+        interact = sign.current_interact
+        # The delay of 10 frames at 25 fps shows each image for 0.44s
+        self.assertFalse(sign.advance(10.0))
+        self.assertFalse(sign.advance(10.4))
+        self.assertEqual(interact._anim_pos, 0)
+        self.assertTrue(sign.advance(10.5))
+        self.assertEqual(interact._anim_pos, 1)
+
+    def test_slow_frames_skip_images(self):
+        arrows = self.state.get_current_scene().things['engine.arrows_right']
+        interact = arrows.current_interact
+        # A delay of 17 frames shows each image for 0.72s
+        arrows.advance(0.0)
+        self.assertTrue(arrows.advance(1.5))
+        self.assertEqual(interact._anim_pos, 2)
+        self.assertTrue(arrows.advance(3.0))
+        self.assertEqual(interact._anim_pos, 0)
+
+    def test_cameras_follow_jim(self):
+        cameras = [self.state.scenes[scene].things[name]
+                   for scene, name in [('bridge', 'bridge.camera'),
+                                       ('crew_quarters', 'crew.camera')]]
+        # The cameras are only advanced while they're animated
+        for camera in cameras:
+            self.assertEqual(camera.current_interact,
+                             camera.interacts['online'])
+            self.assertFalse(camera in camera.scene.timeline._animations)
+        cameras[1].interact_with_escher_poster(None)
+        self.assertEqual(self.state.data.get_jim_state(), 'looping')
+        for camera in cameras:
+            self.assertEqual(camera.current_interact,
+                             camera.interacts['looping'])
+            self.assertTrue(camera in camera.scene.timeline._animations)
+        bridge = self.state.scenes['bridge']
+        bridge.set_data('ai panel', 'open')
+        bridge.things['jim_panel'].interact_without()
+        self.assertEqual(self.state.data.get_jim_state(), 'dead')
+        for camera in cameras:
+            self.assertEqual(camera.current_interact,
+                             camera.interacts['dead'])
+            self.assertFalse(camera in camera.scene.timeline._animations)
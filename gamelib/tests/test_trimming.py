@@ -0,0 +1,22 @@
+from pygame import Rect
+
+from pyntnclick.tests.game_logic_utils import GameLogicTestCase
+
+import gamelib.main
+
+
+class TestTrimming(GameLogicTestCase):
+
+    GAME_DESCRIPTION_CLASS = gamelib.main.SuspendedSentence
+    CURRENT_SCENE = 'crew_quarters'
+
+    def test_trimmed_image(self):
+        safe = self.state.get_current_scene().things['crew.safe']
+        safe._set_interact('full_safe')
+        interact = safe.current_interact
+
+        # open_safe_full.png is 137x95, with a transparent border 1 pixel
+        # wide
+        self.assertEqual(interact.interact_rect, Rect(445, 227, 137, 95))
+        self.assertEqual(interact.rect, Rect(446, 228, 135, 93))
+        self.assertEqual(interact.image.get_size(), (135, 93))
@@ -0,0 +1,220 @@
+"""Export the art sources to the images in the data folder.
+
+   Each GIMP file in sources/art is the master for one or more images in
+   the data folder. The export manifest (sources/art/exports.json) maps
+   each source to the images exported from it, and records the hash of the
+   source when they were last exported:
+
+     {"bridge.xcf": {"hash": "...", "outputs": ["images/bridge/bridge.png"]}}
+
+   Only the sources that have changed since they were last exported (or
+   whose images are missing) are exported again, in a pool of GIMP
+   processes. A source that isn't in the manifest yet is exported to the
+   images with the same name and size under data/images; sources without
+   any are listed, and can be given their images by adding an entry with
+   just the "outputs" to the manifest.
+
+   This is run from the top of the source tree, after changing the art:
+
+     python -m gamelib.tools.export_art [--dry-run]
+
+   With --dry-run, the sources that would be exported are listed instead.
+   """
+
+from __future__ import print_function
+
+import hashlib
+import json
+import multiprocessing
+import os
+import shutil
+import struct
+import subprocess
+import sys
+
+import pygame
+
+from pkg_resources import resource_filename
+
+from gamelib.main import SuspendedSentence
+from gamelib.tools.pack_data import find_files
+
+ART_FOLDER = os.path.join('sources', 'art')
+EXPORTS_NAME = 'exports.json'
+
+GIMP = 'gimp'
+
+# The magic and version, and the width and height of the canvas
+XCF_HEADER = struct.Struct('>14sII')
+
+# Flatten the visible layers and save them as a PNG
+EXPORT_SCRIPT = '''
+(let* ((image (car (gimp-file-load RUN-NONINTERACTIVE "%(source)s"
+                                   "%(source)s")))
+       (layer (car (gimp-image-merge-visible-layers image CLIP-TO-IMAGE))))
+  (file-png-save-defaults RUN-NONINTERACTIVE image layer "%(output)s"
+                          "%(output)s")
+  (gimp-image-delete image))
+'''
+
+
+def hash_file(path):
+    with open(path, 'rb') as source_file:
+        return hashlib.sha1(source_file.read()).hexdigest()
+
+
+def script_string(text):
+    return text.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def export_xcf(job):
+    """Export a source to its images with GIMP.
+
+       Returns the job's source name, hash and outputs, and an error
+       message (or None if the export worked)."""
+    name, source, hash_, outputs = job
+    # Don't leave a half written image if GIMP fails
+    temp_path = outputs[0] + '.tmp.png'
+    script = EXPORT_SCRIPT % {
+        'source': script_string(source),
+        'output': script_string(temp_path),
+    }
+    try:
+        process = subprocess.Popen(
+            [GIMP, '-i', '-d', '-f', '-b', script, '-b', '(gimp-quit 0)'],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    except OSError as e:
+        return name, hash_, outputs, 'Unable to run %s: %s' % (GIMP, e)
+    log = process.communicate()[0]
+    if process.returncode != 0 or not os.path.exists(temp_path):
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return name, hash_, outputs, log.decode('utf-8', 'replace')
+    for output in outputs[1:]:
+        shutil.copyfile(temp_path, output)
+    os.rename(temp_path, outputs[0])
+    return name, hash_, outputs, None
+
+
+def load_exports(exports_path):
+    if not os.path.exists(exports_path):
+        return {}
+    with open(exports_path) as exports_file:
+        return json.load(exports_file)
+
+
+def xcf_size(path):
+    """The size of a GIMP file's canvas, from its header"""
+    with open(path, 'rb') as source_file:
+        header = source_file.read(XCF_HEADER.size)
+    magic, width, height = XCF_HEADER.unpack(header)
+    if not magic.startswith(b'gimp xcf '):
+        raise ValueError('%s is not a GIMP file' % (path,))
+    return width, height
+
+
+def find_outputs(source, data_folder):
+    """The images in the data folder with the same name and size as a
+       source"""
+    png_name = os.path.splitext(os.path.basename(source))[0] + '.png'
+    size = xcf_size(source)
+    outputs = []
+    for image_name in find_files(data_folder):
+        if (image_name.startswith('images/')
+                and image_name.split('/')[-1] == png_name):
+            image = pygame.image.load(
+                os.path.join(data_folder, *image_name.split('/')))
+            if image.get_size() == size:
+                outputs.append(image_name)
+    return sorted(outputs)
+
+
+def plan_exports(art_folder, data_folder, exports):
+    """Work out which sources need to be exported.
+
+       Returns the export jobs and the names of the sources that have no
+       images to export to."""
+    jobs = []
+    unmapped = []
+    for name in sorted(os.listdir(art_folder)):
+        if not name.endswith('.xcf'):
+            continue
+        source = os.path.join(art_folder, name)
+        entry = exports.get(name, {})
+        outputs = entry.get('outputs') or find_outputs(source, data_folder)
+        if not outputs:
+            unmapped.append(name)
+            continue
+        hash_ = hash_file(source)
+        paths = [os.path.join(data_folder, *output.split('/'))
+                 for output in outputs]
+        if entry.get('hash') != hash_ or not all(
+                os.path.exists(path) for path in paths):
+            jobs.append((name, source, hash_, paths))
+    return jobs, unmapped
+
+
+def export_art(art_folder, data_folder, processes=None, export=export_xcf):
+    """Export the sources that have changed, and update the manifest.
+
+       Returns the names of the sources that were exported, the sources
+       that have no images, and a dict mapping the sources that couldn't be
+       exported to the errors."""
+    exports_path = os.path.join(art_folder, EXPORTS_NAME)
+    exports = load_exports(exports_path)
+    jobs, unmapped = plan_exports(art_folder, data_folder, exports)
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    if processes > 1 and len(jobs) > 1:
+        pool = multiprocessing.Pool(min(processes, len(jobs)))
+        try:
+            results = list(pool.imap_unordered(export, jobs))
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = [export(job) for job in jobs]
+    exported = []
+    failed = {}
+    for name, hash_, paths, error in results:
+        if error is not None:
+            failed[name] = error
+            continue
+        exported.append(name)
+        exports[name] = {
+            'hash': hash_,
+            'outputs': ['/'.join(os.path.relpath(path, data_folder).split(
+                os.sep)) for path in paths],
+        }
+    # Forget the sources that have been removed
+    for name in list(exports):
+        if not os.path.exists(os.path.join(art_folder, name)):
+            del exports[name]
+    with open(exports_path, 'w') as exports_file:
+        json.dump(exports, exports_file, indent=1, sort_keys=True)
+    return sorted(exported), unmapped, failed
+
+
+def main():
+    gd = SuspendedSentence()
+    data_folder = resource_filename(gd.RESOURCE_MODULE, '')
+    if '--dry-run' in sys.argv[1:]:
+        exports = load_exports(os.path.join(ART_FOLDER, EXPORTS_NAME))
+        jobs, unmapped = plan_exports(ART_FOLDER, data_folder, exports)
+        for job in jobs:
+            print('Would export: %s' % (job[0],))
+        for name in unmapped:
+            print('No images: %s' % (name,))
+        return
+    exported, unmapped, failed = export_art(ART_FOLDER, data_folder)
+    for name in unmapped:
+        print('No images: %s' % (name,))
+    for name, error in sorted(failed.items()):
+        print('Failed: %s\n%s' % (name, error))
+    print('Exported %d sources, %d failed' % (len(exported), len(failed)))
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
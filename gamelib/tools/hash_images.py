@@ -0,0 +1,77 @@
+"""Write the index of image hashes, and report duplicated images.
+
+   Each image in the data folder (including the localised ones and the
+   sprite atlases) is decoded and the hash of its pixels is written to the
+   image hash index (see gamelib.ss_resources). Images with the same pixels
+   share a surface when the game runs, even if their files differ.
+
+   Images with the same pixels are listed, as they could be replaced by a
+   single file.
+
+   This is a build step, run from the top of a copy of the game after
+   packing the sprite atlases and before packing the data files:
+
+     python -m gamelib.tools.hash_images
+   """
+
+from __future__ import print_function
+
+import hashlib
+import json
+import os
+
+import pygame
+
+from pkg_resources import resource_filename
+
+from gamelib.main import SuspendedSentence
+from gamelib.ss_resources import IMAGE_HASHES
+from gamelib.tools.pack_data import find_files
+
+
+def hash_image(path):
+    """The hash of the size and pixels of an image file"""
+    image = pygame.image.load(path)
+    digest = hashlib.sha1(('%dx%d:' % image.get_size()).encode('ascii'))
+    digest.update(pygame.image.tostring(image, 'RGBA'))
+    return digest.hexdigest()
+
+
+def hash_images(data_folder):
+    """Hash the images in the data folder.
+
+       Returns a dict mapping image names to their hashes."""
+    hashes = {}
+    for name in find_files(data_folder):
+        if name.endswith('.png'):
+            hashes[name] = hash_image(
+                os.path.join(data_folder, *name.split('/')))
+    return hashes
+
+
+def find_duplicates(hashes):
+    """Group the names of images with the same hash.
+
+       Returns a sorted list of the groups with more than one name."""
+    groups = {}
+    for name, image_hash in hashes.items():
+        groups.setdefault(image_hash, []).append(name)
+    return sorted(sorted(names) for names in groups.values()
+                  if len(names) > 1)
+
+
+def main():
+    gd = SuspendedSentence()
+    data_folder = resource_filename(gd.RESOURCE_MODULE, '')
+    hashes = hash_images(data_folder)
+    with open(os.path.join(data_folder, IMAGE_HASHES), 'w') as index_file:
+        json.dump(hashes, index_file, indent=1, sort_keys=True)
+    duplicates = find_duplicates(hashes)
+    for names in duplicates:
+        print('Same pixels: %s' % (', '.join(names),))
+    print('Hashed %d images, %d unique' % (
+        len(hashes), len(set(hashes.values()))))
+
+
+if __name__ == '__main__':
+    main()
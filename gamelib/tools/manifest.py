@@ -0,0 +1,49 @@
+"""Write the manifest of the assets each scene uses.
+
+   The manifest (see gamelib.ss_manifest) is written into the data folder,
+   so the game doesn't have to build it when it starts, and pack_data can
+   keep each scene's files together in the data archive.
+
+   This is a build step, run from the top of a copy of the game before
+   packing the data files:
+
+     python -m gamelib.tools.manifest [--check]
+
+   With --check, nothing is written; the assets named by the scenes that
+   can't be found are listed instead, and the exit status is non-zero if
+   there are any.
+   """
+
+from __future__ import print_function
+
+import sys
+
+from pkg_resources import resource_filename
+
+from gamelib.main import SuspendedSentence
+from gamelib.ss_manifest import (
+    MANIFEST_NAME, build_manifest, find_missing, write_manifest)
+
+
+def check_manifest(gd):
+    missing = find_missing(gd, build_manifest(gd))
+    for name in missing:
+        print('Missing: %s' % (name,))
+    return not missing
+
+
+def main():
+    gd = SuspendedSentence()
+    if '--check' in sys.argv[1:]:
+        if not check_manifest(gd):
+            sys.exit(1)
+        return
+    manifest_path = resource_filename(gd.RESOURCE_MODULE, MANIFEST_NAME)
+    manifest = build_manifest(gd)
+    write_manifest(manifest, manifest_path)
+    print('Wrote the assets of %d scenes to %s' % (
+        len(manifest['scenes']), manifest_path))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""Pack the frames of each animation in the game into a sprite atlas.
+
+   Each folder of images with animations in it gets an atlas index
+   (see gamelib.ss_resources) and one atlas image per animation. Frames
+   shared between animations are packed once.
+
+   This is a build step, run from the top of a copy of the game:
+
+     python -m gamelib.tools.pack_atlases
+   """
+
+from __future__ import print_function
+
+import json
+import math
+import os
+import re
+
+import pygame
+from pygame.locals import BLEND_RGBA_MAX, SRCALPHA
+
+from pyntnclick.resources import Resources
+from pyntnclick.scenewidgets import InteractAnimated
+
+from gamelib.main import SuspendedSentence
+from gamelib.ss_resources import ATLAS_INDEX
+
+
+def find_animations(state):
+    """Find the frame names of all the animations in the game.
+
+       Returns a dict of folder -> list of sets of frame names"""
+    animations = {}
+    scenes = list(state.scenes.values()) + list(state.detail_views.values())
+    for scene in scenes:
+        for thing in scene.things.values():
+            for interact in thing.interacts.values():
+                if isinstance(interact, InteractAnimated):
+                    animations.setdefault(thing.folder, []).append(
+                        set(interact._names))
+    return animations
+
+
+def merge_animations(animations):
+    """Merge animations that share frames, since each frame can only be in
+       one atlas."""
+    merged = []
+    for names in animations:
+        names = set(names)
+        for other in [x for x in merged if x & names]:
+            merged.remove(other)
+            names |= other
+        merged.append(names)
+    return sorted(merged, key=sorted)
+
+
+def pack(sizes):
+    """Pack images of the given sizes into rows.
+
+       Returns the position of each image and the size of the atlas."""
+    area = sum(w * h for w, h in sizes.values())
+    max_width = max([int(math.ceil(math.sqrt(area)))] +
+                    [w for w, h in sizes.values()])
+    positions = {}
+    x = y = width = row_height = 0
+    for name in sorted(sizes, key=lambda name: (-sizes[name][1], name)):
+        w, h = sizes[name]
+        if x + w > max_width:
+            x, y, row_height = 0, y + row_height, 0
+        positions[name] = (x, y)
+        x += w
+        width = max(width, x)
+        row_height = max(row_height, h)
+    return positions, (width, y + row_height)
+
+
+def atlas_name(names, used):
+    """Name the atlas after the common prefix of its frames"""
+    prefix = os.path.commonprefix(sorted(names))
+    prefix = re.sub(r'[_\d]*$', '', prefix) or 'anim'
+    name = '%s_atlas.png' % prefix
+    count = 1
+    while name in used:
+        count += 1
+        name = '%s_atlas_%d.png' % (prefix, count)
+    return name
+
+
+def make_atlas(folder, names):
+    """Pack the named images into a single surface"""
+    images = dict((name, pygame.image.load(os.path.join(folder, name)))
+                  for name in names)
+    positions, size = pack(
+        dict((name, image.get_size()) for name, image in images.items()))
+    atlas = pygame.Surface(size, SRCALPHA, 32)
+    atlas.fill((0, 0, 0, 0))
+    frames = {}
+    for name, image in images.items():
+        # Blending with the empty atlas copies the pixels unchanged,
+        # including their alpha
+        atlas.blit(image, positions[name], None, BLEND_RGBA_MAX)
+        frames[name] = list(positions[name]) + list(image.get_size())
+    return atlas, frames
+
+
+def pack_atlases(gd):
+    # Pack the frames without localised overrides
+    resources = Resources(gd.resource.resource_module)
+    gd.resource.CONVERT_ALPHA = False
+    state = gd.initial_state()
+    for folder, animations in sorted(find_animations(state).items()):
+        path = os.path.dirname(resources.get_resource_path(
+            'images', folder, min(animations[0])))
+        index = {}
+        for names in merge_animations(animations):
+            name = atlas_name(names, index)
+            atlas, index[name] = make_atlas(path, names)
+            pygame.image.save(atlas, os.path.join(path, name))
+            print('Packed %d frames into %s/%s' % (len(names), folder, name))
+        with open(os.path.join(path, ATLAS_INDEX), 'w') as index_file:
+            json.dump(index, index_file, indent=1, sort_keys=True)
+
+
+def main():
+    pygame.display.init()
+    pygame.font.init()
+    pack_atlases(SuspendedSentence())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""Pack the game's data files into a single archive.
+
+   The images, sounds and fonts in the data folder (including the
+   localised ones) are packed into the data archive (see
+   gamelib.ss_resources), so the game doesn't have to open each of them
+   when it runs. The translations and icons (which the desktop files
+   refer to) are left as they are, as are the licence files.
+
+   The files each scene uses (from the asset manifest) are packed next to
+   each other, so loading a scene reads one part of the archive.
+
+   This is a build step, run from the top of a copy of the game after
+   packing the sprite atlases and writing the manifest:
+
+     python -m gamelib.tools.pack_data [--remove]
+
+   With --remove, the packed files are removed from the data folder, so
+   they are only loaded from the archive.
+   """
+
+from __future__ import print_function
+
+import os
+import sys
+
+from pkg_resources import resource_filename
+
+from gamelib.main import SuspendedSentence
+from gamelib.ss_manifest import load_manifest
+from gamelib.ss_resources import (
+    ARCHIVE_ENTRY, ARCHIVE_HEADER, ARCHIVE_MAGIC, ARCHIVE_NAME)
+
+# Folders under the data folder (or a language folder) that are packed
+PACKED_FOLDERS = ('images', 'sounds', 'fonts')
+PACKED_EXTENSIONS = ('.png', '.json', '.ogg', '.ttf')
+
+# Start each file on a multiple of this, so the buffers are aligned
+ALIGNMENT = 16
+
+
+def find_files(data_folder):
+    """Find the files to pack, as names relative to the data folder"""
+    names = []
+    for dirpath, dirnames, filenames in os.walk(data_folder):
+        dirnames.sort()
+        parts = os.path.relpath(dirpath, data_folder).split(os.sep)
+        # Skip the language folder, if any
+        if parts[0] not in PACKED_FOLDERS:
+            parts = parts[1:]
+        if not parts or parts[0] not in PACKED_FOLDERS:
+            continue
+        for filename in sorted(filenames):
+            if not filename.endswith(PACKED_EXTENSIONS):
+                continue
+            path = os.path.join(dirpath, filename)
+            names.append('/'.join(
+                os.path.relpath(path, data_folder).split(os.sep)))
+    return names
+
+
+def order_files(names, manifest):
+    """Put the files of each scene together, followed by the items' files
+       and then everything else."""
+    order = {}
+    entries = [manifest['scenes'][scene_name]
+               for scene_name in sorted(manifest['scenes'])]
+    for entry in entries + [manifest['items']]:
+        for name in ([entry.get('background')] + entry.get('images', [])
+                     + entry.get('sounds', []) + entry.get('music', [])):
+            if name:
+                order.setdefault(name, len(order))
+    # Localised files go with the files they override
+    return sorted(names, key=lambda name: (
+        order.get(name, order.get(name.split('/', 1)[-1], len(order))),
+        name))
+
+
+def align(pos):
+    return (pos + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def write_archive(archive_path, data_folder, names):
+    """Write the named files in the data folder into an archive"""
+    encoded = [name.encode('utf-8') for name in names]
+    pos = ARCHIVE_HEADER.size + sum(
+        ARCHIVE_ENTRY.size + len(name) for name in encoded)
+    entries = []
+    for name in names:
+        pos = align(pos)
+        size = os.path.getsize(os.path.join(data_folder, *name.split('/')))
+        entries.append((pos, size))
+        pos += size
+    with open(archive_path, 'wb') as archive:
+        archive.write(ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, len(names)))
+        for name, (offset, size) in zip(encoded, entries):
+            archive.write(ARCHIVE_ENTRY.pack(offset, size, len(name)))
+            archive.write(name)
+        for name, (offset, size) in zip(names, entries):
+            archive.write(b'\0' * (offset - archive.tell()))
+            with open(os.path.join(data_folder, *name.split('/')),
+                      'rb') as data_file:
+                archive.write(data_file.read())
+
+
+def pack_data(gd, remove=False):
+    data_folder = resource_filename(gd.RESOURCE_MODULE, '')
+    archive_path = os.path.join(data_folder, ARCHIVE_NAME)
+    names = order_files(find_files(data_folder), load_manifest(gd))
+    write_archive(archive_path, data_folder, names)
+    print('Packed %d files into %s' % (len(names), archive_path))
+    if remove:
+        for name in names:
+            os.remove(os.path.join(data_folder, *name.split('/')))
+
+
+def main():
+    pack_data(SuspendedSentence(), '--remove' in sys.argv[1:])
+
+
+if __name__ == '__main__':
+    main()
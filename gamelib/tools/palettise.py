@@ -0,0 +1,122 @@
+"""Store the images that use few colours as palettised PNGs.
+
+   Images with at most 256 different colours (counting alpha) are
+   rewritten with a palette, if that's smaller and decodes to exactly the
+   same pixels. When they're loaded, images whose palette is only opaque
+   colours and a single fully transparent one are kept as 8-bit surfaces
+   with a colour key (see gamelib.ss_resources); the rest are still loaded
+   as 32-bit images.
+
+   This is a build step, run from the top of a copy of the game after
+   packing the sprite atlases and before hashing the images:
+
+     python -m gamelib.tools.palettise
+   """
+
+from __future__ import print_function
+
+import os
+import struct
+import zlib
+
+import pygame
+
+from pkg_resources import resource_filename
+
+from gamelib.main import SuspendedSentence
+from gamelib.tools.pack_data import find_files
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def palettise(image):
+    """Find a palette for an image.
+
+       Returns the palette (RGBA tuples, transparent colours first) and a
+       palette index for each pixel, or None if the image can't be
+       palettised."""
+    pixels = pygame.image.tostring(image, 'RGBA')
+    colours = {}
+    for pos in range(0, len(pixels), 4):
+        colours.setdefault(pixels[pos:pos + 4], len(colours))
+        if len(colours) > 256:
+            return None
+    # Keep the transparency chunk short
+    palette = sorted(colours, key=lambda colour: colour[3])
+    alphas = bytearray(colour[3] for colour in palette)
+    if (alphas.count(0) == 1 and alphas.count(255) == len(alphas) - 1
+            and len(set(colour[:3] for colour in palette)) != len(palette)):
+        # It would be loaded with a colour key, which is matched by RGB
+        return None
+    remap = bytearray(len(colours))
+    for index, colour in enumerate(palette):
+        remap[colours[colour]] = index
+    indices = bytearray(len(pixels) // 4)
+    for pos in range(0, len(pixels), 4):
+        indices[pos // 4] = remap[colours[pixels[pos:pos + 4]]]
+    return [tuple(bytearray(colour)) for colour in palette], bytes(indices)
+
+
+def png_chunk(chunk_type, data):
+    return (struct.pack('>I', len(data)) + chunk_type + data
+            + struct.pack('>I', zlib.crc32(chunk_type + data) & 0xffffffff))
+
+
+def write_png(png_file, size, palette, indices):
+    """Write a palettised PNG"""
+    width, height = size
+    # Each row starts with its filter type, which is always none
+    rows = b''.join(b'\0' + indices[y * width:(y + 1) * width]
+                    for y in range(height))
+    transparency = bytes(bytearray(colour[3] for colour in palette))
+    png_file.write(PNG_SIGNATURE)
+    png_file.write(png_chunk(b'IHDR', struct.pack(
+        '>IIBBBBB', width, height, 8, 3, 0, 0, 0)))
+    png_file.write(png_chunk(b'PLTE', b''.join(
+        bytes(bytearray(colour[:3])) for colour in palette)))
+    if transparency.rstrip(b'\xff'):
+        png_file.write(png_chunk(b'tRNS', transparency.rstrip(b'\xff')))
+    png_file.write(png_chunk(b'IDAT', zlib.compress(rows, 9)))
+    png_file.write(png_chunk(b'IEND', b''))
+
+
+def palettise_file(path):
+    """Replace an image file with a palettised one, if it can be.
+
+       Returns the sizes of the old and new files, or None if it wasn't
+       replaced."""
+    image = pygame.image.load(path)
+    found = palettise(image)
+    if found is None:
+        return None
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as png_file:
+        write_png(png_file, image.get_size(), *found)
+    old_size = os.path.getsize(path)
+    new_size = os.path.getsize(temp_path)
+    if new_size >= old_size or (
+            pygame.image.tostring(pygame.image.load(temp_path), 'RGBA')
+            != pygame.image.tostring(image, 'RGBA')):
+        os.remove(temp_path)
+        return None
+    os.remove(path)
+    os.rename(temp_path, path)
+    return old_size, new_size
+
+
+def main():
+    gd = SuspendedSentence()
+    data_folder = resource_filename(gd.RESOURCE_MODULE, '')
+    count = saved = 0
+    for name in find_files(data_folder):
+        if not name.endswith('.png'):
+            continue
+        sizes = palettise_file(os.path.join(data_folder, *name.split('/')))
+        if sizes is not None:
+            count += 1
+            saved += sizes[0] - sizes[1]
+    print('Palettised %d images, saving %d bytes' % (count, saved))
+
+
+if __name__ == '__main__':
+    main()
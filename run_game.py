@@ -1,4 +1,11 @@
 #! /usr/bin/env python
 
+import multiprocessing
+
 from gamelib import main
-main.main()
+
+# The images are decoded in worker processes, which import this script
+# again on platforms that don't fork
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    main.main()
@@ -13,6 +13,21 @@ mkdir -p ${BUILD_FOLDER} dist
 
 cp -r COPYING README.txt run_game.py setup.py docs pyntnclick ${GAME_MOD} data ${BUILD_FOLDER}/
 
+# Pack the animation frames into sprite atlases
+(cd ${BUILD_FOLDER} && PYTHONPATH=. python -m ${GAME_MOD}.tools.pack_atlases)
+
+# Store the images that use few colours with a palette
+(cd ${BUILD_FOLDER} && PYTHONPATH=. python -m ${GAME_MOD}.tools.palettise)
+
+# Hash the images, so images with the same pixels share a surface
+(cd ${BUILD_FOLDER} && PYTHONPATH=. python -m ${GAME_MOD}.tools.hash_images)
+
+# Write the manifest of the assets each scene uses
+(cd ${BUILD_FOLDER} && PYTHONPATH=. python -m ${GAME_MOD}.tools.manifest)
+
+# Pack the data files into a single archive
+(cd ${BUILD_FOLDER} && PYTHONPATH=. python -m ${GAME_MOD}.tools.pack_data --remove)
+
 cd build
 
 tar czf ../dist/${TARBALL_NAME} ${GAME_NAME}
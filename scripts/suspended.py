@@ -2,5 +2,12 @@
 # testconsole.py
 # Copyright Boomslang team, 2010 (see COPYING File)
 
+import multiprocessing
+
 from gamelib import main
-main.main()
+
+# The images are decoded in worker processes, which import this script
+# again on platforms that don't fork (and in the frozen builds)
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    main.main()